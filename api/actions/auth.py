@@ -1,4 +1,7 @@
+from datetime import datetime
+from datetime import timezone
 from typing import Union
+from uuid import UUID
 
 from fastapi import Depends
 from fastapi import HTTPException
@@ -9,39 +12,149 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 import settings
+from batching import BatchLoader
+from cache import TTLCache
 from db.dals import UserDAL
 from db.models import User
 from db.session import get_db
 from hashing import Hasher
+from revocation import revocation_list
+from singleflight import SingleFlight
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login/token")
 
+current_user_cache = TTLCache(
+    name="current_user",
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    index_by=lambda user: user.user_id,
+)
+
+
+# user_id -> current token_version, or MISSING_USER for deleted users.
+token_version_cache = TTLCache(
+    name="token_version",
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.TOKEN_VERSION_CACHE_TTL_SECONDS,
+)
+MISSING_USER = -1
+
+
+user_by_id_lookups = SingleFlight(
+    "get_user_by_id", enabled=settings.SINGLE_FLIGHT_ENABLED
+)
+user_by_email_lookups = SingleFlight(
+    "get_user_by_email", enabled=settings.SINGLE_FLIGHT_ENABLED
+)
+
+
+async def _load_users_by_ids(user_ids: list[UUID], session: AsyncSession) -> dict:
+    return await UserDAL(session).get_users_by_ids(user_ids)
+
+
+async def _load_users_by_emails(emails: list[str], session: AsyncSession) -> dict:
+    return await UserDAL(session).get_users_for_auth(emails)
+
+
+user_by_id_batches = BatchLoader(
+    "get_user_by_id",
+    _load_users_by_ids,
+    window=settings.USER_BATCH_WINDOW_SECONDS,
+    max_batch_size=settings.USER_BATCH_MAX_SIZE,
+)
+user_by_email_batches = BatchLoader(
+    "get_user_by_email",
+    _load_users_by_emails,
+    window=settings.USER_BATCH_WINDOW_SECONDS,
+    max_batch_size=settings.USER_BATCH_MAX_SIZE,
+)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    # Only this worker's copies; other workers notice the bumped
+    # token_version once their TOKEN_VERSION_CACHE_TTL_SECONDS entry expires.
+    current_user_cache.invalidate_indexed(user_id)
+    token_version_cache.invalidate(user_id)
+    user_by_id_lookups.forget(user_id)
+
+
+def access_token_claims(user: User) -> dict:
+    claims = {"sub": user.email}
+    if settings.STATELESS_TOKENS:
+        claims.update(
+            uid=str(user.user_id),
+            roles=list(user.roles),
+            active=user.is_active,
+            ver=user.token_version,
+        )
+    return claims
+
 
 async def _get_user_by_email_for_auth(email: str, session: AsyncSession):
-    async with session.begin():
+    # Emails are stored lowercased; normalising here also lets differently
+    # cased lookups of one user share a flight and a batch entry.
+    email = email.lower()
+
+    async def get_user_by_email():
+        if settings.USER_BATCH_LOADING_ENABLED:
+            return await user_by_email_batches.load(email, session)
         user_dal = UserDAL(session)
-        return await user_dal.get_user_by_email(email=email)
+        return await user_dal.get_user_for_auth(email=email)
+
+    return await user_by_email_lookups.do(email, get_user_by_email)
+
+
+async def _get_token_version(user_id: UUID, session: AsyncSession) -> int:
+    token_version = token_version_cache.get(user_id)
+    if token_version is None:
+        generation = token_version_cache.generation
+        token_version = await UserDAL(session).get_token_version(user_id)
+        if token_version is None:
+            token_version = MISSING_USER
+        token_version_cache.set(user_id, token_version, generation=generation)
+    return token_version
+
+
+async def _get_user_from_claims(
+    payload: dict, session: AsyncSession
+) -> Union[User, None]:
+    # The returned user is transient: it only carries what the token says,
+    # which is all handlers need from the current user.
+    try:
+        user_id = UUID(payload["uid"])
+        token_version = int(payload["ver"])
+        roles = list(payload["roles"])
+    except (KeyError, TypeError, ValueError):
+        return
+    if not payload.get("active"):
+        return
+    if await _get_token_version(user_id, session) != token_version:
+        return
+    return User(
+        user_id=user_id,
+        email=payload["sub"],
+        roles=roles,
+        is_active=True,
+        token_version=token_version,
+    )
 
 
 async def authenticate_user(
     email: str, password: str, db: AsyncSession
 ) -> Union[User, None]:
     user = await _get_user_by_email_for_auth(email=email, session=db)
+    # Login reads nothing else, so its transaction ends here and the
+    # connection goes back to the pool while the password is verified.
+    await db.commit()
     if user is None:
         return
-    if not Hasher.verify_password(password, user.hashed_password):
+    if not await Hasher.verify_password_async(password, user.hashed_password):
         return
     return user
 
 
-async def get_current_user_from_token(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
-):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-    )
+def decode_access_token(token: str, credentials_exception: HTTPException) -> dict:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -52,7 +165,45 @@ async def get_current_user_from_token(
             raise credentials_exception
     except JWTError:
         raise credentials_exception
+    return payload
+
+
+async def revoke_token(payload: dict, session: AsyncSession) -> None:
+    expires_at = datetime.fromtimestamp(payload["exp"], timezone.utc)
+    await revocation_list.revoke(payload["jti"], expires_at, session)
+
+
+async def get_current_user_from_token(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+    )
+    payload = decode_access_token(token, credentials_exception)
+    email = payload["sub"]
+    jti = payload.get("jti")
+    if jti is not None and await revocation_list.is_revoked(jti, db):
+        raise credentials_exception
+    if settings.STATELESS_TOKENS and "uid" in payload:
+        user = await _get_user_from_claims(payload, db)
+        if user is None:
+            raise credentials_exception
+        return user
+    user = current_user_cache.get(email)
+    if user is not None:
+        # Invalidations only reach this worker. Deletes, role and email
+        # changes also bump token_version, which is cached for much less
+        # time, so a user changed on another worker is reloaded within
+        # TOKEN_VERSION_CACHE_TTL_SECONDS.
+        if await _get_token_version(user.user_id, db) == user.token_version:
+            return user
+        current_user_cache.invalidate(email)
+    # The lookup may share a flight that read the row before a write whose
+    # invalidation ran meanwhile; such a user is used but not cached.
+    generation = current_user_cache.generation
     user = await _get_user_by_email_for_auth(email=email, session=db)
     if user is None:
         raise credentials_exception
+    current_user_cache.set(email, user, generation=generation)
     return user
@@ -0,0 +1,198 @@
+import asyncio
+import csv
+import io
+import itertools
+import json
+import tempfile
+import time
+from logging import getLogger
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from typing import Union
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+import settings
+from api.models import ImportedUser
+from api.models import UsersImportReport
+from db.dals import UserDAL
+from db.models import PortalRole
+from hashing import Hasher
+
+
+logger = getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+MAX_REPORTED_ERRORS = 100
+# Prepared rows are kept in memory up to this size, then on disk.
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+
+class ImportRowError(ValueError):
+    pass
+
+
+def detect_import_format(filename: str) -> str:
+    for import_format in IMPORT_FORMATS:
+        if filename.lower().endswith(f".{import_format}"):
+            return import_format
+    if filename.lower().endswith(".jsonl"):
+        return "ndjson"
+    raise ValueError(f"Cannot detect import format of {filename}")
+
+
+def _read_rows(lines: Iterable[str], import_format: str) -> Iterator:
+    # NDJSON lines are decoded in _parse_row so that one malformed line is
+    # reported as an invalid row instead of aborting the whole import.
+    if import_format == "csv":
+        yield from csv.DictReader(lines)
+    elif import_format == "ndjson":
+        for line in lines:
+            if line.strip():
+                yield line
+    else:
+        raise ValueError(f"Unknown import format {import_format}")
+
+
+def _write_staged_rows(staged: BinaryIO, rows: list[dict]) -> None:
+    # CSV in the column order of USER_IMPORT_COLUMNS, as COPY reads it.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    roles = f"{{{PortalRole.ROLE_PORTAL_USER}}}"
+    for row in rows:
+        writer.writerow(
+            (
+                uuid4(),
+                row["name"],
+                row["surname"],
+                row["email"],
+                row["is_active"],
+                row["hashed_password"],
+                roles,
+            )
+        )
+    staged.write(buffer.getvalue().encode())
+
+
+def _parse_row(row) -> dict:
+    if isinstance(row, str):
+        try:
+            row = json.loads(row)
+        except json.JSONDecodeError:
+            raise ImportRowError("malformed JSON")
+    if not isinstance(row, dict):
+        raise ImportRowError("row is not an object")
+    parsed = {}
+    for field in ("name", "surname", "email"):
+        value = row.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+        if not value:
+            raise ImportRowError(f"missing {field}")
+        parsed[field] = value
+    try:
+        parsed.update(ImportedUser.model_validate(parsed).model_dump())
+    except ValidationError as err:
+        raise ImportRowError(f"invalid {err.errors()[0]['loc'][0]}")
+    is_active = row.get("is_active", True)
+    if isinstance(is_active, str):
+        is_active = is_active.strip().lower() not in ("0", "false", "no", "")
+    parsed["is_active"] = bool(is_active)
+    hashed_password = row.get("hashed_password")
+    password = row.get("password")
+    if hashed_password:
+        if not Hasher.is_supported_hash(hashed_password):
+            raise ImportRowError("unsupported password hash")
+        parsed["hashed_password"] = hashed_password
+    elif password:
+        parsed["password"] = password
+    else:
+        raise ImportRowError("missing password or hashed_password")
+    return parsed
+
+
+def _parse_rows(
+    numbered_rows: Iterator, count: int
+) -> list[tuple[int, Union[dict, ImportRowError]]]:
+    parsed_rows = []
+    for line_number, row in itertools.islice(numbered_rows, count):
+        try:
+            parsed_rows.append((line_number, _parse_row(row)))
+        except ImportRowError as err:
+            parsed_rows.append((line_number, err))
+    return parsed_rows
+
+
+async def _import_users(
+    lines: Iterable[str],
+    import_format: str,
+    session,
+    update_existing: bool = False,
+) -> UsersImportReport:
+    started_at = time.perf_counter()
+    total_rows = 0
+    errors = []
+    staged_rows = 0
+    batch = []
+
+    async def stage_batch() -> None:
+        nonlocal staged_rows
+        to_hash = [row for row in batch if "hashed_password" not in row]
+        hashed_passwords = await Hasher.get_password_hashes_async(
+            [row.pop("password") for row in to_hash]
+        )
+        for row, hashed_password in zip(to_hash, hashed_passwords):
+            row["hashed_password"] = hashed_password
+        await asyncio.to_thread(_write_staged_rows, staged, batch)
+        staged_rows += len(batch)
+        batch.clear()
+        elapsed = time.perf_counter() - started_at
+        logger.info(
+            "Prepared %s users (%.0f rows/s)", staged_rows, staged_rows / elapsed
+        )
+
+    # Every password is hashed before the import touches the database, so
+    # no pooled connection sits idle in a transaction while bcrypt runs.
+    # The auth lookup's transaction ends here for the same reason; the
+    # prepared rows wait in a spooled file and are copied in one go.
+    await session.commit()
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as staged:
+        # Reading the upload (a spooled file) and parsing it block, so both
+        # run in a worker thread one batch at a time.
+        numbered_rows = enumerate(_read_rows(lines, import_format), start=1)
+        while parsed_rows := await asyncio.to_thread(
+            _parse_rows, numbered_rows, settings.IMPORT_USERS_BATCH_SIZE
+        ):
+            for line_number, row in parsed_rows:
+                total_rows += 1
+                if isinstance(row, ImportRowError):
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(f"row {line_number}: {row}")
+                    continue
+                batch.append(row)
+            if len(batch) >= settings.IMPORT_USERS_BATCH_SIZE:
+                await stage_batch()
+        if batch:
+            await stage_batch()
+        staged.seek(0)
+        user_dal = UserDAL(session)
+        await user_dal.create_import_staging_table()
+        await user_dal.copy_users_to_staging(staged)
+        inserted, updated = await user_dal.merge_staged_users(
+            update_existing=update_existing
+        )
+    elapsed = time.perf_counter() - started_at
+    report = UsersImportReport(
+        total_rows=total_rows,
+        invalid_rows=total_rows - staged_rows,
+        inserted=inserted,
+        updated=updated,
+        skipped=staged_rows - inserted - updated,
+        elapsed_seconds=round(elapsed, 3),
+        rows_per_second=round(total_rows / elapsed, 1) if elapsed else 0.0,
+        errors=errors,
+    )
+    logger.info("Users import finished: %s", report.model_dump(exclude={"errors"}))
+    return report
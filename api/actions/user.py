@@ -1,64 +1,282 @@
+import base64
+import binascii
+import json
+from typing import AsyncIterator
+from typing import Optional
 from typing import Union
 from uuid import UUID
+from uuid import uuid4
 
 from fastapi import HTTPException
 
+import settings
+from api.actions.auth import invalidate_cached_user
+from api.actions.auth import user_by_id_batches
+from api.actions.auth import user_by_id_lookups
+from api.models import BatchFoundUser
+from api.models import BulkCreatedUser
 from api.models import ShowUser
 from api.models import UserCreate
+from api.models import UsersPage
+from db.dals import list_users_sort_column
+from db.dals import UpdateStatus
 from db.dals import UserDAL
 from db.models import PortalRole
 from db.models import User
+from db.session import after_commit
 from hashing import Hasher
 
 
 async def _create_new_user(body: UserCreate, session) -> ShowUser:
-    async with session.begin():
-        user_dal = UserDAL(session)
-        user = await user_dal.create_user(
-            name=body.name,
-            surname=body.surname,
-            email=body.email,
-            hashed_password=Hasher.get_password_hash(body.password),
-            roles=[PortalRole.ROLE_PORTAL_USER],
-        )
-        return ShowUser(
-            user_id=user.user_id,
-            name=user.name,
-            surname=user.surname,
-            email=user.email,
-            is_active=user.is_active,
-        )
+    hashed_password = await Hasher.get_password_hash_async(body.password)
+    user_dal = UserDAL(session)
+    user = await user_dal.create_user(
+        name=body.name,
+        surname=body.surname,
+        email=body.email,
+        hashed_password=hashed_password,
+        roles=[PortalRole.ROLE_PORTAL_USER],
+    )
+    return ShowUser(
+        user_id=user.user_id,
+        name=user.name,
+        surname=user.surname,
+        email=user.email,
+        is_active=user.is_active,
+    )
+
+
+async def _create_new_users_bulk(
+    users: list[UserCreate], session
+) -> list[BulkCreatedUser]:
+    unique_users = {}
+    for user in users:
+        unique_users.setdefault(user.email, user)
+    # Nothing is written before the users are inserted, so the transaction
+    # the auth lookup started ends here and its connection goes back to the
+    # pool while the passwords are hashed.
+    await session.commit()
+    hashed_passwords = await Hasher.get_password_hashes_async(
+        [user.password for user in unique_users.values()]
+    )
+    rows = [
+        {
+            "user_id": uuid4(),
+            "name": user.name,
+            "surname": user.surname,
+            "email": user.email,
+            "is_active": True,
+            "hashed_password": hashed_password,
+            "roles": [PortalRole.ROLE_PORTAL_USER],
+        }
+        for user, hashed_password in zip(unique_users.values(), hashed_passwords)
+    ]
+    user_dal = UserDAL(session)
+    created_user_ids = await user_dal.create_users_bulk(rows)
+    user_ids_by_email = {
+        row["email"]: row["user_id"]
+        for row in rows
+        if row["user_id"] in created_user_ids
+    }
+    results = []
+    for user in users:
+        user_id = user_ids_by_email.pop(user.email, None)
+        if user_id is None:
+            results.append(BulkCreatedUser(email=user.email, status="conflict"))
+        else:
+            results.append(
+                BulkCreatedUser(email=user.email, status="created", user_id=user_id)
+            )
+    return results
 
 
 async def _delete_user(user_id: UUID, session) -> Union[UUID, None]:
-    async with session.begin():
-        user_dal = UserDAL(session)
-        deleted_user_id = await user_dal.delete_user(
-            user_id=user_id,
-        )
-        return deleted_user_id
+    user_dal = UserDAL(session)
+    deleted_user_id = await user_dal.delete_user(
+        user_id=user_id,
+    )
+    after_commit(session, lambda: invalidate_cached_user(user_id))
+    return deleted_user_id
 
 
 async def _get_user_by_id(user_id: UUID, session) -> Union[User, None]:
-    async with session.begin():
+    async def get_user_by_id():
+        if settings.USER_BATCH_LOADING_ENABLED:
+            return await user_by_id_batches.load(user_id, session)
         user_dal = UserDAL(session)
-        user = await user_dal.get_user_by_id(
+        return await user_dal.get_user_by_id(
             user_id=user_id,
         )
-        if user is not None:
-            return user
+
+    return await user_by_id_lookups.do(user_id, get_user_by_id)
+
+
+async def _get_users_by_ids(user_ids: list[UUID], session) -> list[BatchFoundUser]:
+    user_dal = UserDAL(session)
+    users = await user_dal.get_users_by_ids(user_ids=user_ids)
+    results = []
+    for user_id in user_ids:
+        user = users.get(user_id)
+        if user is None:
+            results.append(BatchFoundUser(user_id=user_id, found=False))
+        else:
+            results.append(
+                BatchFoundUser(
+                    user_id=user_id,
+                    found=True,
+                    user=ShowUser.model_validate(user),
+                )
+            )
+    return results
+
+
+PORTAL_ROLES = {
+    PortalRole.ROLE_PORTAL_USER,
+    PortalRole.ROLE_PORTAL_ADMIN,
+    PortalRole.ROLE_PORTAL_SUPERADMIN,
+}
+
+
+def encode_users_cursor(user_id: UUID, sort_value: Optional[str] = None) -> str:
+    # The last user's id, followed by the value of the column the page is
+    # ordered by first, if any.
+    raw = user_id.bytes + (sort_value or "").encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_users_cursor(cursor: str) -> tuple[UUID, Optional[str]]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return UUID(bytes=raw[:16]), raw[16:].decode() or None
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+
+async def _list_users(
+    session,
+    limit: int,
+    cursor: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    role: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    email_prefix: Optional[str] = None,
+) -> UsersPage:
+    if role is not None and role not in PORTAL_ROLES:
+        raise HTTPException(status_code=422, detail=f"Unknown role {role}")
+    sort_column = list_users_sort_column(name_prefix, email_prefix)
+    after_user_id = after_value = None
+    if cursor:
+        after_user_id, after_value = decode_users_cursor(cursor)
+        # A cursor only continues a listing with the same ordering.
+        if (after_value is None) != (sort_column is None):
+            raise HTTPException(status_code=422, detail="Invalid cursor")
+    user_dal = UserDAL(session)
+    users = await user_dal.list_users(
+        limit=limit + 1,
+        after_user_id=after_user_id,
+        after_value=after_value,
+        is_active=is_active,
+        role=role,
+        name_prefix=name_prefix,
+        email_prefix=email_prefix,
+    )
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        last = users[-1]
+        next_cursor = encode_users_cursor(
+            last.user_id, getattr(last, sort_column) if sort_column else None
+        )
+    return UsersPage(
+        users=[ShowUser.model_validate(user) for user in users],
+        next_cursor=next_cursor,
+    )
+
+
+async def _export_users(session) -> AsyncIterator[bytes]:
+    # The response body is produced after the request's dependencies have
+    # exited and get_db has committed and closed the session, so the stream
+    # runs in a transaction of its own, which ends when the session is
+    # closed here once the stream ends or the client disconnects.
+    try:
+        user_dal = UserDAL(session)
+        async for rows in user_dal.stream_users(
+            batch_size=settings.EXPORT_USERS_BATCH_SIZE
+        ):
+            yield "".join(
+                json.dumps(
+                    {
+                        "user_id": str(row.user_id),
+                        "name": row.name,
+                        "surname": row.surname,
+                        "email": row.email,
+                        "is_active": row.is_active,
+                    },
+                    ensure_ascii=False,
+                )
+                + "\n"
+                for row in rows
+            ).encode()
+    finally:
+        await session.close()
 
 
 async def _update_user(
     updated_user_params: dict, user_id: UUID, session
 ) -> Union[UUID, None]:
-    async with session.begin():
-        user_dal = UserDAL(session)
-        updated_user_id = await user_dal.update_user(
-            user_id=user_id,
-            **updated_user_params,
-        )
-        return updated_user_id
+    user_dal = UserDAL(session)
+    updated_user_id = await user_dal.update_user(
+        user_id=user_id,
+        **updated_user_params,
+    )
+    after_commit(session, lambda: invalidate_cached_user(user_id))
+    return updated_user_id
+
+
+async def _update_user_if_permitted(
+    updated_user_params: dict, user_id: UUID, current_user: User, session
+) -> UpdateStatus:
+    user_dal = UserDAL(session)
+    update_status = await user_dal.update_user_if_permitted(
+        user_id=user_id,
+        current_user=current_user,
+        **updated_user_params,
+    )
+    if update_status is UpdateStatus.UPDATED:
+        after_commit(session, lambda: invalidate_cached_user(user_id))
+    return update_status
+
+
+async def _grant_admin_privilege(
+    user_ids: list[UUID], session
+) -> dict[UUID, UpdateStatus]:
+    user_dal = UserDAL(session)
+    statuses = await user_dal.grant_admin_privilege(user_ids=user_ids)
+    _invalidate_updated_users(statuses, session)
+    return statuses
+
+
+async def _revoke_admin_privilege(
+    user_ids: list[UUID], session
+) -> dict[UUID, UpdateStatus]:
+    user_dal = UserDAL(session)
+    statuses = await user_dal.revoke_admin_privilege(user_ids=user_ids)
+    _invalidate_updated_users(statuses, session)
+    return statuses
+
+
+def _invalidate_updated_users(statuses: dict[UUID, UpdateStatus], session) -> None:
+    updated_user_ids = [
+        user_id
+        for user_id, update_status in statuses.items()
+        if update_status is UpdateStatus.UPDATED
+    ]
+
+    def invalidate() -> None:
+        for user_id in updated_user_ids:
+            invalidate_cached_user(user_id)
+
+    after_commit(session, invalidate)
 
 
 def check_user_permissions(target_user: User, current_user: User):
@@ -1,25 +1,51 @@
+import io
 from logging import getLogger
+from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Query
+from fastapi import UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import settings
 from api.actions.auth import get_current_user_from_token
+from api.actions.importer import _import_users
+from api.actions.importer import detect_import_format
 from api.actions.user import _create_new_user
+from api.actions.user import _create_new_users_bulk
 from api.actions.user import _delete_user
+from api.actions.user import _export_users
 from api.actions.user import _get_user_by_id
-from api.actions.user import _update_user
+from api.actions.user import _get_users_by_ids
+from api.actions.user import _grant_admin_privilege
+from api.actions.user import _list_users
+from api.actions.user import _revoke_admin_privilege
+from api.actions.user import _update_user_if_permitted
 from api.actions.user import check_user_permissions
+from api.models import AdminPrivilegeBatchResponse
+from api.models import AdminPrivilegeBatchUpdate
+from api.models import AdminPrivilegeResult
 from api.models import DeleteUserResponse
 from api.models import ShowUser
 from api.models import UpdatedUserResponse
 from api.models import UpdateUserRequest
 from api.models import UserCreate
+from api.models import UsersBatchGet
+from api.models import UsersBatchGetResponse
+from api.models import UsersBulkCreate
+from api.models import UsersBulkCreateResponse
+from api.models import UsersImportReport
+from api.models import UsersPage
+from api.responses import model_response
+from db.dals import UpdateStatus
 from db.models import User
 from db.session import get_db
+from hashing import HashingPoolSaturatedError
 
 
 user_router = APIRouter()
@@ -31,10 +57,67 @@ logger = getLogger(__name__)
 @user_router.post("/", response_model=ShowUser)
 async def create_user(body: UserCreate, db: AsyncSession = Depends(get_db)) -> ShowUser:
     try:
-        return await _create_new_user(body, db)
+        return model_response(await _create_new_user(body, db))
     except IntegrityError as err:
         logger.error(err)
         raise HTTPException(status_code=503, detail=f"Database error: {err}")
+    except HashingPoolSaturatedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy, try again later",
+            headers={"Retry-After": "1"},
+        )
+
+
+@user_router.post("/bulk", response_model=UsersBulkCreateResponse)
+async def create_users_bulk(
+    body: UsersBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_from_token),
+) -> UsersBulkCreateResponse:
+    if not current_user.is_admin and not current_user.is_superadmin:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    try:
+        results = await _create_new_users_bulk(body.users, db)
+    except IntegrityError as err:
+        logger.error(err)
+        raise HTTPException(status_code=503, detail=f"Database error: {err}")
+    except HashingPoolSaturatedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy, try again later",
+            headers={"Retry-After": "1"},
+        )
+    return UsersBulkCreateResponse(results=results)
+
+
+@user_router.post("/import", response_model=UsersImportReport)
+async def import_users(
+    file: UploadFile,
+    import_format: Optional[str] = Query(default=None, alias="format"),
+    update_existing: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_from_token),
+) -> UsersImportReport:
+    if not current_user.is_admin and not current_user.is_superadmin:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    try:
+        import_format = import_format or detect_import_format(file.filename or "")
+    except ValueError as err:
+        raise HTTPException(status_code=422, detail=str(err))
+    lines = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        return await _import_users(
+            lines, import_format, db, update_existing=update_existing
+        )
+    except ValueError as err:
+        raise HTTPException(status_code=422, detail=str(err))
+    except HashingPoolSaturatedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy, try again later",
+            headers={"Retry-After": "1"},
+        )
 
 
 @user_router.delete("/", response_model=DeleteUserResponse)
@@ -53,7 +136,7 @@ async def delete_user(
     deleted_user_id = await _delete_user(user_id, db)
     if deleted_user_id is None:
         raise HTTPException(status_code=404, detail=f"User with id {user_id} not found")
-    return DeleteUserResponse(deleted_user_id=deleted_user_id)
+    return model_response(DeleteUserResponse(deleted_user_id=deleted_user_id))
 
 
 @user_router.get("/", response_model=ShowUser)
@@ -65,7 +148,60 @@ async def get_user_by_id(
     user = await _get_user_by_id(user_id, db)
     if user is None:
         raise HTTPException(status_code=404, detail=f"User with id {user_id} not found")
-    return user
+    return model_response(ShowUser.model_validate(user))
+
+
+@user_router.get(
+    "/list",
+    response_model=UsersPage,
+    description=(
+        "Pages through users in user_id order. Pages filtered by email_prefix "
+        "or name_prefix are ordered by that column in byte order, then by "
+        "user_id. Pass next_cursor with the same filters to get the next page."
+    ),
+)
+async def list_users(
+    limit: int = Query(
+        default=settings.LIST_USERS_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.LIST_USERS_MAX_LIMIT,
+    ),
+    cursor: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    role: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    email_prefix: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_from_token),
+) -> UsersPage:
+    return await _list_users(
+        db,
+        limit=limit,
+        cursor=cursor,
+        is_active=is_active,
+        role=role,
+        name_prefix=name_prefix,
+        email_prefix=email_prefix,
+    )
+
+
+@user_router.get("/export", response_class=StreamingResponse)
+async def export_users(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_from_token),
+) -> StreamingResponse:
+    if not current_user.is_admin and not current_user.is_superadmin:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return StreamingResponse(_export_users(db), media_type="application/x-ndjson")
+
+
+@user_router.post("/batch", response_model=UsersBatchGetResponse)
+async def get_users_by_ids(
+    body: UsersBatchGet,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_from_token),
+) -> UsersBatchGetResponse:
+    return UsersBatchGetResponse(users=await _get_users_by_ids(body.user_ids, db))
 
 
 @user_router.patch("/", response_model=UpdatedUserResponse)
@@ -81,22 +217,21 @@ async def update_user_by_id(
             status_code=422,
             detail="At least one parameter for user update info should be provided",
         )
-    user_for_update = await _get_user_by_id(user_id, db)
-    if user_for_update is None:
-        raise HTTPException(status_code=404, detail=f"User with id {user_id} not found")
-    if user_id != current_user.user_id:
-        if check_user_permissions(
-            target_user=user_for_update, current_user=current_user
-        ):
-            raise HTTPException(status_code=403, detail="Forbidden")
     try:
-        updated_user_id = await _update_user(
-            updated_user_params=updated_user_params, user_id=user_id, session=db
+        update_status = await _update_user_if_permitted(
+            updated_user_params=updated_user_params,
+            user_id=user_id,
+            current_user=current_user,
+            session=db,
         )
     except IntegrityError as err:
         logger.error(err)
         raise HTTPException(status_code=503, detail=f"Database error: {err}")
-    return UpdatedUserResponse(updated_user_id=updated_user_id)
+    if update_status is UpdateStatus.NOT_FOUND:
+        raise HTTPException(status_code=404, detail=f"User with id {user_id} not found")
+    if update_status is UpdateStatus.FORBIDDEN:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return model_response(UpdatedUserResponse(updated_user_id=user_id))
 
 
 @user_router.patch("/admin_privilege", response_model=UpdatedUserResponse)
@@ -111,23 +246,15 @@ async def grant_admin_privilege(
         raise HTTPException(
             status_code=400, detail="Cannot manage privileges of itself"
         )
-    user_for_promotion = await _get_user_by_id(user_id, db)
-    if user_for_promotion.is_admin or user_for_promotion.is_superadmin:
+    statuses = await _grant_admin_privilege([user_id], db)
+    if statuses[user_id] is UpdateStatus.NOT_FOUND:
+        raise HTTPException(status_code=404, detail=f"User with id {user_id} not found")
+    if statuses[user_id] is UpdateStatus.CONFLICT:
         raise HTTPException(
             status_code=409,
             detail=f"User with id {user_id} already promoted to admin / superadmin",
         )
-    if user_for_promotion is None:
-        raise HTTPException(status_code=404, detail=f"User with id {user_id} not found")
-    updated_user_params = {"roles": user_for_promotion.enrich_roles_by_admin_role()}
-    try:
-        updated_user_id = await _update_user(
-            updated_user_params=updated_user_params, session=db, user_id=user_id
-        )
-    except IntegrityError as err:
-        logger.error(err)
-        raise HTTPException(status_code=503, detail=f"Database error: {err}")
-    return UpdatedUserResponse(updated_user_id=updated_user_id)
+    return model_response(UpdatedUserResponse(updated_user_id=user_id))
 
 
 @user_router.delete("/admin_privilege", response_model=UpdatedUserResponse)
@@ -142,19 +269,34 @@ async def revoke_admin_privilege(
         )
     if not current_user.is_superadmin:
         raise HTTPException(status_code=403, detail="Forbidden")
-    user_for_revoke = await _get_user_by_id(user_id, db)
-    if not user_for_revoke.is_admin:
+    statuses = await _revoke_admin_privilege([user_id], db)
+    if statuses[user_id] is UpdateStatus.NOT_FOUND:
+        raise HTTPException(status_code=404, detail=f"User with id {user_id} not found")
+    if statuses[user_id] is UpdateStatus.CONFLICT:
         raise HTTPException(
             status_code=409, detail=f"User with id {user_id} has no admin privileges"
         )
-    if user_for_revoke is None:
-        raise HTTPException(status_code=404, detail=f"User with id {user_id} not found")
-    updated_user_params = {"roles": user_for_revoke.remove_admin_privilege_from_model()}
-    try:
-        updated_user_id = await _update_user(
-            updated_user_params=updated_user_params, session=db, user_id=user_id
-        )
-    except IntegrityError as err:
-        logger.error(err)
-        raise HTTPException(status_code=503, detail=f"Database error: {err}")
-    return UpdatedUserResponse(updated_user_id=updated_user_id)
+    return model_response(UpdatedUserResponse(updated_user_id=user_id))
+
+
+@user_router.patch("/admin_privilege/batch", response_model=AdminPrivilegeBatchResponse)
+async def change_admin_privilege_batch(
+    body: AdminPrivilegeBatchUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_from_token),
+) -> AdminPrivilegeBatchResponse:
+    if not current_user.is_superadmin:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    user_ids = [user_id for user_id in body.user_ids if user_id != current_user.user_id]
+    statuses = {current_user.user_id: UpdateStatus.FORBIDDEN}
+    if user_ids:
+        if body.action == "grant":
+            statuses.update(await _grant_admin_privilege(user_ids, db))
+        else:
+            statuses.update(await _revoke_admin_privilege(user_ids, db))
+    return AdminPrivilegeBatchResponse(
+        results=[
+            AdminPrivilegeResult(user_id=user_id, status=statuses[user_id].value)
+            for user_id in body.user_ids
+        ]
+    )
@@ -8,9 +8,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 import settings
+from api.actions.auth import access_token_claims
 from api.actions.auth import authenticate_user
+from api.actions.auth import decode_access_token
+from api.actions.auth import oauth2_scheme
+from api.actions.auth import revoke_token
 from api.models import Token
 from db.session import get_db
+from hashing import HashingPoolSaturatedError
 from security import create_access_token
 
 
@@ -21,7 +26,14 @@ login_router = APIRouter()
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
 ):
-    user = await authenticate_user(form_data.username, form_data.password, db)
+    try:
+        user = await authenticate_user(form_data.username, form_data.password, db)
+    except HashingPoolSaturatedError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, try again later",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -29,7 +41,27 @@ async def login_for_access_token(
         )
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email, "other_custom_data": [1, 2, 3, 4]},
+        data=access_token_claims(user),
         expires_delta=access_token_expires,
     )
     return {"access_token": access_token, "token_type": "bearer"}
+
+
+@login_router.post("/logout")
+async def logout(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+):
+    payload = decode_access_token(
+        token,
+        HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+        ),
+    )
+    if "jti" not in payload:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Token has no id and cannot be revoked",
+        )
+    await revoke_token(payload, db)
+    return {"Success": True}
@@ -0,0 +1,31 @@
+from starlette.datastructures import MutableHeaders
+
+from db.routing import issue_read_your_writes_token
+from db.routing import READ_YOUR_WRITES_HEADER
+
+
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class ReadYourWritesMiddleware:
+    """Hands out a read-your-writes token after every successful write.
+
+    Clients send the token back in the same header, and their reads are then
+    only routed to replicas that have replayed past the write.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_token(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers[READ_YOUR_WRITES_HEADER] = issue_read_your_writes_token()
+            await send(message)
+
+        await self.app(scope, receive, send_with_token)
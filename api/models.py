@@ -1,14 +1,18 @@
 import re
 import uuid
+from typing import Literal
 from typing import Optional
 
 from fastapi import HTTPException
 from pydantic import BaseModel
 from pydantic import ConfigDict
+from pydantic import conlist
 from pydantic import constr
 from pydantic import EmailStr
 from pydantic import field_validator
 
+import settings
+
 
 LETTER_MATCH_PATTERN = re.compile(r"^[а-яА-Яa-zA-Z\-]+$")
 
@@ -47,6 +51,89 @@ class UserCreate(BaseModel):
             )
         return value
 
+    @field_validator("email")
+    def normalize_email(cls, value):
+        # Emails are unique regardless of case and stored lowercased.
+        return value.lower()
+
+
+class UsersBulkCreate(BaseModel):
+    users: conlist(UserCreate, min_length=1, max_length=settings.BULK_CREATE_MAX_USERS)
+
+
+class BulkCreatedUser(BaseModel):
+    email: EmailStr
+    status: Literal["created", "conflict"]
+    user_id: Optional[uuid.UUID] = None
+
+
+class UsersBulkCreateResponse(BaseModel):
+    results: list[BulkCreatedUser]
+
+
+class UsersBatchGet(BaseModel):
+    user_ids: conlist(uuid.UUID, min_length=1, max_length=settings.BATCH_GET_MAX_USERS)
+
+
+class BatchFoundUser(BaseModel):
+    user_id: uuid.UUID
+    found: bool
+    user: Optional[ShowUser] = None
+
+
+class UsersBatchGetResponse(BaseModel):
+    users: list[BatchFoundUser]
+
+
+class UsersPage(BaseModel):
+    users: list[ShowUser]
+    next_cursor: Optional[str] = None
+
+
+class ImportedUser(BaseModel):
+    # The rules of UserCreate, raised as validation errors so that the
+    # importer can report them per row.
+    name: constr(min_length=1)
+    surname: constr(min_length=1)
+    email: EmailStr
+
+    @field_validator("name", "surname")
+    def validate_letters(cls, value):
+        if not LETTER_MATCH_PATTERN.match(value):
+            raise ValueError("should contain only letters")
+        return value
+
+    @field_validator("email")
+    def normalize_email(cls, value):
+        return value.lower()
+
+
+class UsersImportReport(BaseModel):
+    total_rows: int
+    invalid_rows: int
+    inserted: int
+    updated: int
+    skipped: int
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: list[str]
+
+
+class AdminPrivilegeBatchUpdate(BaseModel):
+    user_ids: conlist(
+        uuid.UUID, min_length=1, max_length=settings.ADMIN_PRIVILEGE_BATCH_MAX_USERS
+    )
+    action: Literal["grant", "revoke"]
+
+
+class AdminPrivilegeResult(BaseModel):
+    user_id: uuid.UUID
+    status: Literal["updated", "not_found", "conflict", "forbidden"]
+
+
+class AdminPrivilegeBatchResponse(BaseModel):
+    results: list[AdminPrivilegeResult]
+
 
 class DeleteUserResponse(BaseModel):
     deleted_user_id: uuid.UUID
@@ -73,6 +160,11 @@ class UpdateUserRequest(BaseModel):
             )
         return value
 
+    @field_validator("email")
+    def normalize_email(cls, value):
+        # Emails are unique regardless of case and stored lowercased.
+        return value.lower() if value is not None else value
+
 
 class UpdatedUserResponse(BaseModel):
     updated_user_id: uuid.UUID
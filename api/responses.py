@@ -0,0 +1,31 @@
+from typing import Union
+
+from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+import settings
+
+
+class PydanticJSONResponse(Response):
+    """Renders an already validated model with pydantic's own serializer.
+
+    FastAPI skips response_model handling for handlers that return a
+    Response, so the model is not validated and encoded a second time.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
+def default_response_class() -> type[Response]:
+    return ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
+
+
+def model_response(model: BaseModel) -> Union[BaseModel, Response]:
+    if settings.FAST_JSON_RESPONSES:
+        return PydanticJSONResponse(model)
+    return model
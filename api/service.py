@@ -1,4 +1,8 @@
 from fastapi import APIRouter
+from fastapi import HTTPException
+
+import settings
+from db.sql_logging import slow_queries
 
 
 service_router = APIRouter()
@@ -7,3 +11,10 @@ service_router = APIRouter()
 @service_router.get("/ping")
 async def ping():
     return {"Success": True}
+
+
+@service_router.get("/slow_queries")
+async def get_slow_queries():
+    if not settings.DEBUG_ENDPOINTS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return {"slow_queries": list(reversed(slow_queries))}
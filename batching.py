@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
+
+from prometheus_client import Histogram
+
+
+BATCH_SIZE = Histogram(
+    "batch_loader_batch_size",
+    "Keys resolved by one batched query",
+    ["operation"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+
+LoadMany = Callable[[list, Any], Awaitable[dict]]
+
+
+class _Batch:
+    def __init__(self):
+        self.futures: dict[Hashable, asyncio.Future] = {}
+
+
+class BatchLoader:
+    """Resolves the keys requested within a short window with one query.
+
+    The first caller of a batch (the leader) waits `window` seconds, or
+    one event loop tick when it is 0, while other callers add their keys,
+    then runs `load_many(keys, session)` on its own session and hands out
+    the results. A key missing from the result resolves to None. If the
+    leader is cancelled, the other callers load their keys themselves.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        load_many: LoadMany,
+        window: float,
+        max_batch_size: int,
+    ):
+        self.operation = operation
+        self.load_many = load_many
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._batch = None
+        self._batch_size = BATCH_SIZE.labels(operation=operation)
+
+    async def load(self, key: Hashable, session) -> Any:
+        batch = self._batch
+        if batch is not None and (
+            key in batch.futures or len(batch.futures) < self.max_batch_size
+        ):
+            return await self._wait(batch, key, session)
+        return await self._lead(key, session)
+
+    async def _wait(self, batch: _Batch, key: Hashable, session) -> Any:
+        future = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = asyncio.get_running_loop().create_future()
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if future.cancelled():
+                return (await self.load_many([key], session)).get(key)
+            raise
+
+    async def _lead(self, key: Hashable, session) -> Any:
+        batch = self._batch = _Batch()
+        batch.futures[key] = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.sleep(self.window)
+            if self._batch is batch:
+                self._batch = None
+            keys = list(batch.futures)
+            self._batch_size.observe(len(keys))
+            results = await self.load_many(keys, session)
+        except asyncio.CancelledError:
+            if self._batch is batch:
+                self._batch = None
+            for future in batch.futures.values():
+                future.cancel()
+            raise
+        except Exception as err:
+            for future in batch.futures.values():
+                future.set_exception(err)
+                # Mark the exception as retrieved for keys nobody waits on.
+                future.exception()
+            raise
+        for batch_key, future in batch.futures.items():
+            future.set_result(results.get(batch_key))
+        return results.get(key)
@@ -0,0 +1,116 @@
+"""Per-call CPU cost of turning the hot UserDAL statements into SQL.
+
+Each line runs the step Connection.execute performs before anything is
+sent: generate the statement's cache key and look the compiled form up
+in the engine's compiled cache (asyncpg dialect), compiling on a miss.
+"build" constructs the statement on every call, which is what UserDAL
+did before; "prebuilt" reuses the module-level statement from db.dals;
+"uncached" compiles the prebuilt statement with no cache at all, i.e.
+the cost caching saves. No database is needed.
+
+    python -m bench.dal_statements
+"""
+
+import uuid
+
+from sqlalchemy import and_
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from bench.harness import measure
+from bench.harness import print_table
+from db import dals
+from db.models import User
+
+
+USER_ID = uuid.uuid4()
+EMAIL = "mikhail@eblan.com"
+DIALECT = asyncpg_dialect()
+
+
+def build_get_user_by_email():
+    return select(User).where(User.email == EMAIL), []
+
+
+def prebuilt_get_user_by_email():
+    return dals._GET_USER_BY_EMAIL, ["email"]
+
+
+def build_get_user_by_id():
+    return select(User).where(User.user_id == USER_ID), []
+
+
+def prebuilt_get_user_by_id():
+    return dals._GET_USER_BY_ID, ["user_id"]
+
+
+def build_delete_user():
+    statement = (
+        update(User)
+        .where(and_(User.user_id == USER_ID, User.is_active == True))
+        .values(is_active=False, token_version=User.token_version + 1)
+        .returning(User.user_id)
+    )
+    return statement, []
+
+
+def prebuilt_delete_user():
+    return dals._DELETE_USER, ["target_user_id"]
+
+
+def build_update_user():
+    statement = (
+        update(User)
+        .where(and_(User.user_id == USER_ID, User.is_active == True))
+        .values({"name": "Misha", "surname": "Debil"})
+        .returning(User.user_id)
+    )
+    return statement, []
+
+
+def prebuilt_update_user():
+    statement = dals._update_user_statement(("name", "surname"))
+    return statement, ["target_user_id", "new_name", "new_surname"]
+
+
+def cached_compile(get_statement, compiled_cache: dict):
+    def run():
+        statement, column_keys = get_statement()
+        return statement._compile_w_cache(
+            DIALECT, compiled_cache=compiled_cache, column_keys=column_keys
+        )
+
+    return run
+
+
+def uncached_compile(get_statement):
+    def run():
+        statement, column_keys = get_statement()
+        return statement.compile(dialect=DIALECT, column_keys=column_keys)
+
+    return run
+
+
+def main() -> None:
+    measurements = []
+    for build, prebuilt in (
+        (build_get_user_by_email, prebuilt_get_user_by_email),
+        (build_get_user_by_id, prebuilt_get_user_by_id),
+        (build_delete_user, prebuilt_delete_user),
+        (build_update_user, prebuilt_update_user),
+    ):
+        compiled_cache = {}
+        name = prebuilt.__name__.removeprefix("prebuilt_")
+        measurements += [
+            measure(f"{name} build", cached_compile(build, compiled_cache), 2_000),
+            measure(
+                f"{name} prebuilt", cached_compile(prebuilt, compiled_cache), 2_000
+            ),
+            measure(f"{name} uncached", uncached_compile(prebuilt), 2_000),
+        ]
+    print_table(measurements)
+
+
+if __name__ == "__main__":
+    main()
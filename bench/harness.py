@@ -0,0 +1,151 @@
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+
+# Two-sided 95% critical values of Student's t by degrees of freedom.
+T_95 = {
+    1: 12.71,
+    2: 4.30,
+    3: 3.18,
+    4: 2.78,
+    5: 2.57,
+    6: 2.45,
+    7: 2.36,
+    8: 2.31,
+    9: 2.26,
+    10: 2.23,
+    15: 2.13,
+    20: 2.09,
+    30: 2.04,
+}
+
+MIN_REPEAT_SECONDS = 0.2
+
+
+@dataclass
+class Measurement:
+    name: str
+    per_call_seconds: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.per_call_seconds)
+
+    @property
+    def best(self) -> float:
+        return min(self.per_call_seconds)
+
+    @property
+    def mean(self) -> float:
+        return statistics.mean(self.per_call_seconds)
+
+    @property
+    def ci95(self) -> float:
+        # Half-width of the 95% confidence interval of the mean, treating
+        # each repetition as one sample.
+        samples = len(self.per_call_seconds)
+        if samples < 2:
+            return 0.0
+        degrees = samples - 1
+        t = T_95[max(df for df in T_95 if df <= degrees)]
+        return t * statistics.stdev(self.per_call_seconds) / samples**0.5
+
+
+def _calibrate(run: Callable[[int], float]) -> int:
+    # Like timeit.autorange: grow the loop count until one repetition takes
+    # long enough for timer resolution and scheduling noise not to matter.
+    number = 1
+    while True:
+        if run(number) >= MIN_REPEAT_SECONDS:
+            return number
+        number *= 2
+
+
+def _measure(
+    name: str,
+    run: Callable[[int], float],
+    number: Optional[int],
+    repeat: int,
+    warmup: int,
+) -> Measurement:
+    run(warmup)
+    if number is None:
+        number = _calibrate(run)
+    per_call_seconds = [run(number) / number for _ in range(repeat)]
+    return Measurement(name=name, per_call_seconds=per_call_seconds)
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    number: Optional[int] = 10_000,
+    repeat: int = 7,
+    warmup: int = 1_000,
+) -> Measurement:
+    def run(calls: int) -> float:
+        started_at = time.perf_counter()
+        for _ in range(calls):
+            func()
+        return time.perf_counter() - started_at
+
+    return _measure(name, run, number, repeat, warmup)
+
+
+def measure_async(
+    name: str,
+    func: Callable[[], Awaitable[object]],
+    number: Optional[int] = None,
+    repeat: int = 7,
+    warmup: int = 100,
+) -> Measurement:
+    # The whole timing loop runs inside one event loop, so the per-call
+    # figure does not include starting and stopping a loop.
+    loop = asyncio.new_event_loop()
+
+    async def run_calls(calls: int) -> float:
+        started_at = time.perf_counter()
+        for _ in range(calls):
+            await func()
+        return time.perf_counter() - started_at
+
+    try:
+        return _measure(
+            name,
+            lambda calls: loop.run_until_complete(run_calls(calls)),
+            number,
+            repeat,
+            warmup,
+        )
+    finally:
+        loop.close()
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(int(len(ordered) * q / 100), len(ordered) - 1)
+    return ordered[index]
+
+
+def format_duration(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.2f} us"
+    return f"{seconds * 1e9:.0f} ns"
+
+
+def print_table(measurements: list[Measurement]) -> None:
+    width = max(len(measurement.name) for measurement in measurements)
+    for measurement in measurements:
+        print(
+            f"{measurement.name:<{width}}  "
+            f"median {format_duration(measurement.median):>10}  "
+            f"best {format_duration(measurement.best):>10}  "
+            f"mean {format_duration(measurement.mean):>10} "
+            f"± {measurement.ci95 / measurement.mean:>5.1%}"
+        )
@@ -0,0 +1,204 @@
+"""CPU cost of the per-request work that does not touch the database.
+
+Covers token creation and decoding, password hashing and verification,
+the permission check, validation of the request bodies, and the overhead
+PrometheusMiddleware and the Sentry integration add to a request. Each
+line shows the median, best and mean per call with a 95% confidence
+interval of the mean over the repetitions.
+
+    python -m bench.hot_path
+    python -m bench.hot_path --group middleware
+"""
+
+import argparse
+import uuid
+
+import sentry_sdk
+from fastapi import FastAPI
+from jose import jwt
+from sentry_sdk.transport import Transport
+from starlette_exporter import PrometheusMiddleware
+
+import settings
+from api.actions.user import check_user_permissions
+from api.models import UpdateUserRequest
+from api.models import UserCreate
+from bench.harness import measure
+from bench.harness import measure_async
+from bench.harness import print_table
+from db.models import PortalRole
+from db.models import User
+from hashing import Hasher
+from security import create_access_token
+
+
+EMAIL = "mikhail@example.com"
+PASSWORD = "benchmark-password"
+
+
+def bench_tokens():
+    token = create_access_token({"sub": EMAIL, "other_custom_data": [1, 2, 3, 4]})
+    return [
+        measure(
+            "create_access_token",
+            lambda: create_access_token(
+                {"sub": EMAIL, "other_custom_data": [1, 2, 3, 4]}
+            ),
+            number=None,
+        ),
+        measure(
+            "jwt.decode",
+            lambda: jwt.decode(
+                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            ),
+            number=None,
+        ),
+    ]
+
+
+def bench_hashing():
+    hashed_password = Hasher.get_password_hash(PASSWORD)
+    return [
+        measure(
+            "Hasher.get_password_hash",
+            lambda: Hasher.get_password_hash(PASSWORD),
+            number=None,
+            warmup=1,
+        ),
+        measure(
+            "Hasher.verify_password",
+            lambda: Hasher.verify_password(PASSWORD, hashed_password),
+            number=None,
+            warmup=1,
+        ),
+    ]
+
+
+def _user(*roles):
+    return User(user_id=uuid.uuid4(), email=EMAIL, roles=list(roles))
+
+
+def bench_permissions():
+    admin = _user(PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN)
+    user = _user(PortalRole.ROLE_PORTAL_USER)
+    return [
+        measure(
+            "check_user_permissions self",
+            lambda: check_user_permissions(user, user),
+            number=None,
+        ),
+        measure(
+            "check_user_permissions admin",
+            lambda: check_user_permissions(user, admin),
+            number=None,
+        ),
+    ]
+
+
+def bench_validation():
+    create_body = {
+        "name": "Mikhail",
+        "surname": "Ivanov",
+        "email": EMAIL,
+        "password": PASSWORD,
+    }
+    update_body = {"name": "Misha", "email": EMAIL}
+    return [
+        measure(
+            "UserCreate.model_validate",
+            lambda: UserCreate.model_validate(create_body),
+            number=None,
+        ),
+        measure(
+            "UpdateUserRequest.model_validate",
+            lambda: UpdateUserRequest.model_validate(update_body),
+            number=None,
+        ),
+    ]
+
+
+class _DiscardTransport(Transport):
+    def capture_envelope(self, envelope):
+        pass
+
+
+def _ping_app(*middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"Success": True}
+
+    for middleware_class in middleware:
+        app.add_middleware(middleware_class)
+    return app
+
+
+def _request(app):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    return lambda: app(dict(scope), receive, send)
+
+
+def bench_middleware():
+    measurements = [
+        measure_async("request without middleware", _request(_ping_app())),
+        measure_async(
+            "request with PrometheusMiddleware",
+            _request(_ping_app(PrometheusMiddleware)),
+        ),
+    ]
+    # Sentry patches Starlette and FastAPI globally, so it is enabled only
+    # after the other apps have been measured. It is configured like
+    # main.py (errors only, no tracing) with events discarded locally.
+    sentry_sdk.init("https://public@sentry.invalid/1", transport=_DiscardTransport)
+    measurements += [
+        measure_async("request with Sentry", _request(_ping_app())),
+        measure_async(
+            "request with Sentry and PrometheusMiddleware",
+            _request(_ping_app(PrometheusMiddleware)),
+        ),
+    ]
+    return measurements
+
+
+GROUPS = {
+    "tokens": bench_tokens,
+    "hashing": bench_hashing,
+    "permissions": bench_permissions,
+    "validation": bench_validation,
+    "middleware": bench_middleware,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--group", choices=GROUPS, action="append", dest="groups")
+    args = parser.parse_args()
+    measurements = []
+    for group in args.groups or GROUPS:
+        measurements += GROUPS[group]()
+    print_table(measurements)
+
+
+if __name__ == "__main__":
+    main()
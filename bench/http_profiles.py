@@ -0,0 +1,90 @@
+"""Requests/sec and latency of the hot endpoints under each runtime profile.
+
+Starts `server.py` once per profile (one worker) against the database in
+REAL_DATABASE_URL, creates a user, and drives `GET /user/` and
+`POST /login/token` with a fixed number of concurrent clients.
+
+    python -m bench.http_profiles --duration 10 --concurrency 64
+"""
+
+import argparse
+import asyncio
+
+import httpx
+
+from bench.harness import percentile
+from bench.load import create_user
+from bench.load import drive
+from bench.load import PASSWORD
+from bench.load import start_server
+from bench.load import wait_until_up
+from server import RUNTIME_PROFILES
+
+
+async def _measure(send, duration: float, concurrency: int) -> dict:
+    latencies, errors, elapsed = await drive(send, duration, concurrency)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "errors": errors,
+    }
+
+
+async def _bench_profile(port: int, duration: float, concurrency: int) -> dict:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30
+    ) as client:
+        await wait_until_up(client)
+        user = await create_user(client)
+        return {
+            "GET /user/": await _measure(
+                lambda: client.get(
+                    "/user/", params={"user_id": user.user_id}, headers=user.headers
+                ),
+                duration,
+                concurrency,
+            ),
+            "POST /login/token": await _measure(
+                lambda: client.post(
+                    "/login/token", data={"username": user.email, "password": PASSWORD}
+                ),
+                duration,
+                concurrency,
+            ),
+        }
+
+
+def run_profile(profile: str, port: int, duration: float, concurrency: int) -> dict:
+    server = start_server(port, workers=1, profile=profile)
+    try:
+        return asyncio.run(_bench_profile(port, duration, concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--profile", choices=RUNTIME_PROFILES, action="append", dest="profiles"
+    )
+    args = parser.parse_args()
+    for profile in args.profiles or RUNTIME_PROFILES:
+        results = run_profile(profile, args.port, args.duration, args.concurrency)
+        for endpoint, result in results.items():
+            print(
+                f"{profile:<8} {endpoint:<18} "
+                f"{result['rps']:>8.0f} req/s  "
+                f"p50 {result['p50'] * 1e3:>7.2f} ms  "
+                f"p99 {result['p99'] * 1e3:>7.2f} ms  "
+                f"errors {result['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
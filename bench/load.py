@@ -0,0 +1,428 @@
+"""HTTP load scenarios against a locally started server.
+
+Starts `server.py` against the database in REAL_DATABASE_URL (migrated
+with `python -m db.migrate`), seeds users, and runs each scenario with a
+fixed number of concurrent clients. For every scenario it reports
+requests/sec, p50/p95/p99 latency, SQL statements per request and the
+server's event loop lag, both read from /metrics. Results are written as
+JSON; pass an earlier result file as --baseline to flag regressions.
+
+    python -m bench.load --output bench-results.json
+    python -m bench.load --baseline bench-results.json --scenario get_mix
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
+from typing import Awaitable
+from typing import Callable
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+
+from bench.harness import percentile
+from db.dals import UserDAL
+from db.models import PortalRole
+from db.session import async_session
+from db.session import engine
+from hashing import Hasher
+from server import RUNTIME_PROFILES
+
+
+PASSWORD = "benchmark-password"
+
+
+@dataclass
+class BenchUser:
+    user_id: str
+    email: str
+    headers: dict
+
+
+@dataclass
+class Fixtures:
+    users: list[BenchUser]
+    superadmin: BenchUser
+
+
+@dataclass
+class Scenario:
+    name: str
+    request: Callable[[httpx.AsyncClient, Fixtures], Awaitable[httpx.Response]]
+    expected_statuses: tuple[int, ...] = (200,)
+
+
+def _random_name() -> str:
+    return "".join(random.choices(string.ascii_letters, k=10))
+
+
+async def login_storm(client: httpx.AsyncClient, fixtures: Fixtures):
+    user = random.choice(fixtures.users)
+    return await client.post(
+        "/login/token", data={"username": user.email, "password": PASSWORD}
+    )
+
+
+async def get_mix(client: httpx.AsyncClient, fixtures: Fixtures):
+    user = random.choice(fixtures.users)
+    if random.random() < 0.8:
+        target = random.choice(fixtures.users)
+        return await client.get(
+            "/user/", params={"user_id": target.user_id}, headers=user.headers
+        )
+    return await client.get("/user/list", params={"limit": 20}, headers=user.headers)
+
+
+async def patch_mix(client: httpx.AsyncClient, fixtures: Fixtures):
+    user = random.choice(fixtures.users)
+    body = random.choice(({"name": _random_name()}, {"surname": _random_name()}))
+    return await client.patch(
+        "/user/", params={"user_id": user.user_id}, json=body, headers=user.headers
+    )
+
+
+async def user_creation(client: httpx.AsyncClient, fixtures: Fixtures):
+    return await client.post(
+        "/user/",
+        json={
+            "name": "Bench",
+            "surname": "Created",
+            "email": f"bench-{uuid.uuid4().hex}@example.com",
+            "password": PASSWORD,
+        },
+    )
+
+
+async def admin_promotions(client: httpx.AsyncClient, fixtures: Fixtures):
+    # Concurrent clients race on the same users, so 409 (already promoted /
+    # not an admin) is an expected outcome.
+    target = random.choice(fixtures.users)
+    send = client.patch if random.random() < 0.5 else client.delete
+    return await send(
+        "/user/admin_privilege",
+        params={"user_id": target.user_id},
+        headers=fixtures.superadmin.headers,
+    )
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("login_storm", login_storm),
+        Scenario("get_mix", get_mix),
+        Scenario("patch_mix", patch_mix),
+        Scenario("user_creation", user_creation),
+        Scenario("admin_promotions", admin_promotions, (200, 409)),
+    )
+}
+
+
+async def wait_until_up(client: httpx.AsyncClient, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/service/ping")).status_code == 200:
+                return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+        await asyncio.sleep(0.2)
+
+
+def start_server(port: int, workers: int, profile: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "server.py",
+            "--workers",
+            str(workers),
+            "--port",
+            str(port),
+            "--profile",
+            profile,
+        ],
+        env={
+            **os.environ,
+            "SERVER_METRICS_DIR": tempfile.mkdtemp(prefix="bench_metrics_"),
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def login(client: httpx.AsyncClient, user_id: str, email: str) -> BenchUser:
+    res = await client.post(
+        "/login/token", data={"username": email, "password": PASSWORD}
+    )
+    res.raise_for_status()
+    headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+    return BenchUser(user_id=user_id, email=email, headers=headers)
+
+
+async def create_user(client: httpx.AsyncClient) -> BenchUser:
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+    res = await client.post(
+        "/user/",
+        json={"name": "Bench", "surname": "Mark", "email": email, "password": PASSWORD},
+    )
+    res.raise_for_status()
+    return await login(client, res.json()["user_id"], email)
+
+
+async def create_superadmin(client: httpx.AsyncClient) -> BenchUser:
+    # There is no endpoint that creates a superadmin, so it goes straight
+    # into the database the server uses.
+    email = f"bench-superadmin-{uuid.uuid4().hex[:12]}@example.com"
+    async with async_session() as session:
+        async with session.begin():
+            user = await UserDAL(session).create_user(
+                name="Bench",
+                surname="Superadmin",
+                email=email,
+                hashed_password=Hasher.get_password_hash(PASSWORD),
+                roles=[PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+            )
+            user_id = str(user.user_id)
+    await engine.dispose()
+    return await login(client, user_id, email)
+
+
+async def seed(client: httpx.AsyncClient, users: int) -> Fixtures:
+    return Fixtures(
+        users=list(await asyncio.gather(*(create_user(client) for _ in range(users)))),
+        superadmin=await create_superadmin(client),
+    )
+
+
+@dataclass
+class ServerMetrics:
+    queries: float = 0.0
+    loop_lag_count: float = 0.0
+    loop_lag_sum: float = 0.0
+    loop_lag_buckets: dict = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, text: str) -> "ServerMetrics":
+        metrics = cls()
+        for family in text_string_to_metric_families(text):
+            for sample in family.samples:
+                if sample.name == "db_query_duration_seconds_count":
+                    metrics.queries += sample.value
+                elif sample.name == "event_loop_lag_seconds_count":
+                    metrics.loop_lag_count += sample.value
+                elif sample.name == "event_loop_lag_seconds_sum":
+                    metrics.loop_lag_sum += sample.value
+                elif sample.name == "event_loop_lag_seconds_bucket":
+                    bound = float(sample.labels["le"])
+                    metrics.loop_lag_buckets[bound] = (
+                        metrics.loop_lag_buckets.get(bound, 0.0) + sample.value
+                    )
+        return metrics
+
+    def __sub__(self, other: "ServerMetrics") -> "ServerMetrics":
+        return ServerMetrics(
+            queries=self.queries - other.queries,
+            loop_lag_count=self.loop_lag_count - other.loop_lag_count,
+            loop_lag_sum=self.loop_lag_sum - other.loop_lag_sum,
+            loop_lag_buckets={
+                bound: count - other.loop_lag_buckets.get(bound, 0.0)
+                for bound, count in self.loop_lag_buckets.items()
+            },
+        )
+
+    def loop_lag_p99(self) -> float:
+        # Upper bound of the histogram bucket holding the 99th percentile.
+        for bound, count in sorted(self.loop_lag_buckets.items()):
+            if count >= self.loop_lag_count * 0.99:
+                return bound
+        return 0.0
+
+
+async def scrape(client: httpx.AsyncClient) -> ServerMetrics:
+    return ServerMetrics.parse((await client.get("/metrics")).text)
+
+
+async def drive(send, duration: float, concurrency: int, expected_statuses=(200,)):
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client_loop():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started_at = time.perf_counter()
+            try:
+                res = await send()
+            except httpx.TransportError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started_at)
+            if res.status_code not in expected_statuses:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started_at
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    fixtures: Fixtures,
+    duration: float,
+    concurrency: int,
+) -> dict:
+    before = await scrape(client)
+    latencies, errors, elapsed = await drive(
+        lambda: scenario.request(client, fixtures),
+        duration,
+        concurrency,
+        scenario.expected_statuses,
+    )
+    server = await scrape(client) - before
+    requests = len(latencies)
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1e3 if latencies else None,
+        "p95_ms": percentile(latencies, 95) * 1e3 if latencies else None,
+        "p99_ms": percentile(latencies, 99) * 1e3 if latencies else None,
+        "db_queries_per_request": server.queries / requests if requests else None,
+        "loop_lag_mean_ms": (
+            server.loop_lag_sum / server.loop_lag_count * 1e3
+            if server.loop_lag_count
+            else None
+        ),
+        "loop_lag_p99_ms": server.loop_lag_p99() * 1e3,
+    }
+
+
+async def run(args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=30
+    ) as client:
+        await wait_until_up(client)
+        fixtures = await seed(client, args.users)
+        results = {}
+        for name in args.scenarios or SCENARIOS:
+            results[name] = await run_scenario(
+                client, SCENARIOS[name], fixtures, args.duration, args.concurrency
+            )
+            print_result(name, results[name])
+        return results
+
+
+def print_result(name: str, result: dict) -> None:
+    def ms(value):
+        return f"{value:8.2f}" if value is not None else "       -"
+
+    queries = result["db_queries_per_request"]
+    print(
+        f"{name:<18} {result['rps']:>8.0f} req/s  "
+        f"p50 {ms(result['p50_ms'])}  p95 {ms(result['p95_ms'])}  "
+        f"p99 {ms(result['p99_ms'])} ms  "
+        f"queries/req {queries if queries is None else round(queries, 2)}  "
+        f"loop lag p99 {ms(result['loop_lag_p99_ms'])} ms  "
+        f"errors {result['errors']}"
+    )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if result["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['rps']:.0f} req/s, baseline {previous['rps']:.0f}"
+            )
+        if (
+            result["p99_ms"] is not None
+            and previous["p99_ms"] is not None
+            and result["p99_ms"] > previous["p99_ms"] * (1 + tolerance)
+        ):
+            regressions.append(
+                f"{name}: p99 {result['p99_ms']:.2f} ms, "
+                f"baseline {previous['p99_ms']:.2f} ms"
+            )
+        if (
+            result["db_queries_per_request"] is not None
+            and previous["db_queries_per_request"] is not None
+            and result["db_queries_per_request"]
+            > previous["db_queries_per_request"] + 0.01
+        ):
+            regressions.append(
+                f"{name}: {result['db_queries_per_request']:.2f} queries/request, "
+                f"baseline {previous['db_queries_per_request']:.2f}"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario", choices=SCENARIOS, action="append", dest="scenarios"
+    )
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--profile", choices=RUNTIME_PROFILES, default="tuned")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed relative drop in req/s or rise in p99 before flagging",
+    )
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.workers, args.profile)
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    with open(args.output, "w") as output:
+        json.dump(
+            {
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "workers": args.workers,
+                "profile": args.profile,
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "scenarios": results,
+            },
+            output,
+            indent=2,
+        )
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["scenarios"]
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
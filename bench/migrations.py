@@ -0,0 +1,65 @@
+"""Cost of working out whether the database needs migrating.
+
+"ScriptDirectory" is what every alembic command pays before touching the
+database: importing each revision module and building the revision map.
+"alembic upgrade --sql" runs the whole upgrade from base in a fresh
+process, in offline mode so no database is needed. "read_revisions" is
+the check db.migrate does instead when the database is already at head.
+
+    python -m bench.migrations
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+from bench.harness import measure
+from bench.harness import print_table
+from db.migrate import read_config
+from db.migrate import read_revisions
+
+
+def load_script_directory(config):
+    script = ScriptDirectory.from_config(config)
+    return script.get_heads(), list(script.walk_revisions())
+
+
+def offline_upgrade():
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "heads", "--sql"],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def main() -> None:
+    config = Config("alembic.ini")
+    versions_dir = Path(read_config("alembic.ini")["script_location"]) / "versions"
+    print(f"{len(read_revisions(versions_dir)[0])} revisions")
+    print_table(
+        [
+            measure(
+                "ScriptDirectory",
+                lambda: load_script_directory(config),
+                number=None,
+                warmup=1,
+            ),
+            measure(
+                "alembic upgrade --sql", offline_upgrade, number=1, repeat=5, warmup=1
+            ),
+            measure(
+                "read_revisions",
+                lambda: read_revisions(versions_dir),
+                number=None,
+                warmup=1,
+            ),
+        ]
+    )
+
+
+if __name__ == "__main__":
+    main()
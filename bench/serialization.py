@@ -0,0 +1,74 @@
+"""Per-request cost of turning a handler's return value into response bytes.
+
+"default" is what FastAPI does with response_model: validate the returned
+model against the response field, encode it to JSON-compatible data and
+render it with JSONResponse. "orjson" is the same path rendered with
+ORJSONResponse. "fast" is PydanticJSONResponse, which api.responses uses
+when FAST_JSON_RESPONSES is enabled. No database is needed.
+
+    python -m bench.serialization
+"""
+
+import uuid
+
+from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from api.models import DeleteUserResponse
+from api.models import ShowUser
+from api.models import UpdatedUserResponse
+from api.responses import PydanticJSONResponse
+from bench.harness import measure
+from bench.harness import print_table
+
+
+USER_ID = uuid.uuid4()
+
+MODELS = {
+    "ShowUser": ShowUser(
+        user_id=USER_ID,
+        name="Mikhail",
+        surname="Ivanov",
+        email="mikhail@example.com",
+        is_active=True,
+    ),
+    "UpdatedUserResponse": UpdatedUserResponse(updated_user_id=USER_ID),
+    "DeleteUserResponse": DeleteUserResponse(deleted_user_id=USER_ID),
+}
+
+
+def _serialize(field, model):
+    # With is_coroutine=True serialize_response never awaits anything, so
+    # the coroutine finishes on its first step and no event loop is needed.
+    coroutine = serialize_response(field=field, response_content=model)
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("serialize_response suspended")
+
+
+def response_model_path(response_class, model):
+    field = create_model_field(name="Response", type_=type(model), mode="serialization")
+    return lambda: response_class(_serialize(field, model)).body
+
+
+def fast_path(model):
+    return lambda: PydanticJSONResponse(model).body
+
+
+def main() -> None:
+    measurements = []
+    for name, model in MODELS.items():
+        measurements += [
+            measure(f"{name} default", response_model_path(JSONResponse, model)),
+            measure(f"{name} orjson", response_model_path(ORJSONResponse, model)),
+            measure(f"{name} fast", fast_path(model)),
+        ]
+    print_table(measurements)
+
+
+if __name__ == "__main__":
+    main()
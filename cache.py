@@ -0,0 +1,114 @@
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+
+from prometheus_client import Counter
+
+
+CACHE_HITS = Counter("app_cache_hits_total", "Cache hits", ["cache"])
+CACHE_MISSES = Counter("app_cache_misses_total", "Cache misses", ["cache"])
+CACHE_EVICTIONS = Counter(
+    "app_cache_evictions_total", "Cache evictions", ["cache", "reason"]
+)
+
+
+class TTLCache:
+    """In-process LRU cache whose entries also expire after `ttl` seconds.
+
+    `index_by` extracts a secondary key from cached values so that entries
+    can be invalidated by something other than the cache key (e.g. cache
+    users by email, invalidate them by user_id).
+
+    `generation` changes on every invalidation. Callers that load a value
+    pass the generation they read before loading to `set`, which drops the
+    value if an invalidation happened meanwhile: the load may have read
+    the row before the write that caused it committed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: float,
+        index_by: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._index_by = index_by
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._index: dict[Hashable, set[Hashable]] = {}
+        self.generation = 0
+        self._hits = CACHE_HITS.labels(cache=name)
+        self._misses = CACHE_MISSES.labels(cache=name)
+        self._evicted_lru = CACHE_EVICTIONS.labels(cache=name, reason="size")
+        self._evicted_ttl = CACHE_EVICTIONS.labels(cache=name, reason="ttl")
+        self._invalidated = CACHE_EVICTIONS.labels(cache=name, reason="invalidate")
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        if not self.enabled:
+            return None
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses.inc()
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            self._evicted_ttl.inc()
+            self._misses.inc()
+            return None
+        self._data.move_to_end(key)
+        self._hits.inc()
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        if not self.enabled:
+            return
+        if generation is not None and generation != self.generation:
+            return
+        if key in self._data:
+            self._pop(key)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        if self._index_by is not None:
+            self._index.setdefault(self._index_by(value), set()).add(key)
+        while len(self._data) > self.maxsize:
+            oldest_key = next(iter(self._data))
+            self._pop(oldest_key)
+            self._evicted_lru.inc()
+
+    def invalidate(self, key: Hashable) -> None:
+        self.generation += 1
+        if key in self._data:
+            self._pop(key)
+            self._invalidated.inc()
+
+    def invalidate_indexed(self, index_key: Hashable) -> None:
+        self.generation += 1
+        for key in list(self._index.get(index_key, ())):
+            self.invalidate(key)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._data.clear()
+        self._index.clear()
+
+    def _pop(self, key: Hashable) -> None:
+        _, value = self._data.pop(key)
+        if self._index_by is not None:
+            index_key = self._index_by(value)
+            keys = self._index.get(index_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[index_key]
@@ -1,15 +1,287 @@
+import enum
+from datetime import datetime
+from typing import AsyncIterator
+from typing import BinaryIO
+from typing import Optional
 from typing import Union
 
 from sqlalchemy import and_
+from sqlalchemy import any_
+from sqlalchemy import bindparam
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import not_
+from sqlalchemy import or_
 from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import text
+from sqlalchemy import true
+from sqlalchemy import tuple_
 from sqlalchemy import update
 from sqlalchemy import UUID
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+import settings
 from db.models import PortalRole
+from db.models import RevokedToken
+from db.models import role_predicate
 from db.models import User
 
 
+USER_IMPORT_COLUMNS = [
+    "user_id",
+    "name",
+    "surname",
+    "email",
+    "is_active",
+    "hashed_password",
+    "roles",
+]
+
+
+class UpdateStatus(str, enum.Enum):
+    UPDATED = "updated"
+    NOT_FOUND = "not_found"
+    FORBIDDEN = "forbidden"
+    CONFLICT = "conflict"
+
+
+def _user_ids_param(user_ids: list[UUID]):
+    # A single array parameter keeps the statement text (and its cached
+    # compiled form) the same regardless of how many ids are passed.
+    return any_(
+        bindparam("user_ids", value=list(user_ids), type_=ARRAY(PG_UUID(as_uuid=True)))
+    )
+
+
+_ROLE_PREDICATES = {
+    role: role_predicate(role)
+    for role in (
+        PortalRole.ROLE_PORTAL_USER,
+        PortalRole.ROLE_PORTAL_ADMIN,
+        PortalRole.ROLE_PORTAL_SUPERADMIN,
+    )
+}
+
+
+def list_users_sort_column(
+    name_prefix: Optional[str], email_prefix: Optional[str]
+) -> Optional[str]:
+    # The column a GET /user/list page is ordered by before user_id.
+    if email_prefix:
+        return "email"
+    if name_prefix:
+        return "name"
+    return None
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    # The smallest string above every string that starts with prefix, in
+    # code point order, which is the byte order of the "C" collation for
+    # UTF-8. None when there is no such string.
+    while prefix:
+        last = ord(prefix[-1]) + 1
+        if 0xD800 <= last <= 0xDFFF:
+            last = 0xE000
+        if last <= 0x10FFFF:
+            return prefix[:-1] + chr(last)
+        prefix = prefix[:-1]
+    return None
+
+
+def _prefix_range(
+    column, prefix: str, after_value: Optional[str], after_user_id: Optional[UUID]
+):
+    # Both bounds are index conditions on (column, user_id). A page after
+    # the first starts right after the previous one, unless the cursor lies
+    # before the prefix.
+    if after_value is not None and after_value >= prefix:
+        lower = tuple_(column, User.user_id) > tuple_(after_value, after_user_id)
+    else:
+        lower = column >= prefix
+    upper = _prefix_upper_bound(prefix)
+    return lower if upper is None else and_(lower, column < upper)
+
+
+def _list_users_query(
+    limit: int,
+    after_user_id: Optional[UUID],
+    after_value: Optional[str],
+    is_active: Optional[bool],
+    role: Optional[str],
+    name_prefix: Optional[str],
+    email_prefix: Optional[str],
+):
+    # Keyset pagination: every page is an index range scan starting right
+    # after the previous page, never an OFFSET. Prefix filtered pages are
+    # ordered by (email, user_id) or (name, user_id) in the "C" collation
+    # and walk ix_users_email_user_id or ix_users_name_user_id; the other
+    # pages are ordered by user_id and walk the role's partial index,
+    # ix_users_is_active_user_id or the primary key. Filters without an
+    # index of their own are checked on the rows walked.
+    sort_column = list_users_sort_column(name_prefix, email_prefix)
+    query = select(User).limit(limit)
+    if sort_column is None:
+        query = query.order_by(User.user_id)
+        if after_user_id is not None:
+            query = query.where(User.user_id > after_user_id)
+    else:
+        column = getattr(User, sort_column).collate("C")
+        prefix = email_prefix.lower() if sort_column == "email" else name_prefix
+        query = query.order_by(column, User.user_id).where(
+            _prefix_range(column, prefix, after_value, after_user_id)
+        )
+        if sort_column == "email" and name_prefix:
+            query = query.where(User.name.startswith(name_prefix, autoescape=True))
+    if is_active is not None:
+        query = query.where(User.is_active == is_active)
+    if role is not None:
+        query = query.where(_ROLE_PREDICATES[role])
+    return query
+
+
+def _manager_kind(current_user: User) -> str:
+    if current_user.is_superadmin:
+        return "superadmin"
+    if current_user.is_admin:
+        return "admin"
+    return "user"
+
+
+def _can_manage_predicate(manager_kind: str):
+    # SQL form of check_user_permissions, evaluated against the target row.
+    predicate = User.user_id == bindparam("current_user_id")
+    if manager_kind == "superadmin":
+        predicate = or_(
+            predicate, not_(User.roles.contains([PortalRole.ROLE_PORTAL_SUPERADMIN]))
+        )
+    elif manager_kind == "admin":
+        predicate = or_(
+            predicate,
+            not_(
+                User.roles.overlap(
+                    [PortalRole.ROLE_PORTAL_ADMIN, PortalRole.ROLE_PORTAL_SUPERADMIN]
+                )
+            ),
+        )
+    return predicate
+
+
+# Hot statements are built once and reused: SQLAlchemy memoizes the cache
+# key of a statement object, so reusing it skips both constructing the
+# statement and traversing it to look up its compiled form. Per-call values
+# are passed as bound parameters.
+_GET_USER_BY_ID = select(User).where(User.user_id == bindparam("user_id"))
+_GET_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+# Only the columns users_email_key includes, so the auth lookups are
+# answered by an index-only scan. The users they return are for
+# authentication and permission checks only; name and surname are not loaded.
+_AUTH_COLUMNS = load_only(
+    User.user_id,
+    User.email,
+    User.hashed_password,
+    User.roles,
+    User.is_active,
+    User.token_version,
+)
+_GET_USER_FOR_AUTH = (
+    select(User).options(_AUTH_COLUMNS).where(User.email == bindparam("email"))
+)
+_GET_USERS_FOR_AUTH = (
+    select(User)
+    .options(_AUTH_COLUMNS)
+    .where(User.email == any_(bindparam("emails", type_=ARRAY(String))))
+)
+_GET_TOKEN_VERSION = select(User.token_version).where(
+    and_(User.user_id == bindparam("user_id"), User.is_active == True)
+)
+_DELETE_USER = (
+    update(User)
+    .where(and_(User.user_id == bindparam("target_user_id"), User.is_active == True))
+    .values(is_active=False, token_version=User.token_version + 1)
+    .returning(User.user_id)
+)
+_update_user_statements: dict = {}
+_update_user_if_permitted_statements: dict = {}
+
+
+def _update_values(columns: tuple[str, ...]) -> dict:
+    values = {column: bindparam(f"new_{column}") for column in columns}
+    if "email" in columns:
+        # Stateless tokens carry the email, so changing it invalidates them.
+        values["token_version"] = User.token_version + 1
+    return values
+
+
+def _update_params(values: dict) -> dict:
+    return {f"new_{column}": value for column, value in values.items()}
+
+
+def _update_user_statement(columns: tuple[str, ...]):
+    statement = _update_user_statements.get(columns)
+    if statement is None:
+        statement = (
+            update(User)
+            .where(
+                and_(
+                    User.user_id == bindparam("target_user_id"),
+                    User.is_active == True,
+                )
+            )
+            .values(_update_values(columns))
+            .returning(User.user_id)
+        )
+        _update_user_statements[columns] = statement
+    return statement
+
+
+def _update_user_if_permitted_statement(manager_kind: str, columns: tuple[str, ...]):
+    # `target` tells whether the active row exists, and `updated` is empty
+    # when the permission predicate rejected it. FOR UPDATE makes `target`
+    # wait for a concurrent delete and re-check is_active on the row it
+    # commits, so a user deleted meanwhile is reported as not found. The
+    # statement is a SELECT that writes, so it is marked for the replica
+    # router.
+    key = (manager_kind, columns)
+    statement = _update_user_if_permitted_statements.get(key)
+    if statement is None:
+        target = (
+            select(User.user_id)
+            .where(
+                and_(
+                    User.user_id == bindparam("target_user_id"),
+                    User.is_active == True,
+                )
+            )
+            .with_for_update()
+            .cte("target")
+        )
+        updated = (
+            update(User)
+            .where(
+                and_(
+                    User.user_id.in_(select(target.c.user_id)),
+                    User.is_active == True,
+                    _can_manage_predicate(manager_kind),
+                )
+            )
+            .values(_update_values(columns))
+            .returning(User.user_id)
+            .cte("updated")
+        )
+        statement = (
+            select(target.c.user_id, updated.c.user_id.label("updated_user_id"))
+            .select_from(target.outerjoin(updated, true()))
+            .execution_options(writes=True)
+        )
+        _update_user_if_permitted_statements[key] = statement
+    return statement
+
+
 class UserDAL:
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
@@ -33,40 +305,279 @@ class UserDAL:
         await self.db_session.flush()
         return new_user
 
+    async def create_users_bulk(self, users: list[dict]) -> set[UUID]:
+        # Every row carries its own user_id, so the ids returned by the INSERT
+        # tell which rows were created and which hit an existing email.
+        # Rows are sent in chunks to stay under the bind parameter limit.
+        created_user_ids = set()
+        chunk_size = settings.BULK_INSERT_CHUNK_SIZE
+        for start in range(0, len(users), chunk_size):
+            query = (
+                insert(User)
+                .values(users[start : start + chunk_size])
+                .on_conflict_do_nothing(index_elements=[User.email])
+                .returning(User.user_id)
+            )
+            res = await self.db_session.execute(query)
+            created_user_ids.update(res.scalars().all())
+        return created_user_ids
+
+    async def create_import_staging_table(self) -> None:
+        await self.db_session.execute(
+            text(
+                "CREATE TEMP TABLE users_import (LIKE users INCLUDING DEFAULTS) "
+                "ON COMMIT DROP"
+            )
+        )
+
+    async def copy_users_to_staging(self, source: BinaryIO) -> None:
+        # COPY goes straight through the asyncpg connection that backs this
+        # session's transaction; SQLAlchemy has no COPY construct. `source`
+        # holds CSV rows in the order of USER_IMPORT_COLUMNS.
+        connection = await self.db_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_to_table(
+            "users_import", source=source, columns=USER_IMPORT_COLUMNS, format="csv"
+        )
+
+    async def merge_staged_users(self, update_existing: bool) -> tuple[int, int]:
+        if update_existing:
+            on_conflict = (
+                "DO UPDATE SET name = EXCLUDED.name, surname = EXCLUDED.surname, "
+                "hashed_password = EXCLUDED.hashed_password"
+            )
+        else:
+            on_conflict = "DO NOTHING"
+        columns = ", ".join(USER_IMPORT_COLUMNS)
+        res = await self.db_session.execute(
+            text(
+                f"WITH merged AS ("
+                f"INSERT INTO users ({columns}) "
+                f"SELECT DISTINCT ON (email) {columns} FROM users_import "
+                f"ORDER BY email "
+                f"ON CONFLICT (email) {on_conflict} "
+                f"RETURNING (xmax = 0) AS inserted) "
+                f"SELECT count(*) FILTER (WHERE inserted), "
+                f"count(*) FILTER (WHERE NOT inserted) FROM merged"
+            )
+        )
+        inserted, updated = res.one()
+        return inserted, updated
+
     async def delete_user(self, user_id: UUID) -> Union[UUID, None]:
-        query = (
+        res = await self.db_session.execute(_DELETE_USER, {"target_user_id": user_id})
+        deleted_user_id_row = res.fetchone()
+        if deleted_user_id_row is not None:
+            return deleted_user_id_row[0]
+
+    async def update_user_if_permitted(
+        self, user_id: UUID, current_user: User, **kwargs
+    ) -> UpdateStatus:
+        # One round trip for the permission check and the update.
+        query = _update_user_if_permitted_statement(
+            _manager_kind(current_user), tuple(sorted(kwargs))
+        )
+        res = await self.db_session.execute(
+            query,
+            {
+                "target_user_id": user_id,
+                "current_user_id": current_user.user_id,
+                **_update_params(kwargs),
+            },
+        )
+        row = res.fetchone()
+        if row is None:
+            return UpdateStatus.NOT_FOUND
+        if row.updated_user_id is None:
+            return UpdateStatus.FORBIDDEN
+        return UpdateStatus.UPDATED
+
+    async def grant_admin_privilege(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, UpdateStatus]:
+        return await self._change_admin_privilege(
+            user_ids,
+            roles=func.array_append(User.roles, PortalRole.ROLE_PORTAL_ADMIN),
+            allowed=not_(
+                User.roles.overlap(
+                    [PortalRole.ROLE_PORTAL_ADMIN, PortalRole.ROLE_PORTAL_SUPERADMIN]
+                )
+            ),
+        )
+
+    async def revoke_admin_privilege(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, UpdateStatus]:
+        return await self._change_admin_privilege(
+            user_ids,
+            roles=func.array_remove(User.roles, PortalRole.ROLE_PORTAL_ADMIN),
+            allowed=User.roles.contains([PortalRole.ROLE_PORTAL_ADMIN]),
+        )
+
+    async def _change_admin_privilege(
+        self, user_ids: list[UUID], roles, allowed
+    ) -> dict[UUID, UpdateStatus]:
+        # The new roles are computed from the row being updated and the
+        # conflict condition and is_active are part of the WHERE clause, so
+        # concurrent role changes and deletes are re-evaluated against the
+        # latest row version instead of being overwritten. FOR UPDATE makes
+        # `target` re-check is_active too, so users deleted meanwhile are
+        # reported as not found.
+        target = (
+            select(User.user_id)
+            .where(
+                and_(User.user_id == _user_ids_param(user_ids), User.is_active == True)
+            )
+            .with_for_update()
+            .cte("target")
+        )
+        updated = (
             update(User)
-            .where(and_(User.user_id == user_id, User.is_active == True))
-            .values(is_active=False)
+            .where(
+                and_(
+                    User.user_id.in_(select(target.c.user_id)),
+                    User.is_active == True,
+                    allowed,
+                )
+            )
+            .values(roles=roles, token_version=User.token_version + 1)
             .returning(User.user_id)
+            .cte("updated")
+        )
+        query = (
+            select(target.c.user_id, updated.c.user_id.label("updated_user_id"))
+            .select_from(
+                target.outerjoin(updated, target.c.user_id == updated.c.user_id)
+            )
+            .execution_options(writes=True)
         )
         res = await self.db_session.execute(query)
-        deleted_user_id_row = res.fetchone()
-        if deleted_user_id_row is not None:
-            return deleted_user_id_row[0]
+        statuses = {user_id: UpdateStatus.NOT_FOUND for user_id in user_ids}
+        for row in res:
+            statuses[row.user_id] = (
+                UpdateStatus.CONFLICT
+                if row.updated_user_id is None
+                else UpdateStatus.UPDATED
+            )
+        return statuses
 
     async def get_user_by_id(self, user_id: UUID) -> Union[UUID, None]:
-        query = select(User).where(User.user_id == user_id)
-        res = await self.db_session.execute(query)
+        res = await self.db_session.execute(_GET_USER_BY_ID, {"user_id": user_id})
         user_row = res.fetchone()
         if user_row is not None:
             return user_row[0]
 
-    async def get_user_by_email(self, email: str) -> Union[User, None]:
-        query = select(User).where(User.email == email)
+    async def get_users_by_ids(self, user_ids: list[UUID]) -> dict[UUID, User]:
+        query = select(User).where(User.user_id == _user_ids_param(user_ids))
+        res = await self.db_session.execute(query)
+        return {user.user_id: user for user in res.scalars()}
+
+    async def list_users(
+        self,
+        limit: int,
+        after_user_id: Optional[UUID] = None,
+        after_value: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        role: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        email_prefix: Optional[str] = None,
+    ) -> list[User]:
+        query = _list_users_query(
+            limit,
+            after_user_id,
+            after_value,
+            is_active,
+            role,
+            name_prefix,
+            email_prefix,
+        )
         res = await self.db_session.execute(query)
+        return list(res.scalars())
+
+    async def stream_users(self, batch_size: int) -> AsyncIterator[list]:
+        # Server-side cursor: rows are fetched batch_size at a time, so memory
+        # stays flat no matter how large the table is.
+        query = (
+            select(
+                User.user_id,
+                User.name,
+                User.surname,
+                User.email,
+                User.is_active,
+            )
+            .order_by(User.user_id)
+            .execution_options(yield_per=batch_size)
+        )
+        res = await self.db_session.stream(query)
+        async for rows in res.partitions():
+            yield rows
+
+    async def get_token_version(self, user_id: UUID) -> Union[int, None]:
+        res = await self.db_session.execute(_GET_TOKEN_VERSION, {"user_id": user_id})
+        return res.scalar_one_or_none()
+
+    async def get_user_by_email(self, email: str) -> Union[User, None]:
+        res = await self.db_session.execute(
+            _GET_USER_BY_EMAIL, {"email": email.lower()}
+        )
         user_row = res.fetchone()
         if user_row is not None:
             return user_row[0]
 
+    async def get_user_for_auth(self, email: str) -> Union[User, None]:
+        res = await self.db_session.execute(
+            _GET_USER_FOR_AUTH, {"email": email.lower()}
+        )
+        return res.scalar_one_or_none()
+
+    async def get_users_for_auth(self, emails: list[str]) -> dict[str, User]:
+        res = await self.db_session.execute(
+            _GET_USERS_FOR_AUTH, {"emails": [email.lower() for email in emails]}
+        )
+        return {user.email: user for user in res.scalars()}
+
     async def update_user(self, user_id: UUID, **kwargs) -> Union[UUID, None]:
-        query = (
-            update(User)
-            .where(and_(User.user_id == user_id, User.is_active == True))
-            .values(kwargs)
-            .returning(User.user_id)
+        query = _update_user_statement(tuple(sorted(kwargs)))
+        res = await self.db_session.execute(
+            query, {"target_user_id": user_id, **_update_params(kwargs)}
         )
-        res = await self.db_session.execute(query)
         update_user_id_row = res.fetchone()
         if update_user_id_row is not None:
             return update_user_id_row[0]
+
+
+class RevokedTokenDAL:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        query = (
+            insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+        await self.db_session.execute(query)
+
+    async def is_revoked(self, jti: str) -> bool:
+        query = select(RevokedToken.jti).where(RevokedToken.jti == jti)
+        res = await self.db_session.execute(query)
+        return res.first() is not None
+
+    async def get_unexpired(self) -> list[tuple[str, datetime]]:
+        query = select(RevokedToken.jti, RevokedToken.revoked_at).where(
+            RevokedToken.expires_at > func.now()
+        )
+        res = await self.db_session.execute(query)
+        return list(res.tuples())
+
+    async def get_revoked_since(self, since: datetime) -> list[tuple[str, datetime]]:
+        query = select(RevokedToken.jti, RevokedToken.revoked_at).where(
+            RevokedToken.revoked_at > since
+        )
+        res = await self.db_session.execute(query)
+        return list(res.tuples())
+
+    async def delete_expired(self) -> None:
+        await self.db_session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= func.now())
+        )
@@ -0,0 +1,165 @@
+import argparse
+import configparser
+import re
+import sys
+from pathlib import Path
+from typing import Iterable
+
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+
+
+# The revisions before it were squashed into this one. Databases stamped
+# with one of LEGACY_REVISIONS already have the baseline schema and are
+# restamped onto it; older ones predate hashed_password and roles.
+BASELINE_REVISION = "e700e53092ab"
+LEGACY_REVISIONS = frozenset(
+    {
+        "02f25d8a745e",
+        "050f97a86492",
+        "0560b2816d17",
+        "069403c164ff",
+        "166977193417",
+        "1bea42000298",
+        "247c61912f19",
+        "2bca26393b75",
+        "2e4f5bb449b5",
+        "30da4d553c9e",
+        "31e375d0eeea",
+        "35918d11815c",
+        "3d637e93ac9b",
+        "3d7a30f42ee1",
+        "408c339e056f",
+        "422ddf97a2c6",
+        "4f200a7d2c7f",
+        "50a21577e74c",
+        "50f62fd02efe",
+        "54f3d074d176",
+        "5bb9cf39cfae",
+        "600c7de83968",
+        "64cf04886625",
+        "6a9a16a90f58",
+        "73297318fd2a",
+        "77a2792176ff",
+        "7c15c031657f",
+        "803df8d5403b",
+        "85b0e196bfe3",
+        "8697f0b27e68",
+        "8b4a84eb4b1a",
+        "987899f8fc63",
+        "9e1bfa23a8ba",
+        "a767e12e7896",
+        "a76998afee0d",
+        "abe34115faea",
+        "af7c32d28218",
+        "c32602f329b5",
+        "c63aad81b9ab",
+        "c9d34b9fe61f",
+        "ca818ef5a9f2",
+        "cfd3cc0c88c5",
+        "d03d7e16136f",
+        "dc07737fd811",
+        "e045c86917a4",
+        "e11dd65caacd",
+        "e250c8cca3cd",
+        "e28b708a92a1",
+        "ed2be1f5dfa0",
+        "f1133c4d5c22",
+        "f529c89c32b6",
+        "ffcaec9f0402",
+    }
+)
+
+_REVISION = re.compile(r"^revision(?:: \w+)? = ['\"](\w+)['\"]", re.MULTILINE)
+_DOWN_REVISION = re.compile(r"^down_revision(?:: [^=]+)? = (.+)$", re.MULTILINE)
+_REVISION_ID = re.compile(r"['\"](\w+)['\"]")
+
+
+def read_revisions(versions_dir: Path) -> tuple[set[str], set[str]]:
+    # Reads the revision graph from the migration sources without importing
+    # them, which is most of what loading Alembic's script directory costs.
+    revisions = set()
+    parents = set()
+    for path in versions_dir.glob("*.py"):
+        source = path.read_text()
+        revision = _REVISION.search(source)
+        if revision is None:
+            continue
+        revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION.search(source)
+        if down_revision is not None:
+            parents.update(_REVISION_ID.findall(down_revision.group(1)))
+    return revisions, revisions - parents
+
+
+def read_config(config_file: str) -> configparser.SectionProxy:
+    # The [alembic] section the way alembic.config.Config reads it, without
+    # importing Alembic.
+    parser = configparser.ConfigParser(
+        defaults={"here": str(Path(config_file).resolve().parent)}
+    )
+    if not parser.read(config_file):
+        raise FileNotFoundError(config_file)
+    return parser["alembic"]
+
+
+def current_revisions(connection) -> set[str]:
+    if connection.execute(text("SELECT to_regclass('alembic_version')")).scalar():
+        rows = connection.execute(text("SELECT version_num FROM alembic_version"))
+        return set(rows.scalars())
+    return set()
+
+
+def _stamp_baseline(connection, legacy: Iterable[str]) -> None:
+    connection.execute(
+        text("DELETE FROM alembic_version WHERE version_num = ANY(:legacy)"),
+        {"legacy": list(legacy)},
+    )
+    connection.execute(
+        text("INSERT INTO alembic_version (version_num) VALUES (:baseline)"),
+        {"baseline": BASELINE_REVISION},
+    )
+
+
+def migrate(config_file: str) -> bool:
+    # Returns False when the database already was at head, in which case
+    # Alembic is never imported.
+    config = read_config(config_file)
+    revisions, heads = read_revisions(Path(config["script_location"]) / "versions")
+    engine = create_engine(config["sqlalchemy.url"], poolclass=NullPool)
+    try:
+        with engine.begin() as connection:
+            current = current_revisions(connection)
+            if current == heads:
+                return False
+            unknown = current - revisions - LEGACY_REVISIONS
+            if unknown:
+                raise RuntimeError(
+                    f"Database is at revision {', '.join(sorted(unknown))}, which "
+                    "predates the squashed baseline; upgrade it with an older "
+                    "release first"
+                )
+            if current & LEGACY_REVISIONS:
+                _stamp_baseline(connection, current & LEGACY_REVISIONS)
+    finally:
+        engine.dispose()
+
+    # Imported here so the already-at-head path does not pay for it.
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(config_file), "heads")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Upgrade the database to head")
+    parser.add_argument("-c", "--config", default="alembic.ini")
+    args = parser.parse_args()
+    if not migrate(args.config):
+        print("Database is already at head", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,14 @@ import uuid
 
 from sqlalchemy import Boolean
 from sqlalchemy import Column
+from sqlalchemy import DateTime
 from sqlalchemy import Enum
+from sqlalchemy import func
+from sqlalchemy import Index
+from sqlalchemy import Integer
 from sqlalchemy import String
+from sqlalchemy import text
+from sqlalchemy import TextClause
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base
@@ -12,16 +18,60 @@ from sqlalchemy.orm import declarative_base
 Base = declarative_base()
 
 
+def role_predicate(role: str) -> TextClause:
+    # The role is inlined rather than bound so that the planner can match a
+    # query using it with the partial index built on the same predicate.
+    return text(f"roles @> '{{{role}}}'")
+
+
 class User(Base):
     __tablename__ = "users"
 
     user_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
     surname = Column(String, nullable=False)
-    email = Column(String, nullable=False, unique=True)
+    email = Column(String, nullable=False)
     is_active = Column(Boolean(), default=True)
     hashed_password = Column(String, nullable=False)
     roles = Column(ARRAY(String), nullable=False)
+    # Bumped whenever the claims of a stateless token would go stale.
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        # Unique emails (stored lowercased), and covering for the auth lookup
+        # so logins and token checks are answered from the index alone.
+        Index(
+            "users_email_key",
+            "email",
+            unique=True,
+            postgresql_include=[
+                "user_id",
+                "hashed_password",
+                "roles",
+                "is_active",
+                "token_version",
+            ],
+        ),
+        # One index per GET /user/list ordering; see UserDAL.list_users.
+        Index("ix_users_is_active_user_id", "is_active", "user_id"),
+        Index("ix_users_name_user_id", text('name COLLATE "C"'), "user_id"),
+        Index("ix_users_email_user_id", text('email COLLATE "C"'), "user_id"),
+        Index(
+            "ix_users_user_id_role_user",
+            "user_id",
+            postgresql_where=role_predicate("ROLE_PORTAL_USER"),
+        ),
+        Index(
+            "ix_users_user_id_role_admin",
+            "user_id",
+            postgresql_where=role_predicate("ROLE_PORTAL_ADMIN"),
+        ),
+        Index(
+            "ix_users_user_id_role_superadmin",
+            "user_id",
+            postgresql_where=role_predicate("ROLE_PORTAL_SUPERADMIN"),
+        ),
+    )
 
     @property
     def is_superadmin(self) -> bool:
@@ -40,6 +90,19 @@ class User(Base):
             return {role for role in self.roles if role != PortalRole.ROLE_PORTAL_ADMIN}
 
 
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String, primary_key=True)
+    # Rows are only needed until the token would have expired anyway.
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (Index("ix_revoked_tokens_revoked_at", "revoked_at"),)
+
+
 class PortalRole(str, Enum):
     ROLE_PORTAL_USER = "ROLE_PORTAL_USER"
     ROLE_PORTAL_ADMIN = "ROLE_PORTAL_ADMIN"
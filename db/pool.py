@@ -0,0 +1,129 @@
+import os
+import time
+
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+import settings
+
+
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured connection pool size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_CHECKED_IN = Gauge(
+    "db_pool_checked_in",
+    "Idle connections available in the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections opened beyond pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_ACQUIRE_WAIT = Histogram(
+    "db_pool_acquire_wait_seconds",
+    "Time spent waiting to check out a connection",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "Connection checkouts that hit pool_timeout", ["pool"]
+)
+
+
+POOL_GAUGES = (
+    (POOL_SIZE, lambda pool: pool.size()),
+    (POOL_CHECKED_OUT, lambda pool: pool.checkedout()),
+    (POOL_CHECKED_IN, lambda pool: pool.checkedin()),
+    (POOL_OVERFLOW, lambda pool: max(pool.overflow(), 0)),
+)
+
+
+def _multiprocess_metrics() -> bool:
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    metrics_name = "default"
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_TIMEOUTS.labels(pool=self.metrics_name).inc()
+            raise
+        finally:
+            POOL_ACQUIRE_WAIT.labels(pool=self.metrics_name).observe(
+                time.perf_counter() - started_at
+            )
+            self._write_gauges()
+
+    def _do_return_conn(self, record):
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._write_gauges()
+
+    def _write_gauges(self):
+        # In multiprocess mode a scrape is served by any one worker, which
+        # reads the other workers' values from files, so set_function gauges
+        # cannot be used. Each worker writes its pool state on every change.
+        if _multiprocess_metrics():
+            for gauge, value in POOL_GAUGES:
+                gauge.labels(pool=self.metrics_name).set(value(self))
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    engine.pool.metrics_name = name
+    if _multiprocess_metrics():
+        engine.pool._write_gauges()
+        return
+    # The gauges read engine.pool at scrape time, so they follow the pool
+    # that replaces this one after engine.dispose().
+    for gauge, value in POOL_GAUGES:
+        gauge.labels(pool=name).set_function(lambda value=value: value(engine.pool))
+
+
+def pool_limits(workers: int) -> tuple[int, int]:
+    # This worker's share of DB_MAX_CONNECTIONS. 0 workers means the app was
+    # not started by server.run and is the only process.
+    share = max(settings.DB_MAX_CONNECTIONS // max(workers, 1), 1)
+    pool_size = min(settings.DB_POOL_SIZE, share)
+    return pool_size, min(settings.DB_MAX_OVERFLOW, share - pool_size)
+
+
+def engine_pool_kwargs() -> dict:
+    pool_size, max_overflow = pool_limits(settings.SERVER_WORKERS)
+    return {
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    }
@@ -0,0 +1,162 @@
+import asyncio
+import itertools
+import math
+import time
+from logging import getLogger
+from typing import Optional
+
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from sqlalchemy import Select
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+import settings
+
+
+logger = getLogger(__name__)
+
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+
+REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replication lag measured on each replica",
+    ["replica"],
+    multiprocess_mode="livemax",
+)
+ROUTED_READS = Counter(
+    "db_routed_reads_total", "Read-only sessions routed to each target", ["target"]
+)
+
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.lag = math.inf
+        self.checked_at = 0.0
+
+    def visible_since(self) -> float:
+        # Everything committed on the primary before this moment had been
+        # replayed on the replica when its lag was last measured.
+        return self.checked_at - self.lag
+
+
+class ReplicaSet:
+    def __init__(self, replicas: list[Replica], strategy: str, max_lag: float):
+        if strategy not in ("round_robin", "least_loaded"):
+            raise ValueError(f"Unknown replica routing strategy: {strategy}")
+        self.replicas = replicas
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self._round_robin = itertools.cycle(replicas)
+        self._monitor: Optional[asyncio.Task] = None
+
+    def choose(self, written_at: Optional[float] = None) -> Optional[Replica]:
+        candidates = [
+            replica
+            for replica in self.replicas
+            if replica.lag <= self.max_lag
+            and (written_at is None or replica.visible_since() >= written_at)
+        ]
+        if not candidates:
+            return None
+        if self.strategy == "least_loaded":
+            return min(candidates, key=lambda replica: replica.engine.pool.checkedout())
+        for _ in range(len(self.replicas)):
+            replica = next(self._round_robin)
+            if replica in candidates:
+                return replica
+
+    async def refresh_lag(self) -> None:
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as connection:
+                    lag = float((await connection.execute(REPLICA_LAG_QUERY)).scalar())
+            except Exception as err:
+                logger.warning("Replica %s is unavailable: %s", replica.name, err)
+                lag = math.inf
+            replica.lag = lag
+            replica.checked_at = time.time()
+            REPLICA_LAG.labels(replica=replica.name).set(lag)
+
+    async def _monitor_lag(self) -> None:
+        while True:
+            await self.refresh_lag()
+            await asyncio.sleep(settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS)
+
+    def start_monitor(self) -> None:
+        if self._monitor is None:
+            self._monitor = asyncio.create_task(self._monitor_lag())
+
+    async def stop_monitor(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+
+
+def _is_read_only(clause) -> bool:
+    # Statements that embed DML in a CTE are marked with the `writes`
+    # execution option by the DAL.
+    return isinstance(clause, Select) and not clause.get_execution_options().get(
+        "writes"
+    )
+
+
+def make_routing_session_class(primary: AsyncEngine, replica_set: ReplicaSet):
+    class RoutingSession(Session):
+        """Sends reads to a replica until the session writes anything.
+
+        Once a write is routed to the primary the session stays on the
+        primary, so a request always reads its own writes. A session
+        created with info["written_at"] (the read-your-writes token of an
+        earlier request) only uses replicas that have replayed past it.
+        """
+
+        def get_bind(self, mapper=None, clause=None, **kw):
+            if self.info.get("use_primary"):
+                return primary.sync_engine
+            if self._flushing or not _is_read_only(clause):
+                self.info["use_primary"] = True
+                return primary.sync_engine
+            if "replica" not in self.info:
+                replica = replica_set.choose(self.info.get("written_at"))
+                self.info["replica"] = replica
+                ROUTED_READS.labels(
+                    target=replica.name if replica is not None else "primary"
+                ).inc()
+            replica = self.info["replica"]
+            if replica is None:
+                return primary.sync_engine
+            return replica.engine.sync_engine
+
+    return RoutingSession
+
+
+def parse_read_your_writes_token(token: Optional[str]) -> Optional[float]:
+    if not token:
+        return None
+    try:
+        written_at = float(token)
+    except ValueError:
+        return None
+    if time.time() - written_at > settings.READ_YOUR_WRITES_MAX_AGE_SECONDS:
+        return None
+    return written_at
+
+
+def issue_read_your_writes_token() -> str:
+    return f"{time.time():.6f}"
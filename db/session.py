@@ -1,20 +1,88 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from typing import Callable
 from typing import Generator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 import settings
+from db.pool import engine_pool_kwargs
+from db.pool import instrument_engine
+from db.routing import make_routing_session_class
+from db.routing import parse_read_your_writes_token
+from db.routing import READ_YOUR_WRITES_HEADER
+from db.routing import Replica
+from db.routing import ReplicaSet
+from db.sql_logging import install_sql_logging
 
 
-engine = create_async_engine(settings.REAL_DATABASE_URL, future=True, echo=True)
+engine = create_async_engine(
+    settings.REAL_DATABASE_URL,
+    future=True,
+    echo=settings.DB_ECHO,
+    **engine_pool_kwargs(),
+)
+instrument_engine(engine, "primary")
+install_sql_logging(engine, "primary")
 
-async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+replica_set = None
+session_kwargs = {}
+if settings.REPLICA_DATABASE_URLS:
+    replicas = []
+    for number, url in enumerate(settings.REPLICA_DATABASE_URLS):
+        name = f"replica{number}"
+        replica_engine = create_async_engine(
+            url, future=True, echo=settings.DB_ECHO, **engine_pool_kwargs()
+        )
+        instrument_engine(replica_engine, name)
+        install_sql_logging(replica_engine, name)
+        replicas.append(Replica(name, replica_engine))
+    replica_set = ReplicaSet(
+        replicas,
+        strategy=settings.REPLICA_ROUTING,
+        max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    )
+    session_kwargs["sync_session_class"] = make_routing_session_class(
+        engine, replica_set
+    )
 
+async_session = sessionmaker(
+    engine, expire_on_commit=False, class_=AsyncSession, **session_kwargs
+)
 
-async def get_db() -> Generator:
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    # For side effects that must not happen unless the unit of work
+    # commits, such as dropping cached copies of the rows it changed.
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    # The session begins its transaction, and checks out a connection, on
+    # the first query; nothing is opened if no query is made. That single
+    # transaction is committed once at the end, or rolled back on error.
     try:
-        session: AsyncSession = async_session()
         yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
     finally:
+        callbacks = session.info.pop("after_commit", [])
         await session.close()
+    for callback in callbacks:
+        callback()
+
+
+async def get_db(request: Request) -> Generator:
+    async with unit_of_work(async_session()) as session:
+        written_at = parse_read_your_writes_token(
+            request.headers.get(READ_YOUR_WRITES_HEADER)
+        )
+        if written_at is not None:
+            session.info["written_at"] = written_at
+        yield session
@@ -0,0 +1,115 @@
+import random
+import time
+from collections import deque
+from datetime import datetime
+from datetime import timezone
+from logging import getLogger
+
+from prometheus_client import Counter
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import settings
+
+
+logger = getLogger(__name__)
+
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of SQL statements as seen by the application",
+    ["engine"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10),
+)
+SLOW_QUERIES = Counter(
+    "db_slow_queries_total", "SQL statements over the slow query threshold", ["engine"]
+)
+
+EXPLAINABLE_PREFIXES = ("select", "with", "insert", "update", "delete")
+
+slow_queries: deque = deque(maxlen=settings.SLOW_QUERY_LOG_SIZE)
+_explain_times: deque = deque()
+
+
+def _explain_allowed(now: float) -> bool:
+    while _explain_times and now - _explain_times[0] > 60:
+        _explain_times.popleft()
+    if len(_explain_times) >= settings.SLOW_QUERY_EXPLAINS_PER_MINUTE:
+        return False
+    _explain_times.append(now)
+    return True
+
+
+def _explain(conn, statement: str, parameters) -> str:
+    # Runs on the same connection and transaction as the slow statement,
+    # wrapped in a savepoint that is always rolled back: a failing EXPLAIN
+    # cannot abort the caller's transaction, and EXPLAIN ANALYZE of a DML
+    # statement leaves no changes behind.
+    options = "ANALYZE, BUFFERS" if settings.SLOW_QUERY_EXPLAIN_ANALYZE else "COSTS"
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(f"EXPLAIN ({options}) {statement}", parameters)
+            return "\n".join(row[0] for row in cursor.fetchall())
+        finally:
+            cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    finally:
+        cursor.close()
+
+
+def _should_explain(conn, statement: str, context, executemany: bool) -> bool:
+    if not settings.SLOW_QUERY_EXPLAIN or executemany or context is None:
+        return False
+    if context.execution_options.get("stream_results"):
+        return False
+    if not conn.in_transaction():
+        return False
+    return statement.lstrip().lower().startswith(EXPLAINABLE_PREFIXES)
+
+
+def install_sql_logging(engine: AsyncEngine, name: str) -> None:
+    sync_engine = engine.sync_engine
+    duration = QUERY_DURATION.labels(engine=name)
+    slow_counter = SLOW_QUERIES.labels(engine=name)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info["query_started_at"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - conn.info.pop("query_started_at")
+        duration.observe(elapsed)
+        elapsed_ms = round(elapsed * 1000, 3)
+        if elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+            slow_counter.inc()
+            entry = {
+                "engine": name,
+                "statement": statement,
+                "duration_ms": elapsed_ms,
+                "at": datetime.now(timezone.utc).isoformat(),
+                "plan": None,
+            }
+            if _should_explain(conn, statement, context, many) and _explain_allowed(
+                time.monotonic()
+            ):
+                try:
+                    entry["plan"] = _explain(conn, statement, parameters)
+                except Exception as err:
+                    logger.warning("Could not capture EXPLAIN: %s", err)
+            slow_queries.append(entry)
+            logger.warning(
+                "slow query %.1fms: %s",
+                elapsed_ms,
+                statement,
+                extra={"sql": entry},
+            )
+        elif random.random() < settings.SQL_LOG_SAMPLE_RATE:
+            logger.info(
+                "query %.1fms: %s",
+                elapsed_ms,
+                statement,
+                extra={"sql": {"statement": statement, "duration_ms": elapsed_ms}},
+            )
@@ -1,7 +1,41 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Optional
+
 from passlib.context import CryptContext
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+
+import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+HASHING_QUEUE_WAIT = Histogram(
+    "hashing_queue_wait_seconds",
+    "Time a hashing job waited for a free worker",
+    ["operation"],
+)
+HASHING_DURATION = Histogram(
+    "hashing_duration_seconds", "Time spent hashing in a worker", ["operation"]
+)
+HASHING_IN_FLIGHT = Gauge(
+    "hashing_jobs_in_flight",
+    "Hashing jobs queued or running in the pool",
+    multiprocess_mode="livesum",
+)
+HASHING_REJECTED = Counter(
+    "hashing_jobs_rejected_total", "Hashing jobs rejected because the pool is full"
+)
+
+
+class HashingPoolSaturatedError(Exception):
+    pass
+
 
 class Hasher:
     @staticmethod
@@ -11,3 +45,110 @@ class Hasher:
     @staticmethod
     def get_password_hash(password: str) -> str:
         return pwd_context.hash(password)
+
+    @staticmethod
+    def is_supported_hash(hashed_password: str) -> bool:
+        return pwd_context.identify(hashed_password, required=False) is not None
+
+    @staticmethod
+    def get_password_hashes(passwords: list[str]) -> list[str]:
+        return [pwd_context.hash(password) for password in passwords]
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        return await hashing_pool.run(
+            "verify", Hasher.verify_password, plain_password, hashed_password
+        )
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        return await hashing_pool.run("hash", Hasher.get_password_hash, password)
+
+    @staticmethod
+    async def get_password_hashes_async(passwords: list[str]) -> list[str]:
+        # Hash in small chunks with at most one chunk per worker in flight, so
+        # a large batch shares the pool with logins instead of filling it.
+        chunk_size = settings.HASHING_BULK_CHUNK_SIZE
+        semaphore = asyncio.Semaphore(hashing_pool.workers)
+
+        async def hash_chunk(chunk: list[str]) -> list[str]:
+            async with semaphore:
+                return await hashing_pool.run(
+                    "hash_bulk", Hasher.get_password_hashes, chunk
+                )
+
+        chunks = await asyncio.gather(
+            *(
+                hash_chunk(passwords[start : start + chunk_size])
+                for start in range(0, len(passwords), chunk_size)
+            )
+        )
+        return [hashed for chunk in chunks for hashed in chunk]
+
+
+def _timed_call(func: Callable, args: tuple) -> tuple:
+    # Runs inside the worker; time.monotonic() is system-wide on the platforms
+    # we deploy to, so start/finish are comparable with the submitter's clock
+    # for both thread and process pools.
+    started_at = time.monotonic()
+    result = func(*args)
+    return result, started_at, time.monotonic()
+
+
+class HashingPool:
+    def __init__(self, kind: str, workers: int, max_queue: int):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown hashing pool kind: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="hashing"
+                )
+        return self._executor
+
+    async def run(self, operation: str, func: Callable, *args):
+        if self._pending >= self.workers + self.max_queue:
+            HASHING_REJECTED.inc()
+            raise HashingPoolSaturatedError
+        loop = asyncio.get_running_loop()
+        submitted_at = time.monotonic()
+        job = self.executor.submit(_timed_call, func, args)
+        self._pending += 1
+        HASHING_IN_FLIGHT.inc()
+        # A cancelled caller stops waiting but its job keeps its worker busy,
+        # so the job counts as pending until the executor is done with it.
+        # Registered before wrap_future's own callback, so the count drops
+        # before the caller resumes.
+        job.add_done_callback(lambda _: loop.call_soon_threadsafe(self._job_done))
+        result, started_at, finished_at = await asyncio.wrap_future(job)
+        HASHING_QUEUE_WAIT.labels(operation=operation).observe(
+            max(started_at - submitted_at, 0.0)
+        )
+        HASHING_DURATION.labels(operation=operation).observe(finished_at - started_at)
+        return result
+
+    def _job_done(self) -> None:
+        self._pending -= 1
+        HASHING_IN_FLIGHT.dec()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hashing_pool = HashingPool(
+    kind=settings.HASHING_POOL_KIND,
+    workers=settings.HASHING_POOL_WORKERS,
+    max_queue=settings.HASHING_POOL_MAX_QUEUE,
+)
@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import logging
+
+from api.actions.importer import _import_users
+from api.actions.importer import detect_import_format
+from api.actions.importer import IMPORT_FORMATS
+from db.session import async_session
+from db.session import unit_of_work
+
+
+async def run(path: str, import_format: str, update_existing: bool) -> None:
+    async with unit_of_work(async_session()) as session:
+        with open(path, newline="", encoding="utf-8") as file:
+            report = await _import_users(
+                file, import_format, session, update_existing=update_existing
+            )
+    print(report.model_dump_json(indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Import users from a CSV or NDJSON file"
+    )
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, dest="import_format")
+    parser.add_argument(
+        "--update-existing",
+        action="store_true",
+        help="update name, surname and password of users whose email exists",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    import_format = args.import_format or detect_import_format(args.path)
+    asyncio.run(run(args.path, import_format, args.update_existing))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import asyncio
+
+from prometheus_client import Histogram
+
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop woke up a timer",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+async def monitor_event_loop_lag(interval: float) -> None:
+    # A timer that fires late means something held the loop for that long:
+    # blocking calls, CPU-heavy handlers or simply too many ready callbacks.
+    loop = asyncio.get_running_loop()
+    while True:
+        started_at = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(loop.time() - started_at - interval, 0.0))
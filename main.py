@@ -1,24 +1,61 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 import sentry_sdk
-import uvicorn
 from fastapi import FastAPI
 from fastapi.routing import APIRouter
+from prometheus_client import multiprocess
 from starlette_exporter import handle_metrics
 from starlette_exporter import PrometheusMiddleware
 
+import server
 import settings
 from api.handlers import user_router
 from api.login_handlers import login_router
+from api.middleware import ReadYourWritesMiddleware
+from api.responses import default_response_class
 from api.service import service_router
+from db.session import async_session
+from db.session import replica_set
+from hashing import hashing_pool
+from loop_lag import monitor_event_loop_lag
+from revocation import revocation_list
 
 
 sentry_sdk.init("https://055a6010a95e4051b617f1463c38190e@app.glitchtip.com/10720")
 
-app = FastAPI(title="university")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    lag_monitor = None
+    if settings.EVENT_LOOP_LAG_INTERVAL_SECONDS > 0:
+        lag_monitor = asyncio.create_task(
+            monitor_event_loop_lag(settings.EVENT_LOOP_LAG_INTERVAL_SECONDS)
+        )
+    if replica_set is not None:
+        await replica_set.refresh_lag()
+        replica_set.start_monitor()
+    revocation_list.start_sync(async_session)
+    yield
+    await revocation_list.stop_sync()
+    if lag_monitor is not None:
+        lag_monitor.cancel()
+    if replica_set is not None:
+        await replica_set.stop_monitor()
+    hashing_pool.shutdown()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+app = FastAPI(title="university", lifespan=lifespan)
 
 app.add_middleware(PrometheusMiddleware)
+if replica_set is not None:
+    app.add_middleware(ReadYourWritesMiddleware)
 app.add_route("/metrics", handle_metrics)
 
-main_api_router = APIRouter()
+main_api_router = APIRouter(default_response_class=default_response_class())
 
 main_api_router.include_router(user_router, prefix="/user", tags=["User"])
 main_api_router.include_router(login_router, prefix="/login", tags=["Login"])
@@ -27,4 +64,4 @@ main_api_router.include_router(service_router, prefix="/service", tags=["Service
 app.include_router(main_api_router)
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=settings.APP_PORT)
+    server.main()
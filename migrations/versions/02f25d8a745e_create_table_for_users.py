@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 02f25d8a745e
-Revises: 8b4a84eb4b1a
-Create Date: 2025-03-17 19:29:32.876077
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '02f25d8a745e'
-down_revision: Union[str, None] = '8b4a84eb4b1a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
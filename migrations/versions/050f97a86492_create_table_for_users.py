@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 050f97a86492
-Revises: e250c8cca3cd
-Create Date: 2025-03-17 17:36:49.171659
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '050f97a86492'
-down_revision: Union[str, None] = 'e250c8cca3cd'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
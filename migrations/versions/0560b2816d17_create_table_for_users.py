@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 0560b2816d17
-Revises: 02f25d8a745e
-Create Date: 2025-03-17 19:30:21.503778
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '0560b2816d17'
-down_revision: Union[str, None] = '02f25d8a745e'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
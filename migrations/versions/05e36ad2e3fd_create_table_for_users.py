@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 05e36ad2e3fd
-Revises: db666dd1660a
-Create Date: 2025-03-15 18:48:02.208403
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '05e36ad2e3fd'
-down_revision: Union[str, None] = 'db666dd1660a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: 06a68941a0e9
-Revises: 11e6e29ebd66
-Create Date: 2025-03-07 18:23:11.970873
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "06a68941a0e9"
-down_revision: Union[str, None] = "11e6e29ebd66"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
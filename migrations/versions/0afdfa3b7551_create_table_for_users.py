@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 0afdfa3b7551
-Revises: ac805848980a
-Create Date: 2025-03-15 19:01:45.897063
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '0afdfa3b7551'
-down_revision: Union[str, None] = 'ac805848980a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 134b3c193396
-Revises: e4c751f1c1af
-Create Date: 2025-03-15 18:01:36.340965
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '134b3c193396'
-down_revision: Union[str, None] = 'e4c751f1c1af'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 166977193417
-Revises: 9e1bfa23a8ba
-Create Date: 2025-03-19 18:26:51.695094
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '166977193417'
-down_revision: Union[str, None] = '9e1bfa23a8ba'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
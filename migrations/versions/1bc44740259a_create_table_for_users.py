@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 1bc44740259a
-Revises: dfca431e7e20
-Create Date: 2025-03-15 13:39:18.769157
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '1bc44740259a'
-down_revision: Union[str, None] = 'dfca431e7e20'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 1c3e51779898
-Revises: da7f5a7d4b48
-Create Date: 2025-03-15 20:09:47.936323
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '1c3e51779898'
-down_revision: Union[str, None] = 'da7f5a7d4b48'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 1fc101adae51
-Revises: 8b99e8c7c11b
-Create Date: 2025-03-15 18:17:07.590345
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '1fc101adae51'
-down_revision: Union[str, None] = '8b99e8c7c11b'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 247c61912f19
-Revises: 422ddf97a2c6
-Create Date: 2025-03-19 18:19:51.550393
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '247c61912f19'
-down_revision: Union[str, None] = '422ddf97a2c6'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 24e04678dd5e
-Revises: 1bc44740259a
-Create Date: 2025-03-15 13:40:29.202093
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '24e04678dd5e'
-down_revision: Union[str, None] = '1bc44740259a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 2bca26393b75
-Revises: 1bea42000298
-Create Date: 2025-03-19 18:45:09.370405
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '2bca26393b75'
-down_revision: Union[str, None] = '1bea42000298'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 2d19e4f1a598
-Revises: fc3847ff5ef1
-Create Date: 2025-03-15 22:11:38.505401
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '2d19e4f1a598'
-down_revision: Union[str, None] = 'fc3847ff5ef1'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 2e4f5bb449b5
-Revises: 987899f8fc63
-Create Date: 2025-03-17 17:29:20.420141
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '2e4f5bb449b5'
-down_revision: Union[str, None] = '987899f8fc63'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 30da4d553c9e
-Revises: 408c339e056f
-Create Date: 2025-03-17 19:28:23.392246
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '30da4d553c9e'
-down_revision: Union[str, None] = '408c339e056f'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
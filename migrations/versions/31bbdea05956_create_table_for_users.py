@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 31bbdea05956
-Revises: 05e36ad2e3fd
-Create Date: 2025-03-15 18:54:37.913063
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '31bbdea05956'
-down_revision: Union[str, None] = '05e36ad2e3fd'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 31e375d0eeea
-Revises: abe34115faea
-Create Date: 2025-03-17 17:08:57.426072
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '31e375d0eeea'
-down_revision: Union[str, None] = 'abe34115faea'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""add roles
-
-Revision ID: 35918d11815c
-Revises: c63aad81b9ab
-Create Date: 2025-03-16 12:39:51.881307
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '35918d11815c'
-down_revision: Union[str, None] = 'c63aad81b9ab'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 38d8a65b1f35
-Revises: 1c3e51779898
-Create Date: 2025-03-15 20:11:03.797969
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '38d8a65b1f35'
-down_revision: Union[str, None] = '1c3e51779898'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
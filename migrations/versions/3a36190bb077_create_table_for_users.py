@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: 3a36190bb077
-Revises: eb5b693a7e04
-Create Date: 2025-03-07 17:25:37.356370
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "3a36190bb077"
-down_revision: Union[str, None] = "eb5b693a7e04"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 3d637e93ac9b
-Revises: 600c7de83968
-Create Date: 2025-03-19 18:06:22.411051
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '3d637e93ac9b'
-down_revision: Union[str, None] = '600c7de83968'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,40 +0,0 @@
-"""create table for users
-
-Revision ID: 3d9953a63cc1
-Revises:
-Create Date: 2025-03-06 17:22:42.365776
-
-"""
-from typing import Sequence
-from typing import Union
-
-import sqlalchemy as sa
-from alembic import op
-
-
-# revision identifiers, used by Alembic.
-revision: str = "3d9953a63cc1"
-down_revision: Union[str, None] = None
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.create_table(
-        "users",
-        sa.Column("user_id", sa.UUID(), nullable=False),
-        sa.Column("name", sa.String(), nullable=False),
-        sa.Column("surname", sa.String(), nullable=False),
-        sa.Column("email", sa.String(), nullable=False),
-        sa.Column("is_active", sa.Boolean(), nullable=True),
-        sa.PrimaryKeyConstraint("user_id"),
-        sa.UniqueConstraint("email"),
-    )
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_table("users")
-    # ### end Alembic commands ###
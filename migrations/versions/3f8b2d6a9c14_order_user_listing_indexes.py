@@ -0,0 +1,85 @@
+"""order user listing indexes
+
+Revision ID: 3f8b2d6a9c14
+Revises: c7a3e9f15d20
+Create Date: 2026-10-18 18:05:31.604417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b2d6a9c14'
+down_revision: Union[str, None] = 'c7a3e9f15d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ROLE_INDEXES = {
+    'ix_users_user_id_role_user': 'ROLE_PORTAL_USER',
+    'ix_users_user_id_role_admin': 'ROLE_PORTAL_ADMIN',
+    'ix_users_user_id_role_superadmin': 'ROLE_PORTAL_SUPERADMIN',
+}
+
+
+def upgrade() -> None:
+    # The GIN and text_pattern_ops indexes find matches but not in the order
+    # GET /user/list pages through them. They are replaced by indexes that
+    # return matches in page order: (column, user_id) in the "C" collation
+    # for the prefix filters, and one partial user_id index per role.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_name_user_id',
+            'users',
+            [sa.text('name COLLATE "C"'), 'user_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_email_user_id',
+            'users',
+            [sa.text('email COLLATE "C"'), 'user_id'],
+            postgresql_concurrently=True,
+        )
+        for index_name, role in ROLE_INDEXES.items():
+            op.create_index(
+                index_name,
+                'users',
+                ['user_id'],
+                postgresql_where=sa.text(f"roles @> '{{{role}}}'"),
+                postgresql_concurrently=True,
+            )
+        op.drop_index('ix_users_email_prefix', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_name_prefix', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_roles', table_name='users', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_roles',
+            'users',
+            ['roles'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_name_prefix',
+            'users',
+            ['name'],
+            postgresql_ops={'name': 'text_pattern_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_email_prefix',
+            'users',
+            ['email'],
+            postgresql_ops={'email': 'text_pattern_ops'},
+            postgresql_concurrently=True,
+        )
+        for index_name in reversed(ROLE_INDEXES):
+            op.drop_index(index_name, table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_email_user_id', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_name_user_id', table_name='users', postgresql_concurrently=True)
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 408c339e056f
-Revises: ffcaec9f0402
-Create Date: 2025-03-17 19:27:31.414644
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '408c339e056f'
-down_revision: Union[str, None] = 'ffcaec9f0402'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
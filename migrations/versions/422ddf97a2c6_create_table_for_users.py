@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 422ddf97a2c6
-Revises: dc07737fd811
-Create Date: 2025-03-19 18:18:03.382969
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '422ddf97a2c6'
-down_revision: Union[str, None] = 'dc07737fd811'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
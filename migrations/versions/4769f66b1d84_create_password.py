@@ -1,30 +0,0 @@
-"""create password
-
-Revision ID: 4769f66b1d84
-Revises: a9219067a3a6
-Create Date: 2025-03-13 18:32:58.777304
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4769f66b1d84'
-down_revision: Union[str, None] = 'a9219067a3a6'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('users', sa.Column('hashed_password', sa.String(), nullable=False))
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_column('users', 'hashed_password')
-    # ### end Alembic commands ###
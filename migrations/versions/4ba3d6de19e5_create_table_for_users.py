@@ -1,27 +0,0 @@
-"""create table for users
-
-Revision ID: 4ba3d6de19e5
-Revises: 418d363b108b
-Create Date: 2025-03-07 17:37:11.494617
-
-"""
-from typing import Sequence
-from typing import Union
-
-# revision identifiers, used by Alembic.
-revision: str = "4ba3d6de19e5"
-down_revision: Union[str, None] = "418d363b108b"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 4eb673d2bce7
-Revises: 31bbdea05956
-Create Date: 2025-03-15 18:56:44.958079
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4eb673d2bce7'
-down_revision: Union[str, None] = '31bbdea05956'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
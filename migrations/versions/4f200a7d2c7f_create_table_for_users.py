@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 4f200a7d2c7f
-Revises: c32602f329b5
-Create Date: 2025-03-19 17:57:34.508962
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4f200a7d2c7f'
-down_revision: Union[str, None] = 'c32602f329b5'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 4f59a93d18aa
-Revises: 6e9f27785b17
-Create Date: 2025-03-15 20:16:26.392668
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4f59a93d18aa'
-down_revision: Union[str, None] = '6e9f27785b17'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
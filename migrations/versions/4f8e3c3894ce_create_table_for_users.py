@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 4f8e3c3894ce
-Revises: 0afdfa3b7551
-Create Date: 2025-03-15 20:03:55.531834
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4f8e3c3894ce'
-down_revision: Union[str, None] = '0afdfa3b7551'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
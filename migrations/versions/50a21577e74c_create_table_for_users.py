@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 50a21577e74c
-Revises: 050f97a86492
-Create Date: 2025-03-17 17:37:12.729051
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '50a21577e74c'
-down_revision: Union[str, None] = '050f97a86492'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 54f3d074d176
-Revises: 166977193417
-Create Date: 2025-03-19 18:27:27.397662
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '54f3d074d176'
-down_revision: Union[str, None] = '166977193417'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
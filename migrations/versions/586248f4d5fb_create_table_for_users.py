@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: 586248f4d5fb
-Revises: cb6a178e7d9d
-Create Date: 2025-03-07 17:20:23.751244
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "586248f4d5fb"
-down_revision: Union[str, None] = "cb6a178e7d9d"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 5bb9cf39cfae
-Revises: 4f200a7d2c7f
-Create Date: 2025-03-19 17:59:42.918243
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '5bb9cf39cfae'
-down_revision: Union[str, None] = '4f200a7d2c7f'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
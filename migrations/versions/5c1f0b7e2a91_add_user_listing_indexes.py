@@ -0,0 +1,59 @@
+"""add user listing indexes
+
+Revision ID: 5c1f0b7e2a91
+Revises: e700e53092ab
+Create Date: 2026-10-18 10:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1f0b7e2a91'
+down_revision: Union[str, None] = 'e700e53092ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; building these on a large
+    # users table must not block writes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_is_active_user_id',
+            'users',
+            ['is_active', 'user_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_roles',
+            'users',
+            ['roles'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_name_prefix',
+            'users',
+            ['name'],
+            postgresql_ops={'name': 'text_pattern_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_email_prefix',
+            'users',
+            ['email'],
+            postgresql_ops={'email': 'text_pattern_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_email_prefix', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_name_prefix', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_roles', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_is_active_user_id', table_name='users', postgresql_concurrently=True)
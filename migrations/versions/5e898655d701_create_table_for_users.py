@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 5e898655d701
-Revises: 2d19e4f1a598
-Create Date: 2025-03-15 22:12:23.883549
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '5e898655d701'
-down_revision: Union[str, None] = '2d19e4f1a598'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 600c7de83968
-Revises: 5bb9cf39cfae
-Create Date: 2025-03-19 18:02:21.598157
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '600c7de83968'
-down_revision: Union[str, None] = '5bb9cf39cfae'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: 629d642929b5
-Revises: 75e8d9e5291f
-Create Date: 2025-03-07 18:15:55.563537
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "629d642929b5"
-down_revision: Union[str, None] = "75e8d9e5291f"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 64cf04886625
-Revises: e045c86917a4
-Create Date: 2025-03-17 19:24:26.844514
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '64cf04886625'
-down_revision: Union[str, None] = 'e045c86917a4'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 6a9a16a90f58
-Revises: 73297318fd2a
-Create Date: 2025-03-17 17:24:42.169155
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '6a9a16a90f58'
-down_revision: Union[str, None] = '73297318fd2a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
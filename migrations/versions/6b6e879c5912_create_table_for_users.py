@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 6b6e879c5912
-Revises: daba4c6f75c2
-Create Date: 2025-03-15 19:00:31.898432
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '6b6e879c5912'
-down_revision: Union[str, None] = 'daba4c6f75c2'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 6e9f27785b17
-Revises: d56c3a58e965
-Create Date: 2025-03-15 20:14:45.794641
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '6e9f27785b17'
-down_revision: Union[str, None] = 'd56c3a58e965'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 72d4a74f68d8
-Revises: cb5934ce0a56
-Create Date: 2025-03-15 22:15:52.915419
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '72d4a74f68d8'
-down_revision: Union[str, None] = 'cb5934ce0a56'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 73297318fd2a
-Revises: 50f62fd02efe
-Create Date: 2025-03-17 17:24:23.598478
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '73297318fd2a'
-down_revision: Union[str, None] = '50f62fd02efe'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
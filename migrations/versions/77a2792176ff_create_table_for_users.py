@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 77a2792176ff
-Revises: af7c32d28218
-Create Date: 2025-03-17 17:23:38.675783
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '77a2792176ff'
-down_revision: Union[str, None] = 'af7c32d28218'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
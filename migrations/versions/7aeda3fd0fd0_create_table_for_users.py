@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 7aeda3fd0fd0
-Revises: a51660dd4c41
-Create Date: 2025-03-15 14:03:01.719629
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '7aeda3fd0fd0'
-down_revision: Union[str, None] = 'a51660dd4c41'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
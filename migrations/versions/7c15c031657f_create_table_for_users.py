@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 7c15c031657f
-Revises: c9d34b9fe61f
-Create Date: 2025-03-17 19:42:03.538506
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '7c15c031657f'
-down_revision: Union[str, None] = 'c9d34b9fe61f'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: 7cc582d7e620
-Revises: bca88f28ad08
-Create Date: 2025-03-07 18:15:19.870360
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "7cc582d7e620"
-down_revision: Union[str, None] = "bca88f28ad08"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 7e1255263653
-Revises: cbbd68865db2
-Create Date: 2025-03-15 13:46:05.714951
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '7e1255263653'
-down_revision: Union[str, None] = 'cbbd68865db2'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
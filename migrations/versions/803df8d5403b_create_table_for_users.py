@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 803df8d5403b
-Revises: 2e4f5bb449b5
-Create Date: 2025-03-17 17:33:22.936951
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '803df8d5403b'
-down_revision: Union[str, None] = '2e4f5bb449b5'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
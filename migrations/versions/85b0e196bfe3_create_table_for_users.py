@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 85b0e196bfe3
-Revises: 50a21577e74c
-Create Date: 2025-03-17 17:39:33.271328
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '85b0e196bfe3'
-down_revision: Union[str, None] = '50a21577e74c'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 8697f0b27e68
-Revises: 2bca26393b75
-Create Date: 2025-03-19 19:31:49.365304
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '8697f0b27e68'
-down_revision: Union[str, None] = '2bca26393b75'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 8b4a84eb4b1a
-Revises: 30da4d553c9e
-Create Date: 2025-03-17 19:28:35.556936
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '8b4a84eb4b1a'
-down_revision: Union[str, None] = '30da4d553c9e'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
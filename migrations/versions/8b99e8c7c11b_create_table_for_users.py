@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 8b99e8c7c11b
-Revises: 134b3c193396
-Create Date: 2025-03-15 18:11:22.271734
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '8b99e8c7c11b'
-down_revision: Union[str, None] = '134b3c193396'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
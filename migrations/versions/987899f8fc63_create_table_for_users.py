@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 987899f8fc63
-Revises: 069403c164ff
-Create Date: 2025-03-17 17:29:07.951123
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '987899f8fc63'
-down_revision: Union[str, None] = '069403c164ff'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
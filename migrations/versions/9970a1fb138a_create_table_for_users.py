@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: 9970a1fb138a
-Revises: 7b32a45af37f
-Create Date: 2025-03-07 16:58:41.533476
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "9970a1fb138a"
-down_revision: Union[str, None] = "7b32a45af37f"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
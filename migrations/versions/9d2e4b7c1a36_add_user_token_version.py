@@ -0,0 +1,31 @@
+"""add user token version
+
+Revision ID: 9d2e4b7c1a36
+Revises: 5c1f0b7e2a91
+Create Date: 2026-10-18 14:03:11.502318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2e4b7c1a36'
+down_revision: Union[str, None] = '5c1f0b7e2a91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A constant server default is stored in the catalog, so adding the
+    # column does not rewrite the table.
+    op.add_column(
+        'users',
+        sa.Column('token_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: 9e1bfa23a8ba
-Revises: 247c61912f19
-Create Date: 2025-03-19 18:25:13.019156
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '9e1bfa23a8ba'
-down_revision: Union[str, None] = '247c61912f19'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: a51660dd4c41
-Revises: 7e1255263653
-Create Date: 2025-03-15 13:49:18.116484
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'a51660dd4c41'
-down_revision: Union[str, None] = '7e1255263653'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: a5a6fa0ace4d
-Revises: 72d4a74f68d8
-Create Date: 2025-03-15 22:17:44.755275
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'a5a6fa0ace4d'
-down_revision: Union[str, None] = '72d4a74f68d8'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
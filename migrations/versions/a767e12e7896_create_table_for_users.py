@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: a767e12e7896
-Revises: 0560b2816d17
-Create Date: 2025-03-17 19:31:31.503019
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'a767e12e7896'
-down_revision: Union[str, None] = '0560b2816d17'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
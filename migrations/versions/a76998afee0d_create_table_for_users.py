@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: a76998afee0d
-Revises: a5a6fa0ace4d
-Create Date: 2025-03-16 12:29:38.692789
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
-
-# revision identifiers, used by Alembic.
-revision: str = 'a76998afee0d'
-down_revision: Union[str, None] = 'a5a6fa0ace4d'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('users', sa.Column('roles', postgresql.ARRAY(sa.String()), nullable=False))
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_column('users', 'roles')
-    # ### end Alembic commands ###
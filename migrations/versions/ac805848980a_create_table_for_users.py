@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: ac805848980a
-Revises: 6b6e879c5912
-Create Date: 2025-03-15 19:01:06.092661
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ac805848980a'
-down_revision: Union[str, None] = '6b6e879c5912'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: ad60ad51e9cd
-Revises: 4f8e3c3894ce
-Create Date: 2025-03-15 20:04:36.272790
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ad60ad51e9cd'
-down_revision: Union[str, None] = '4f8e3c3894ce'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
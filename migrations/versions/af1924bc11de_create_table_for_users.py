@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: af1924bc11de
-Revises: 06a68941a0e9
-Create Date: 2025-03-08 18:58:57.138486
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "af1924bc11de"
-down_revision: Union[str, None] = "06a68941a0e9"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
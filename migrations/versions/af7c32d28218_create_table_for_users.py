@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: af7c32d28218
-Revises: cfd3cc0c88c5
-Create Date: 2025-03-17 17:23:05.443937
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'af7c32d28218'
-down_revision: Union[str, None] = 'cfd3cc0c88c5'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
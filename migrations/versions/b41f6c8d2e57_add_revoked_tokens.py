@@ -0,0 +1,41 @@
+"""add revoked tokens
+
+Revision ID: b41f6c8d2e57
+Revises: 9d2e4b7c1a36
+Create Date: 2026-10-18 15:21:47.093164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f6c8d2e57'
+down_revision: Union[str, None] = '9d2e4b7c1a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'revoked_tokens',
+        sa.Column('jti', sa.String(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            'revoked_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('jti'),
+    )
+    op.create_index(
+        'ix_revoked_tokens_revoked_at', 'revoked_tokens', ['revoked_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_revoked_tokens_revoked_at', table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
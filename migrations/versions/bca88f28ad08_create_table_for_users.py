@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: bca88f28ad08
-Revises: 0a4963ccd6df
-Create Date: 2025-03-07 18:08:30.121840
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "bca88f28ad08"
-down_revision: Union[str, None] = "0a4963ccd6df"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
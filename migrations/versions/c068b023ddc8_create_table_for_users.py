@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: c068b023ddc8
-Revises: 7aeda3fd0fd0
-Create Date: 2025-03-15 14:05:02.306806
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'c068b023ddc8'
-down_revision: Union[str, None] = '7aeda3fd0fd0'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
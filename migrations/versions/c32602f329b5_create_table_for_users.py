@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: c32602f329b5
-Revises: ca818ef5a9f2
-Create Date: 2025-03-19 17:51:31.067622
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'c32602f329b5'
-down_revision: Union[str, None] = 'ca818ef5a9f2'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: c4af877ac44c
-Revises: 51bcb52e2e8f
-Create Date: 2025-03-07 17:08:06.862071
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "c4af877ac44c"
-down_revision: Union[str, None] = "51bcb52e2e8f"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -0,0 +1,48 @@
+"""cover auth lookup by email
+
+Revision ID: c7a3e9f15d20
+Revises: b41f6c8d2e57
+Create Date: 2026-10-18 16:40:05.336971
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a3e9f15d20'
+down_revision: Union[str, None] = 'b41f6c8d2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+AUTH_COLUMNS = ['user_id', 'hashed_password', 'roles', 'is_active', 'token_version']
+
+
+def upgrade() -> None:
+    # Emails are normalised to lowercase from now on. This fails on the
+    # unique constraint if two users differ only in the case of their email;
+    # such accounts have to be merged or renamed by hand first.
+    op.execute('UPDATE users SET email = lower(email) WHERE email <> lower(email)')
+    # The unique btree on email is replaced by one that also includes the
+    # columns the auth lookup reads, so it becomes an index-only scan. It is
+    # built next to the old one without blocking writes, then takes its name
+    # so unique violations keep reporting users_email_key.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'users_email_auth_key',
+            'users',
+            ['email'],
+            unique=True,
+            postgresql_include=AUTH_COLUMNS,
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+    op.execute('ALTER INDEX users_email_auth_key RENAME TO users_email_key')
+
+
+def downgrade() -> None:
+    op.drop_index('users_email_key', table_name='users')
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
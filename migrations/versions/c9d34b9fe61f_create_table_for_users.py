@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: c9d34b9fe61f
-Revises: f529c89c32b6
-Create Date: 2025-03-17 19:38:35.960430
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'c9d34b9fe61f'
-down_revision: Union[str, None] = 'f529c89c32b6'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: ca818ef5a9f2
-Revises: 7c15c031657f
-Create Date: 2025-03-18 21:16:31.640485
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ca818ef5a9f2'
-down_revision: Union[str, None] = '7c15c031657f'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: cb5934ce0a56
-Revises: 5e898655d701
-Create Date: 2025-03-15 22:15:16.164899
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'cb5934ce0a56'
-down_revision: Union[str, None] = '5e898655d701'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: cb6a178e7d9d
-Revises: c4af877ac44c
-Create Date: 2025-03-07 17:13:41.710352
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "cb6a178e7d9d"
-down_revision: Union[str, None] = "c4af877ac44c"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: cbbd68865db2
-Revises: 24e04678dd5e
-Create Date: 2025-03-15 13:42:12.067240
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'cbbd68865db2'
-down_revision: Union[str, None] = '24e04678dd5e'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: cfd3cc0c88c5
-Revises: e11dd65caacd
-Create Date: 2025-03-17 17:10:39.142008
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'cfd3cc0c88c5'
-down_revision: Union[str, None] = 'e11dd65caacd'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: d03d7e16136f
-Revises: 3d637e93ac9b
-Create Date: 2025-03-19 18:06:50.475646
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'd03d7e16136f'
-down_revision: Union[str, None] = '3d637e93ac9b'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: d43a46a2655d
-Revises: 4769f66b1d84
-Create Date: 2025-03-15 13:34:08.290241
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'd43a46a2655d'
-down_revision: Union[str, None] = '4769f66b1d84'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: d56c3a58e965
-Revises: 38d8a65b1f35
-Create Date: 2025-03-15 20:13:57.121374
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'd56c3a58e965'
-down_revision: Union[str, None] = '38d8a65b1f35'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: d62aeff77864
-Revises: 4ba3d6de19e5
-Create Date: 2025-03-07 17:42:25.836338
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "d62aeff77864"
-down_revision: Union[str, None] = "4ba3d6de19e5"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
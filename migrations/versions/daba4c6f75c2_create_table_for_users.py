@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: daba4c6f75c2
-Revises: f3b468b81acb
-Create Date: 2025-03-15 18:59:35.418663
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'daba4c6f75c2'
-down_revision: Union[str, None] = 'f3b468b81acb'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
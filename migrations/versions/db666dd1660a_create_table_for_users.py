@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: db666dd1660a
-Revises: 1fc101adae51
-Create Date: 2025-03-15 18:34:25.890362
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'db666dd1660a'
-down_revision: Union[str, None] = '1fc101adae51'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: dc07737fd811
-Revises: d03d7e16136f
-Create Date: 2025-03-19 18:12:47.828113
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'dc07737fd811'
-down_revision: Union[str, None] = 'd03d7e16136f'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
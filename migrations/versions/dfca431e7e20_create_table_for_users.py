@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: dfca431e7e20
-Revises: d43a46a2655d
-Create Date: 2025-03-15 13:37:43.189911
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'dfca431e7e20'
-down_revision: Union[str, None] = 'd43a46a2655d'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: e045c86917a4
-Revises: 85b0e196bfe3
-Create Date: 2025-03-17 17:39:59.212224
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e045c86917a4'
-down_revision: Union[str, None] = '85b0e196bfe3'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: e11dd65caacd
-Revises: 31e375d0eeea
-Create Date: 2025-03-17 17:10:14.835079
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e11dd65caacd'
-down_revision: Union[str, None] = '31e375d0eeea'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: e250c8cca3cd
-Revises: 803df8d5403b
-Create Date: 2025-03-17 17:34:32.690059
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e250c8cca3cd'
-down_revision: Union[str, None] = '803df8d5403b'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
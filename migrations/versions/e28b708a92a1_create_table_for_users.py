@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: e28b708a92a1
-Revises: ed2be1f5dfa0
-Create Date: 2025-03-17 19:25:17.145298
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e28b708a92a1'
-down_revision: Union[str, None] = 'ed2be1f5dfa0'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: e4bb40869253
-Revises: 4eb673d2bce7
-Create Date: 2025-03-15 18:57:42.654068
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e4bb40869253'
-down_revision: Union[str, None] = '4eb673d2bce7'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: e4c751f1c1af
-Revises: c068b023ddc8
-Create Date: 2025-03-15 17:59:45.996347
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e4c751f1c1af'
-down_revision: Union[str, None] = 'c068b023ddc8'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
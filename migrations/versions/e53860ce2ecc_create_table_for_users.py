@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: e53860ce2ecc
-Revises: a48454af72bc
-Create Date: 2025-03-08 19:16:07.858951
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "e53860ce2ecc"
-down_revision: Union[str, None] = "a48454af72bc"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
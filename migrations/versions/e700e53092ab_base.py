@@ -1,7 +1,7 @@
 """base
 
 Revision ID: e700e53092ab
-Revises: 8697f0b27e68
+Revises:
 Create Date: 2025-03-20 17:33:21.924657
 
 """
@@ -9,22 +9,33 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
 revision: str = 'e700e53092ab'
-down_revision: Union[str, None] = '8697f0b27e68'
+down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# The revisions before this one were squashed into it. Databases already at
+# this revision or later are unaffected; db.migrate restamps databases at a
+# squashed revision onto it.
 def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    op.create_table(
+        'users',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('surname', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('roles', postgresql.ARRAY(sa.String()), nullable=False),
+        sa.PrimaryKeyConstraint('user_id'),
+        sa.UniqueConstraint('email'),
+    )
 
 
 def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    op.drop_table('users')
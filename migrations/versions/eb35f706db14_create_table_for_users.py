@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: eb35f706db14
-Revises: 586248f4d5fb
-Create Date: 2025-03-07 17:22:13.690781
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "eb35f706db14"
-down_revision: Union[str, None] = "586248f4d5fb"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: ed2be1f5dfa0
-Revises: 64cf04886625
-Create Date: 2025-03-17 19:24:49.651353
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ed2be1f5dfa0'
-down_revision: Union[str, None] = '64cf04886625'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: f1133c4d5c22
-Revises: e28b708a92a1
-Create Date: 2025-03-17 19:26:57.136937
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f1133c4d5c22'
-down_revision: Union[str, None] = 'e28b708a92a1'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: f3b468b81acb
-Revises: e4bb40869253
-Create Date: 2025-03-15 18:58:44.579062
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f3b468b81acb'
-down_revision: Union[str, None] = 'e4bb40869253'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,28 +0,0 @@
-"""create table for users
-
-Revision ID: f4d77284a651
-Revises: 3d9953a63cc1
-Create Date: 2025-03-07 16:51:23.306532
-
-"""
-from typing import Sequence
-from typing import Union
-
-
-# revision identifiers, used by Alembic.
-revision: str = "f4d77284a651"
-down_revision: Union[str, None] = "3d9953a63cc1"
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: f529c89c32b6
-Revises: a767e12e7896
-Create Date: 2025-03-17 19:36:15.577293
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f529c89c32b6'
-down_revision: Union[str, None] = 'a767e12e7896'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
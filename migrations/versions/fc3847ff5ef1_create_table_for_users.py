@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: fc3847ff5ef1
-Revises: 4f59a93d18aa
-Create Date: 2025-03-15 22:10:32.564525
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'fc3847ff5ef1'
-down_revision: Union[str, None] = '4f59a93d18aa'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
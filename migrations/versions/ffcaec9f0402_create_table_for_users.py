@@ -1,30 +0,0 @@
-"""create table for users
-
-Revision ID: ffcaec9f0402
-Revises: f1133c4d5c22
-Create Date: 2025-03-17 19:27:10.798554
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ffcaec9f0402'
-down_revision: Union[str, None] = 'f1133c4d5c22'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -0,0 +1,168 @@
+import asyncio
+import hashlib
+import math
+import time
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from logging import getLogger
+from typing import Optional
+
+from prometheus_client import Counter
+
+import settings
+from cache import TTLCache
+from db.dals import RevokedTokenDAL
+from db.session import after_commit
+
+
+logger = getLogger(__name__)
+
+REVOCATION_CHECKS = Counter(
+    "token_revocation_checks_total", "Token revocation checks by outcome", ["result"]
+)
+
+# Deltas are read from a little before the previous sync, so rows from
+# transactions that committed late, or small clock skew between the app and
+# the database, are not missed. Re-adding a jti is harmless.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        # Double hashing: k positions from the two halves of one digest.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class RevocationList:
+    """In-process view of the revoked_tokens table.
+
+    The Bloom filter holds every unexpired revoked jti, so the check for a
+    token that was never revoked never leaves the process. A filter hit is
+    confirmed against the table once and the answer is kept in an exact
+    cache. The filter follows the table through periodic deltas and is
+    rebuilt from scratch now and then to drop expired tokens.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._confirmed = TTLCache(
+            name="revoked_tokens",
+            maxsize=capacity,
+            ttl=settings.REVOCATION_REBUILD_INTERVAL_SECONDS,
+        )
+        self._revoked_locally: set[str] = set()
+        self._synced_until: Optional[datetime] = None
+        self._sync: Optional[asyncio.Task] = None
+
+    def add(self, jti: str) -> None:
+        self._filter.add(jti)
+        self._confirmed.set(jti, True)
+        self._revoked_locally.add(jti)
+
+    def clear(self) -> None:
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        self._confirmed.clear()
+        self._revoked_locally.clear()
+        self._synced_until = None
+
+    async def is_revoked(self, jti: str, session) -> bool:
+        if jti not in self._filter:
+            REVOCATION_CHECKS.labels(result="not_revoked").inc()
+            return False
+        revoked = self._confirmed.get(jti)
+        if revoked is None:
+            revoked = await RevokedTokenDAL(session).is_revoked(jti)
+            self._confirmed.set(jti, revoked)
+        REVOCATION_CHECKS.labels(
+            result="revoked" if revoked else "false_positive"
+        ).inc()
+        return revoked
+
+    async def revoke(self, jti: str, expires_at: datetime, session) -> None:
+        await RevokedTokenDAL(session).revoke(jti, expires_at)
+        after_commit(session, lambda: self.add(jti))
+
+    async def rebuild(self, session_factory) -> None:
+        started_at = datetime.now(timezone.utc)
+        self._revoked_locally.clear()
+        async with session_factory() as session:
+            async with session.begin():
+                dal = RevokedTokenDAL(session)
+                await dal.delete_expired()
+                rows = await dal.get_unexpired()
+        revoked = {jti for jti, _ in rows} | self._revoked_locally
+        bloom = BloomFilter(max(self.capacity, 2 * len(revoked)), self.error_rate)
+        for jti in revoked:
+            bloom.add(jti)
+        self._filter = bloom
+        self._synced_until = started_at
+
+    async def sync(self, session_factory) -> None:
+        started_at = datetime.now(timezone.utc)
+        async with session_factory() as session:
+            async with session.begin():
+                rows = await RevokedTokenDAL(session).get_revoked_since(
+                    self._synced_until - SYNC_OVERLAP
+                )
+        for jti, _ in rows:
+            self._filter.add(jti)
+            self._confirmed.set(jti, True)
+        self._synced_until = started_at
+
+    async def _sync_forever(self, session_factory) -> None:
+        rebuilt_at = None
+        while True:
+            try:
+                if (
+                    rebuilt_at is None
+                    or time.monotonic() - rebuilt_at
+                    >= settings.REVOCATION_REBUILD_INTERVAL_SECONDS
+                ):
+                    await self.rebuild(session_factory)
+                    rebuilt_at = time.monotonic()
+                else:
+                    await self.sync(session_factory)
+            except Exception as err:
+                logger.warning("Could not sync revoked tokens: %s", err)
+            await asyncio.sleep(settings.REVOCATION_SYNC_INTERVAL_SECONDS)
+
+    def start_sync(self, session_factory) -> None:
+        if self._sync is None:
+            self._sync = asyncio.create_task(self._sync_forever(session_factory))
+
+    async def stop_sync(self) -> None:
+        if self._sync is not None:
+            self._sync.cancel()
+            try:
+                await self._sync
+            except asyncio.CancelledError:
+                pass
+            self._sync = None
+
+
+revocation_list = RevocationList(
+    capacity=settings.REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+)
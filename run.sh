@@ -1,3 +1,3 @@
 #!/bin/bash
 sleep 10
-alembic upgrade heads
+python -m db.migrate
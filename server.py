@@ -0,0 +1,91 @@
+import argparse
+import importlib.util
+import os
+import shutil
+
+import uvicorn
+
+import settings
+
+
+RUNTIME_PROFILES = ("default", "tuned")
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def runtime_options(profile: str) -> dict:
+    if profile not in RUNTIME_PROFILES:
+        raise ValueError(f"Unknown runtime profile: {profile}")
+    if profile == "default":
+        return {}
+    # The idle keep-alive should outlast the load balancer's, otherwise it
+    # may reuse a connection uvicorn is closing. Requests over
+    # limit_concurrency get an immediate 503 instead of queueing for a
+    # database connection until pool_timeout.
+    return {
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+        "timeout_keep_alive": settings.SERVER_KEEPALIVE_SECONDS,
+        "backlog": settings.SERVER_BACKLOG,
+        "limit_concurrency": settings.SERVER_LIMIT_CONCURRENCY or None,
+    }
+
+
+def worker_count(workers: int = 0) -> int:
+    return workers or os.cpu_count() or 1
+
+
+def prepare_metrics_dir(path: str) -> None:
+    # prometheus_client switches to multiprocess mode at import time when
+    # PROMETHEUS_MULTIPROC_DIR is set, so it has to be in the environment
+    # the workers are spawned with. Files left by a previous run would be
+    # summed into the new one.
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+
+
+def run(
+    workers: int = settings.SERVER_WORKERS,
+    port: int = settings.APP_PORT,
+    profile: str = settings.SERVER_RUNTIME_PROFILE,
+) -> None:
+    # Workers are spawned processes that import main:app themselves, so each
+    # one creates its own engines, connection pools, hashing pool and
+    # in-process caches; see SERVER_WORKERS for what that costs.
+    # SIGHUP restarts the workers one by one and SIGTERM drains them.
+    workers = worker_count(workers)
+    os.environ["SERVER_WORKERS"] = str(workers)
+    if workers > 1:
+        prepare_metrics_dir(settings.SERVER_METRICS_DIR)
+    options = runtime_options(profile)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        **options,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the university API")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.SERVER_WORKERS,
+        help="Number of worker processes, 0 for one per CPU",
+    )
+    parser.add_argument("--port", type=int, default=settings.APP_PORT)
+    parser.add_argument(
+        "--profile", choices=RUNTIME_PROFILES, default=settings.SERVER_RUNTIME_PROFILE
+    )
+    args = parser.parse_args()
+    run(workers=args.workers, port=args.port, profile=args.profile)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
+
+from prometheus_client import Counter
+from prometheus_client import Histogram
+
+
+SINGLE_FLIGHT_COALESCED = Counter(
+    "single_flight_coalesced_total",
+    "Callers that shared another caller's in-flight call",
+    ["operation"],
+)
+SINGLE_FLIGHT_CALLERS = Histogram(
+    "single_flight_callers",
+    "Callers served by one in-flight call",
+    ["operation"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+
+class _Flight:
+    def __init__(self):
+        self.future = asyncio.get_running_loop().create_future()
+        self.callers = 1
+
+
+class SingleFlight:
+    """Lets concurrent callers with the same key share one call.
+
+    The first caller (the leader) runs the call; callers that arrive while
+    it is in flight wait for its result instead of running their own. If
+    the leader is cancelled, waiting callers run the call themselves.
+    """
+
+    def __init__(self, operation: str, enabled: bool = True):
+        self.operation = operation
+        self.enabled = enabled
+        self._flights: dict[Hashable, _Flight] = {}
+        self._coalesced = SINGLE_FLIGHT_COALESCED.labels(operation=operation)
+        self._callers = SINGLE_FLIGHT_CALLERS.labels(operation=operation)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.enabled:
+            return await call()
+        flight = self._flights.get(key)
+        if flight is not None:
+            return await self._wait(flight, call)
+        flight = self._flights[key] = _Flight()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            flight.future.cancel()
+            raise
+        except Exception as err:
+            flight.future.set_exception(err)
+            # Mark the exception as retrieved when nobody else was waiting.
+            flight.future.exception()
+            raise
+        else:
+            flight.future.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            self._callers.observe(flight.callers)
+
+    def forget(self, key: Hashable) -> None:
+        # Callers arriving after a write must not join a call that may
+        # have read the row before the write committed.
+        self._flights.pop(key, None)
+
+    async def _wait(self, flight: _Flight, call: Callable[[], Awaitable[Any]]) -> Any:
+        flight.callers += 1
+        self._coalesced.inc()
+        try:
+            # Shielded so that a waiting caller being cancelled does not
+            # cancel the shared result for everybody else.
+            return await asyncio.shield(flight.future)
+        except asyncio.CancelledError:
+            if flight.future.cancelled():
+                return await call()
+            raise
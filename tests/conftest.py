@@ -13,14 +13,19 @@ from sqlalchemy.orm import sessionmaker
 from starlette.testclient import TestClient
 
 import settings
+from api.actions.auth import current_user_cache
+from api.actions.auth import token_version_cache
 from db.models import PortalRole
 from db.session import get_db
+from db.session import unit_of_work
 from main import app
+from revocation import revocation_list
 from security import create_access_token
 
 
 CLEAN_TABLES = [
     "users",
+    "revoked_tokens",
 ]
 
 
@@ -33,20 +38,23 @@ def event_loop():
 
 @pytest.fixture(scope="session", autouse=True)
 async def run_migrations():
-    os.system("alembic init migrations")
-    os.system('alembic revision --autogenerate -m "create table for users')
-    os.system("alembic upgrade heads")
+    os.system("python -m db.migrate")
 
 
 @pytest.fixture(scope="session")
 async def async_session_test():
-    engine = create_async_engine(settings.TEST_DATABASE_URL, future=True, echo=True)
+    engine = create_async_engine(
+        settings.TEST_DATABASE_URL, future=True, echo=settings.DB_ECHO
+    )
     async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
     yield async_session
 
 
 @pytest.fixture(scope="function", autouse=True)
 async def clean_tables(async_session_test):
+    current_user_cache.clear()
+    token_version_cache.clear()
+    revocation_list.clear()
     async with async_session_test() as session:
         async with session.begin():
             for table_for_cleaning in CLEAN_TABLES:
@@ -56,12 +64,13 @@ async def clean_tables(async_session_test):
 async def _get_test_db():
     try:
         test_engine = create_async_engine(
-            settings.TEST_DATABASE_URL, future=True, echo=True
+            settings.TEST_DATABASE_URL, future=True, echo=settings.DB_ECHO
         )
         test_async_session = sessionmaker(
             test_engine, expire_on_commit=False, class_=AsyncSession
         )
-        yield test_async_session()
+        async with unit_of_work(test_async_session()) as session:
+            yield session
     finally:
         pass
 
@@ -119,6 +128,16 @@ async def create_user_in_database(asyncpg_pool):
     return create_user_in_database
 
 
+async def wait_for_lock_waiter(asyncpg_pool) -> None:
+    # Returns once some backend of the test database is blocked on a lock.
+    async with asyncpg_pool.acquire() as connection:
+        while not await connection.fetchval(
+            "SELECT count(*) FROM pg_stat_activity "
+            "WHERE datname = current_database() AND wait_event_type = 'Lock'"
+        ):
+            await asyncio.sleep(0.01)
+
+
 def create_test_auth_headers_for_user(email: str) -> dict[str, str]:
     access_token = create_access_token(
         data={"sub": email},
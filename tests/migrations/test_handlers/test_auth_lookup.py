@@ -0,0 +1,104 @@
+import json
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from db.dals import _GET_USER_FOR_AUTH
+from db.dals import _GET_USERS_FOR_AUTH
+from db.models import PortalRole
+from hashing import Hasher
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.asyncpg.dialect()))
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _explain(asyncpg_pool, statement, param) -> list[dict]:
+    async with asyncpg_pool.acquire() as connection:
+        async with connection.transaction():
+            # The test table is tiny, so the planner would rather read it
+            # whole; the point is which index it can answer the lookup from.
+            await connection.execute("SET LOCAL enable_seqscan = off")
+            result = await connection.fetchval(
+                f"EXPLAIN (FORMAT JSON) {_sql(statement)}", param
+            )
+    return list(_plan_nodes(json.loads(result)[0]["Plan"]))
+
+
+async def _create_user(create_user_in_database, email: str):
+    user_id = uuid4()
+    await create_user_in_database(
+        user_id=user_id,
+        name="Nikolai",
+        surname="Sviridov",
+        email=email,
+        is_active=True,
+        hashed_password=Hasher.get_password_hash("SamplePass1!"),
+        roles=[PortalRole.ROLE_PORTAL_USER],
+    )
+    return user_id
+
+
+async def test_auth_lookup_is_index_only_scan(asyncpg_pool, create_user_in_database):
+    await _create_user(create_user_in_database, "lol@kek.com")
+    nodes = await _explain(asyncpg_pool, _GET_USER_FOR_AUTH, "lol@kek.com")
+    assert any(
+        node["Node Type"] == "Index Only Scan"
+        and node["Index Name"] == "users_email_key"
+        for node in nodes
+    )
+
+
+async def test_batched_auth_lookup_is_index_only_scan(
+    asyncpg_pool, create_user_in_database
+):
+    await _create_user(create_user_in_database, "lol@kek.com")
+    await _create_user(create_user_in_database, "kek@lol.com")
+    nodes = await _explain(
+        asyncpg_pool, _GET_USERS_FOR_AUTH, ["lol@kek.com", "kek@lol.com"]
+    )
+    assert any(
+        node["Node Type"] == "Index Only Scan"
+        and node["Index Name"] == "users_email_key"
+        for node in nodes
+    )
+
+
+async def test_create_user_stores_lowercased_email(client, get_user_from_database):
+    user_data = {
+        "name": "Nikolai",
+        "surname": "Sviridov",
+        "email": "Lol@Kek.com",
+        "password": "SamplePass1!",
+    }
+    resp = client.post("/user/", data=json.dumps(user_data))
+    assert resp.status_code == 200
+    assert resp.json()["email"] == "lol@kek.com"
+    users_from_db = await get_user_from_database(resp.json()["user_id"])
+    assert users_from_db[0]["email"] == "lol@kek.com"
+    resp = client.post("/user/", data=json.dumps({**user_data, "email": "LOL@kek.com"}))
+    assert resp.status_code == 503
+    assert (
+        'duplicate key value violates unique constraint "users_email_key"'
+        in resp.json()["detail"]
+    )
+
+
+async def test_login_ignores_email_case(client, create_user_in_database):
+    user_id = await _create_user(create_user_in_database, "lol@kek.com")
+    resp = client.post(
+        "/login/token", data={"username": "LoL@KEK.com", "password": "SamplePass1!"}
+    )
+    assert resp.status_code == 200
+    resp = client.get(
+        f"/user/?user_id={user_id}",
+        headers={"Authorization": f"Bearer {resp.json()['access_token']}"},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["email"] == "lol@kek.com"
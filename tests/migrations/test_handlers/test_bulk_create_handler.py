@@ -0,0 +1,128 @@
+import json
+from uuid import uuid4
+
+from db.models import PortalRole
+from tests.conftest import create_test_auth_headers_for_user
+
+
+ADMIN_DATA = {
+    "user_id": uuid4(),
+    "name": "Admin",
+    "surname": "Adminov",
+    "email": "admin@kek.com",
+    "is_active": True,
+    "hashed_password": "string",
+    "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+}
+
+
+async def test_create_users_bulk(
+    client, create_user_in_database, get_user_from_database
+):
+    await create_user_in_database(**ADMIN_DATA)
+    users_data = [
+        {
+            "name": "Mikhail",
+            "surname": "Eblan",
+            "email": "mikhail@eblan.com",
+            "password": "string",
+        },
+        {
+            "name": "Petr",
+            "surname": "Suka",
+            "email": "petr@suka.com",
+            "password": "string",
+        },
+    ]
+    resp = client.post(
+        "/user/bulk",
+        data=json.dumps({"users": users_data}),
+        headers=create_test_auth_headers_for_user(ADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [result["email"] for result in results] == [
+        user_data["email"] for user_data in users_data
+    ]
+    for result, user_data in zip(results, users_data):
+        assert result["status"] == "created"
+        users_from_db = await get_user_from_database(result["user_id"])
+        assert len(users_from_db) == 1
+        user_from_db = dict(users_from_db[0])
+        assert user_from_db["name"] == user_data["name"]
+        assert user_from_db["surname"] == user_data["surname"]
+        assert user_from_db["email"] == user_data["email"]
+        assert user_from_db["is_active"] is True
+        assert user_from_db["roles"] == [PortalRole.ROLE_PORTAL_USER]
+
+
+async def test_create_users_bulk_reports_conflicts(client, create_user_in_database):
+    await create_user_in_database(**ADMIN_DATA)
+    users_data = [
+        {
+            "name": "Mikhail",
+            "surname": "Eblan",
+            "email": "mikhail@eblan.com",
+            "password": "string",
+        },
+        {
+            "name": "Petr",
+            "surname": "Suka",
+            "email": "mikhail@eblan.com",
+            "password": "string",
+        },
+        {
+            "name": "Admin",
+            "surname": "Adminov",
+            "email": ADMIN_DATA["email"],
+            "password": "string",
+        },
+    ]
+    resp = client.post(
+        "/user/bulk",
+        data=json.dumps({"users": users_data}),
+        headers=create_test_auth_headers_for_user(ADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [result["status"] for result in results] == [
+        "created",
+        "conflict",
+        "conflict",
+    ]
+    assert results[0]["user_id"] is not None
+    assert results[1]["user_id"] is None
+    assert results[2]["user_id"] is None
+
+
+async def test_create_users_bulk_forbidden_for_user(client, create_user_in_database):
+    user_data = {**ADMIN_DATA, "roles": [PortalRole.ROLE_PORTAL_USER]}
+    await create_user_in_database(**user_data)
+    resp = client.post(
+        "/user/bulk",
+        data=json.dumps(
+            {
+                "users": [
+                    {
+                        "name": "Mikhail",
+                        "surname": "Eblan",
+                        "email": "mikhail@eblan.com",
+                        "password": "string",
+                    }
+                ]
+            }
+        ),
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+    assert resp.status_code == 403
+    assert resp.json() == {"detail": "Forbidden"}
+
+
+async def test_create_users_bulk_empty(client, create_user_in_database):
+    await create_user_in_database(**ADMIN_DATA)
+    resp = client.post(
+        "/user/bulk",
+        data=json.dumps({"users": []}),
+        headers=create_test_auth_headers_for_user(ADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 422
@@ -0,0 +1,70 @@
+import json
+from uuid import uuid4
+
+from db.models import PortalRole
+from tests.conftest import create_test_auth_headers_for_user
+
+
+async def test_export_users(client, create_user_in_database):
+    users_data = [
+        {
+            "user_id": uuid4(),
+            "name": "Admin",
+            "surname": "Adminov",
+            "email": "admin@kek.com",
+            "is_active": True,
+            "hashed_password": "string",
+            "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+        },
+        {
+            "user_id": uuid4(),
+            "name": "Petr",
+            "surname": "Suka",
+            "email": "petr@suka.com",
+            "is_active": False,
+            "hashed_password": "string",
+            "roles": [PortalRole.ROLE_PORTAL_USER],
+        },
+    ]
+    for user_data in users_data:
+        await create_user_in_database(**user_data)
+    resp = client.get(
+        "/user/export",
+        headers=create_test_auth_headers_for_user(users_data[0]["email"]),
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    exported_users = [json.loads(line) for line in resp.text.splitlines()]
+    expected_users = sorted(
+        (
+            {
+                "user_id": str(user_data["user_id"]),
+                "name": user_data["name"],
+                "surname": user_data["surname"],
+                "email": user_data["email"],
+                "is_active": user_data["is_active"],
+            }
+            for user_data in users_data
+        ),
+        key=lambda user: user["user_id"],
+    )
+    assert exported_users == expected_users
+
+
+async def test_export_users_forbidden_for_user(client, create_user_in_database):
+    user_data = {
+        "user_id": uuid4(),
+        "name": "Petr",
+        "surname": "Suka",
+        "email": "petr@suka.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER],
+    }
+    await create_user_in_database(**user_data)
+    resp = client.get(
+        "/user/export",
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+    assert resp.status_code == 403
+    assert resp.json() == {"detail": "Forbidden"}
@@ -1,3 +1,4 @@
+import json
 from uuid import uuid4
 
 from db.models import PortalRole
@@ -143,3 +144,59 @@ async def test_get_user_no_token(client, create_user_in_database):
     assert resp.status_code == 401
     data_from_resp = resp.json()
     assert data_from_resp == {"detail": "Not authenticated"}
+
+
+async def test_get_users_batch(client, create_user_in_database):
+    users_data = [
+        {
+            "user_id": uuid4(),
+            "name": "Mikhail",
+            "surname": "Eblan",
+            "email": "mikhail@eblan.com",
+            "is_active": True,
+            "hashed_password": "string",
+            "roles": [PortalRole.ROLE_PORTAL_USER],
+        },
+        {
+            "user_id": uuid4(),
+            "name": "Petr",
+            "surname": "Suka",
+            "email": "petr@suka.com",
+            "is_active": True,
+            "hashed_password": "string",
+            "roles": [PortalRole.ROLE_PORTAL_USER],
+        },
+    ]
+    for user_data in users_data:
+        await create_user_in_database(**user_data)
+    missing_user_id = uuid4()
+    requested_ids = [
+        users_data[1]["user_id"],
+        missing_user_id,
+        users_data[0]["user_id"],
+    ]
+    resp = client.post(
+        "/user/batch",
+        data=json.dumps({"user_ids": [str(user_id) for user_id in requested_ids]}),
+        headers=create_test_auth_headers_for_user(users_data[0]["email"]),
+    )
+    assert resp.status_code == 200
+    users_from_resp = resp.json()["users"]
+    assert [user["user_id"] for user in users_from_resp] == [
+        str(user_id) for user_id in requested_ids
+    ]
+    assert users_from_resp[0]["found"] is True
+    assert users_from_resp[0]["user"]["email"] == users_data[1]["email"]
+    assert users_from_resp[1] == {
+        "user_id": str(missing_user_id),
+        "found": False,
+        "user": None,
+    }
+    assert users_from_resp[2]["found"] is True
+    assert users_from_resp[2]["user"]["name"] == users_data[0]["name"]
+
+
+async def test_get_users_batch_no_token(client):
+    resp = client.post("/user/batch", data=json.dumps({"user_ids": [str(uuid4())]}))
+    assert resp.status_code == 401
+    assert resp.json() == {"detail": "Not authenticated"}
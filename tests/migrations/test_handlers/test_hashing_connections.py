@@ -0,0 +1,89 @@
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+from db.models import PortalRole
+from hashing import Hasher
+from tests.conftest import create_test_auth_headers_for_user
+
+
+ADMIN_DATA = {
+    "user_id": uuid4(),
+    "name": "Admin",
+    "surname": "Adminov",
+    "email": "admin@kek.com",
+    "is_active": True,
+    "hashed_password": "string",
+    "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+}
+
+
+@pytest.fixture
+def connections_held_while_hashing(monkeypatch):
+    # Connections checked out of any SQLAlchemy pool, sampled every time
+    # the request hashes a batch of passwords.
+    checked_out = 0
+    samples = []
+
+    def on_checkout(*args):
+        nonlocal checked_out
+        checked_out += 1
+
+    def on_checkin(*args):
+        nonlocal checked_out
+        checked_out -= 1
+
+    hash_passwords = Hasher.get_password_hashes_async
+
+    async def sampled_hash_passwords(passwords):
+        samples.append(checked_out)
+        return await hash_passwords(passwords)
+
+    event.listen(Pool, "checkout", on_checkout)
+    event.listen(Pool, "checkin", on_checkin)
+    monkeypatch.setattr(
+        Hasher, "get_password_hashes_async", staticmethod(sampled_hash_passwords)
+    )
+    yield samples
+    event.remove(Pool, "checkout", on_checkout)
+    event.remove(Pool, "checkin", on_checkin)
+
+
+async def test_bulk_create_hashes_without_a_connection(
+    client, create_user_in_database, connections_held_while_hashing
+):
+    await create_user_in_database(**ADMIN_DATA)
+    users = [
+        {"name": "Petr", "surname": "Suka", "email": "petr@suka.com", "password": "s"}
+    ]
+    resp = client.post(
+        "/user/bulk",
+        data=json.dumps({"users": users}),
+        headers=create_test_auth_headers_for_user(ADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 200
+    assert connections_held_while_hashing == [0]
+
+
+async def test_import_hashes_without_a_connection(
+    client, create_user_in_database, asyncpg_pool, connections_held_while_hashing
+):
+    await create_user_in_database(**ADMIN_DATA)
+    content = "name,surname,email,password\nPetr,Suka,petr@suka.com,string\n"
+    resp = client.post(
+        "/user/import",
+        files={"file": ("users.csv", content, "text/csv")},
+        headers=create_test_auth_headers_for_user(ADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 200
+    assert resp.json()["inserted"] == 1
+    assert connections_held_while_hashing == [0]
+    async with asyncpg_pool.acquire() as connection:
+        user_from_db = await connection.fetchrow(
+            "SELECT * FROM users WHERE email = $1;", "petr@suka.com"
+        )
+    assert user_from_db["roles"] == [PortalRole.ROLE_PORTAL_USER]
+    assert Hasher.verify_password("string", user_from_db["hashed_password"])
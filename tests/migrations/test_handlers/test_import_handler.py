@@ -0,0 +1,159 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from api.actions.importer import _parse_row
+from api.actions.importer import ImportRowError
+from db.models import PortalRole
+from hashing import Hasher
+from tests.conftest import create_test_auth_headers_for_user
+
+
+ADMIN_DATA = {
+    "user_id": uuid4(),
+    "name": "Admin",
+    "surname": "Adminov",
+    "email": "admin@kek.com",
+    "is_active": True,
+    "hashed_password": "string",
+    "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+}
+
+
+async def test_import_users_csv(client, create_user_in_database, asyncpg_pool):
+    await create_user_in_database(**ADMIN_DATA)
+    content = (
+        "name,surname,email,password\n"
+        "Mikhail,Eblan,mikhail@eblan.com,string\n"
+        "Petr,Suka,petr@suka.com,string\n"
+        "Petr,Suka,petr@suka.com,string\n"
+        "Admin,Adminov,admin@kek.com,string\n"
+        ",Nameless,nameless@kek.com,string\n"
+    )
+    resp = client.post(
+        "/user/import",
+        files={"file": ("users.csv", content, "text/csv")},
+        headers=create_test_auth_headers_for_user(ADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report["total_rows"] == 5
+    assert report["invalid_rows"] == 1
+    assert report["inserted"] == 2
+    assert report["updated"] == 0
+    assert report["skipped"] == 2
+    assert report["errors"] == ["row 5: missing name"]
+    async with asyncpg_pool.acquire() as connection:
+        user_from_db = await connection.fetchrow(
+            "SELECT * FROM users WHERE email = $1;", "petr@suka.com"
+        )
+    assert user_from_db["name"] == "Petr"
+    assert user_from_db["roles"] == [PortalRole.ROLE_PORTAL_USER]
+    assert Hasher.verify_password("string", user_from_db["hashed_password"])
+
+
+async def test_import_users_ndjson_update_existing(
+    client, create_user_in_database, asyncpg_pool
+):
+    await create_user_in_database(**ADMIN_DATA)
+    hashed_password = Hasher.get_password_hash("legacy")
+    content = "\n".join(
+        [
+            json.dumps(
+                {
+                    "name": "Administrator",
+                    "surname": "Adminov",
+                    "email": ADMIN_DATA["email"],
+                    "hashed_password": hashed_password,
+                }
+            ),
+            "{not json",
+        ]
+    )
+    resp = client.post(
+        "/user/import?update_existing=true",
+        files={"file": ("users.ndjson", content, "application/x-ndjson")},
+        headers=create_test_auth_headers_for_user(ADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report["inserted"] == 0
+    assert report["updated"] == 1
+    assert report["errors"] == ["row 2: malformed JSON"]
+    async with asyncpg_pool.acquire() as connection:
+        user_from_db = await connection.fetchrow(
+            "SELECT * FROM users WHERE email = $1;", ADMIN_DATA["email"]
+        )
+    assert user_from_db["name"] == "Administrator"
+    assert user_from_db["hashed_password"] == hashed_password
+    assert PortalRole.ROLE_PORTAL_ADMIN in user_from_db["roles"]
+
+
+async def test_import_users_forbidden_for_user(client, create_user_in_database):
+    user_data = {**ADMIN_DATA, "roles": [PortalRole.ROLE_PORTAL_USER]}
+    await create_user_in_database(**user_data)
+    resp = client.post(
+        "/user/import",
+        files={"file": ("users.csv", "name,surname,email,password\n", "text/csv")},
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+    assert resp.status_code == 403
+
+
+async def test_import_users_unknown_format(client, create_user_in_database):
+    await create_user_in_database(**ADMIN_DATA)
+    resp = client.post(
+        "/user/import",
+        files={"file": ("users.xlsx", "", "application/octet-stream")},
+        headers=create_test_auth_headers_for_user(ADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 422
+    assert resp.json() == {"detail": "Cannot detect import format of users.xlsx"}
+
+
+@pytest.mark.parametrize(
+    "row, expected_error",
+    [
+        ({"surname": "Eblan", "email": "a@b.com", "password": "x"}, "missing name"),
+        (
+            {"name": "Mikhail", "surname": "Eblan", "email": "a@b.com"},
+            "missing password or hashed_password",
+        ),
+        (
+            {
+                "name": "Mikhail",
+                "surname": "Eblan",
+                "email": "a@b.com",
+                "hashed_password": "plaintext",
+            },
+            "unsupported password hash",
+        ),
+        ("[1, 2]", "row is not an object"),
+        (
+            {"name": "M1khail", "surname": "Eblan", "email": "a@b.com"},
+            "invalid name",
+        ),
+        (
+            {"name": "Mikhail", "surname": 42, "email": "a@b.com"},
+            "invalid surname",
+        ),
+        (
+            {"name": "Mikhail", "surname": "Eblan", "email": "not-an-email"},
+            "invalid email",
+        ),
+    ],
+)
+def test_parse_import_row_errors(row, expected_error):
+    with pytest.raises(ImportRowError, match=expected_error):
+        _parse_row(row)
+
+
+def test_parse_import_row_normalises_email():
+    row = {
+        "name": "Mikhail",
+        "surname": "Eblan",
+        "email": " Mikhail@Eblan.com ",
+        "password": "x",
+    }
+    assert _parse_row(row)["email"] == "mikhail@eblan.com"
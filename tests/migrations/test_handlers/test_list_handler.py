@@ -0,0 +1,250 @@
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from db.dals import _list_users_query
+from db.models import PortalRole
+from tests.conftest import create_test_auth_headers_for_user
+
+
+def _user_data(name: str, email: str, **overrides) -> dict:
+    return {
+        "user_id": uuid4(),
+        "name": name,
+        "surname": "Ivanov",
+        "email": email,
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER],
+        **overrides,
+    }
+
+
+def _list_pages(client, headers, **params) -> list[list[str]]:
+    pages = []
+    cursor = None
+    while True:
+        if cursor is not None:
+            params["cursor"] = cursor
+        resp = client.get("/user/list", params=params, headers=headers)
+        assert resp.status_code == 200
+        page = resp.json()
+        pages.append([user["email"] for user in page["users"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+async def test_list_users_paginates_with_cursor(client, create_user_in_database):
+    users_data = [
+        _user_data(name, f"{name.lower()}@kek.com")
+        for name in ["Ivan", "Petr", "Anna", "Olga", "Boris"]
+    ]
+    for user_data in users_data:
+        await create_user_in_database(**user_data)
+    headers = create_test_auth_headers_for_user(users_data[0]["email"])
+    seen_user_ids = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        resp = client.get("/user/list", params=params, headers=headers)
+        assert resp.status_code == 200
+        page = resp.json()
+        seen_user_ids.extend(user["user_id"] for user in page["users"])
+        cursor = page["next_cursor"]
+    assert cursor is None
+    assert seen_user_ids == sorted(str(user["user_id"]) for user in users_data)
+
+
+async def test_list_users_filters(client, create_user_in_database):
+    users_data = [
+        _user_data("Ivan", "ivan@kek.com"),
+        _user_data("Irina", "irina@lol.com", is_active=False),
+        _user_data(
+            "Petr",
+            "petr@kek.com",
+            roles=[PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+        ),
+    ]
+    for user_data in users_data:
+        await create_user_in_database(**user_data)
+    headers = create_test_auth_headers_for_user(users_data[0]["email"])
+
+    resp = client.get("/user/list", params={"name_prefix": "I"}, headers=headers)
+    assert {user["email"] for user in resp.json()["users"]} == {
+        "ivan@kek.com",
+        "irina@lol.com",
+    }
+
+    resp = client.get(
+        "/user/list",
+        params={"name_prefix": "I", "is_active": True},
+        headers=headers,
+    )
+    assert [user["email"] for user in resp.json()["users"]] == ["ivan@kek.com"]
+
+    resp = client.get(
+        "/user/list",
+        params={"role": PortalRole.ROLE_PORTAL_ADMIN},
+        headers=headers,
+    )
+    assert [user["email"] for user in resp.json()["users"]] == ["petr@kek.com"]
+
+    resp = client.get("/user/list", params={"email_prefix": "irina@"}, headers=headers)
+    assert [user["email"] for user in resp.json()["users"]] == ["irina@lol.com"]
+
+
+async def test_list_users_prefix_pages_are_ordered_by_prefix_column(
+    client, create_user_in_database
+):
+    users_data = [
+        _user_data(name, email)
+        for name, email in [
+            ("Ivan", "ivan@kek.com"),
+            ("Igor", "igor@kek.com"),
+            ("Inna", "inna@lol.com"),
+            ("Ilya", "ilya@kek.com"),
+            ("Petr", "petr@kek.com"),
+        ]
+    ]
+    for user_data in users_data:
+        await create_user_in_database(**user_data)
+    headers = create_test_auth_headers_for_user(users_data[0]["email"])
+    assert _list_pages(client, headers, limit=2, email_prefix="I") == [
+        ["igor@kek.com", "ilya@kek.com"],
+        ["inna@lol.com", "ivan@kek.com"],
+    ]
+    assert _list_pages(client, headers, limit=3, name_prefix="I") == [
+        ["igor@kek.com", "ilya@kek.com", "inna@lol.com"],
+        ["ivan@kek.com"],
+    ]
+    assert _list_pages(
+        client, headers, limit=1, name_prefix="I", email_prefix="i", is_active=True
+    ) == [["igor@kek.com"], ["ilya@kek.com"], ["inna@lol.com"], ["ivan@kek.com"]]
+
+
+async def test_list_users_role_pages(client, create_user_in_database):
+    admin_roles = [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN]
+    users_data = [
+        _user_data(name, f"{name.lower()}@kek.com", roles=roles)
+        for name, roles in [
+            ("Ivan", admin_roles),
+            ("Petr", [PortalRole.ROLE_PORTAL_USER]),
+            ("Anna", admin_roles),
+            ("Olga", admin_roles),
+        ]
+    ]
+    for user_data in users_data:
+        await create_user_in_database(**user_data)
+    headers = create_test_auth_headers_for_user(users_data[0]["email"])
+    admins = sorted(
+        (user_data for user_data in users_data if user_data["roles"] == admin_roles),
+        key=lambda user_data: user_data["user_id"],
+    )
+    pages = _list_pages(client, headers, limit=2, role=PortalRole.ROLE_PORTAL_ADMIN)
+    assert pages == [
+        [admins[0]["email"], admins[1]["email"]],
+        [admins[2]["email"]],
+    ]
+
+
+async def test_list_users_cursor_of_another_ordering(client, create_user_in_database):
+    users_data = [
+        _user_data("Ivan", "ivan@kek.com"),
+        _user_data("Igor", "igor@kek.com"),
+    ]
+    for user_data in users_data:
+        await create_user_in_database(**user_data)
+    headers = create_test_auth_headers_for_user(users_data[0]["email"])
+    resp = client.get("/user/list", params={"limit": 1}, headers=headers)
+    resp = client.get(
+        "/user/list",
+        params={"limit": 1, "email_prefix": "i", "cursor": resp.json()["next_cursor"]},
+        headers=headers,
+    )
+    assert resp.status_code == 422
+    assert resp.json() == {"detail": "Invalid cursor"}
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+@pytest.mark.parametrize(
+    "filters, index_name",
+    [
+        ({"email_prefix": "i"}, "ix_users_email_user_id"),
+        (
+            {"email_prefix": "i", "after_value": "igor@kek.com"},
+            "ix_users_email_user_id",
+        ),
+        ({"name_prefix": "I", "is_active": True}, "ix_users_name_user_id"),
+        ({"role": PortalRole.ROLE_PORTAL_ADMIN}, "ix_users_user_id_role_admin"),
+        ({"is_active": False}, "ix_users_is_active_user_id"),
+    ],
+)
+async def test_list_users_pages_walk_an_index_in_page_order(
+    asyncpg_pool, create_user_in_database, filters, index_name
+):
+    for name in ["Ivan", "Igor", "Petr"]:
+        await create_user_in_database(**_user_data(name, f"{name.lower()}@kek.com"))
+    query = _list_users_query(
+        **{
+            "limit": 50,
+            "after_user_id": uuid4() if "after_value" in filters else None,
+            "after_value": None,
+            "is_active": None,
+            "role": None,
+            "name_prefix": None,
+            "email_prefix": None,
+            **filters,
+        }
+    )
+    sql = query.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    async with asyncpg_pool.acquire() as connection:
+        async with connection.transaction():
+            # The test table is tiny, so the planner would rather read it
+            # whole and sort it.
+            await connection.execute("SET LOCAL enable_seqscan = off")
+            result = await connection.fetchval(f"EXPLAIN (FORMAT JSON) {sql}")
+    nodes = list(_plan_nodes(json.loads(result)[0]["Plan"]))
+    assert any(node.get("Index Name") == index_name for node in nodes)
+    assert not any(node["Node Type"] == "Sort" for node in nodes)
+
+
+async def test_list_users_prefix_is_escaped(client, create_user_in_database):
+    user_data = _user_data("Ivan", "ivan@kek.com")
+    await create_user_in_database(**user_data)
+    resp = client.get(
+        "/user/list",
+        params={"email_prefix": "%"},
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"users": [], "next_cursor": None}
+
+
+async def test_list_users_invalid_cursor(client, create_user_in_database):
+    user_data = _user_data("Ivan", "ivan@kek.com")
+    await create_user_in_database(**user_data)
+    resp = client.get(
+        "/user/list",
+        params={"cursor": "abc"},
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+    assert resp.status_code == 422
+    assert resp.json() == {"detail": "Invalid cursor"}
+
+
+async def test_list_users_no_token(client):
+    resp = client.get("/user/list")
+    assert resp.status_code == 401
+    assert resp.json() == {"detail": "Not authenticated"}
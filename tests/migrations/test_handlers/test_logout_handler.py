@@ -0,0 +1,35 @@
+from uuid import uuid4
+
+from db.models import PortalRole
+from tests.conftest import create_test_auth_headers_for_user
+
+
+async def test_logout_revokes_token(client, create_user_in_database, asyncpg_pool):
+    user_data = {
+        "user_id": uuid4(),
+        "name": "Nikolai",
+        "surname": "Sviridov",
+        "email": "lol@kek.com",
+        "is_active": True,
+        "hashed_password": "SampleHashedPass",
+        "roles": [PortalRole.ROLE_PORTAL_USER],
+    }
+    await create_user_in_database(**user_data)
+    headers = create_test_auth_headers_for_user(user_data["email"])
+    resp = client.get(f"/user/?user_id={user_data['user_id']}", headers=headers)
+    assert resp.status_code == 200
+    resp = client.post("/login/logout", headers=headers)
+    assert resp.status_code == 200
+    async with asyncpg_pool.acquire() as connection:
+        revoked = await connection.fetch("SELECT jti FROM revoked_tokens")
+    assert len(revoked) == 1
+    resp = client.get(f"/user/?user_id={user_data['user_id']}", headers=headers)
+    assert resp.status_code == 401
+    other_headers = create_test_auth_headers_for_user(user_data["email"])
+    resp = client.get(f"/user/?user_id={user_data['user_id']}", headers=other_headers)
+    assert resp.status_code == 200
+
+
+async def test_logout_with_invalid_token(client):
+    resp = client.post("/login/logout", headers={"Authorization": "Bearer nope"})
+    assert resp.status_code == 401
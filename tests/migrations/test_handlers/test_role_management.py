@@ -1,11 +1,16 @@
+import asyncio
 from uuid import uuid4
 
 import pytest
 
+from api.actions.auth import token_version_cache
+from db.dals import UpdateStatus
+from db.dals import UserDAL
 from db.models import PortalRole
 from tests.conftest import create_test_auth_headers_for_user
 from tests.conftest import create_user_in_database
 from tests.conftest import get_user_from_database
+from tests.conftest import wait_for_lock_waiter
 
 
 async def test_add_admin_role_to_user_by_superadmin(
@@ -128,3 +133,196 @@ async def test_revoke_admin_role_by_wrong_type_of_user(
     updated_user_from_db = dict(not_revoked_users_from_db[0])
     assert updated_user_from_db["user_id"] == user_data_for_revoke["user_id"]
     assert PortalRole.ROLE_PORTAL_ADMIN in updated_user_from_db["roles"]
+
+
+SUPERADMIN_DATA = {
+    "user_id": uuid4(),
+    "name": "Ivan",
+    "surname": "Ivanov",
+    "email": "ivan@ivanov.com",
+    "is_active": True,
+    "hashed_password": "string",
+    "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+}
+
+
+async def test_add_admin_role_to_admin_conflict(client, create_user_in_database):
+    user_data_for_promotion = {
+        "user_id": uuid4(),
+        "name": "Petr",
+        "surname": "Suka",
+        "email": "petr@suka.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+    }
+    for user_data in [user_data_for_promotion, SUPERADMIN_DATA]:
+        await create_user_in_database(**user_data)
+    user_id = user_data_for_promotion["user_id"]
+    resp = client.patch(
+        f"/user/admin_privilege?user_id={user_id}",
+        headers=create_test_auth_headers_for_user(SUPERADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 409
+    assert resp.json() == {
+        "detail": f"User with id {user_id} already promoted to admin / superadmin"
+    }
+
+
+async def test_add_admin_role_to_missing_user(client, create_user_in_database):
+    await create_user_in_database(**SUPERADMIN_DATA)
+    user_id = uuid4()
+    resp = client.patch(
+        f"/user/admin_privilege?user_id={user_id}",
+        headers=create_test_auth_headers_for_user(SUPERADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 404
+    assert resp.json() == {"detail": f"User with id {user_id} not found"}
+
+
+async def test_change_admin_role_batch(
+    client, create_user_in_database, get_user_from_database
+):
+    users_data = [
+        {
+            "user_id": uuid4(),
+            "name": name,
+            "surname": "Ivanov",
+            "email": f"{name.lower()}@kek.com",
+            "is_active": True,
+            "hashed_password": "string",
+            "roles": roles,
+        }
+        for name, roles in [
+            ("Petr", [PortalRole.ROLE_PORTAL_USER]),
+            ("Olga", [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN]),
+        ]
+    ]
+    for user_data in [*users_data, SUPERADMIN_DATA]:
+        await create_user_in_database(**user_data)
+    missing_user_id = uuid4()
+    user_ids = [
+        users_data[0]["user_id"],
+        users_data[1]["user_id"],
+        missing_user_id,
+        SUPERADMIN_DATA["user_id"],
+    ]
+    resp = client.patch(
+        "/user/admin_privilege/batch",
+        json={"user_ids": [str(user_id) for user_id in user_ids], "action": "grant"},
+        headers=create_test_auth_headers_for_user(SUPERADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "results": [
+            {"user_id": str(users_data[0]["user_id"]), "status": "updated"},
+            {"user_id": str(users_data[1]["user_id"]), "status": "conflict"},
+            {"user_id": str(missing_user_id), "status": "not_found"},
+            {"user_id": str(SUPERADMIN_DATA["user_id"]), "status": "forbidden"},
+        ]
+    }
+    users_from_db = await get_user_from_database(users_data[0]["user_id"])
+    assert dict(users_from_db[0])["roles"] == [
+        PortalRole.ROLE_PORTAL_USER,
+        PortalRole.ROLE_PORTAL_ADMIN,
+    ]
+
+    resp = client.patch(
+        "/user/admin_privilege/batch",
+        json={
+            "user_ids": [str(user_data["user_id"]) for user_data in users_data],
+            "action": "revoke",
+        },
+        headers=create_test_auth_headers_for_user(SUPERADMIN_DATA["email"]),
+    )
+    assert resp.status_code == 200
+    assert [result["status"] for result in resp.json()["results"]] == [
+        "updated",
+        "updated",
+    ]
+    for user_data in users_data:
+        users_from_db = await get_user_from_database(user_data["user_id"])
+        assert dict(users_from_db[0])["roles"] == [PortalRole.ROLE_PORTAL_USER]
+
+
+async def test_change_admin_role_batch_forbidden_for_admin(
+    client, create_user_in_database
+):
+    admin_data = {
+        **SUPERADMIN_DATA,
+        "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+    }
+    await create_user_in_database(**admin_data)
+    resp = client.patch(
+        "/user/admin_privilege/batch",
+        json={"user_ids": [str(uuid4())], "action": "grant"},
+        headers=create_test_auth_headers_for_user(admin_data["email"]),
+    )
+    assert resp.status_code == 403
+
+
+async def test_grant_admin_role_to_user_deleted_concurrently(
+    async_session_test, asyncpg_pool, create_user_in_database, get_user_from_database
+):
+    user_data = {
+        "user_id": uuid4(),
+        "name": "Petr",
+        "surname": "Suka",
+        "email": "petr@suka.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER],
+    }
+    await create_user_in_database(**user_data)
+    async with asyncpg_pool.acquire() as connection:
+        deletion = connection.transaction()
+        await deletion.start()
+        await connection.execute(
+            "UPDATE users SET is_active = false WHERE user_id = $1",
+            user_data["user_id"],
+        )
+        async with async_session_test() as session:
+            grant = asyncio.create_task(
+                UserDAL(session).grant_admin_privilege([user_data["user_id"]])
+            )
+            await wait_for_lock_waiter(asyncpg_pool)
+            await deletion.commit()
+            assert await grant == {user_data["user_id"]: UpdateStatus.NOT_FOUND}
+            await session.commit()
+    users_from_db = await get_user_from_database(user_data["user_id"])
+    assert dict(users_from_db[0])["roles"] == [PortalRole.ROLE_PORTAL_USER]
+
+
+async def test_role_change_on_another_worker_reaches_cached_user(
+    client, create_user_in_database, asyncpg_pool
+):
+    user_data = {
+        "user_id": uuid4(),
+        "name": "Petr",
+        "surname": "Suka",
+        "email": "petr@suka.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER],
+    }
+    for data in [user_data, SUPERADMIN_DATA]:
+        await create_user_in_database(**data)
+    headers = create_test_auth_headers_for_user(SUPERADMIN_DATA["email"])
+    resp = client.patch(
+        f"/user/admin_privilege?user_id={user_data['user_id']}", headers=headers
+    )
+    assert resp.status_code == 200
+    # Demoted by another worker: this worker's caches are not invalidated,
+    # only its token version entry expires.
+    async with asyncpg_pool.acquire() as connection:
+        await connection.execute(
+            "UPDATE users SET roles = $2, token_version = token_version + 1 "
+            "WHERE user_id = $1",
+            SUPERADMIN_DATA["user_id"],
+            [PortalRole.ROLE_PORTAL_USER],
+        )
+    token_version_cache.clear()
+    resp = client.delete(
+        f"/user/admin_privilege?user_id={user_data['user_id']}", headers=headers
+    )
+    assert resp.status_code == 403
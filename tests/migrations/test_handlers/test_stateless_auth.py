@@ -0,0 +1,103 @@
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+
+import settings
+from db.models import PortalRole
+from hashing import Hasher
+from tests.conftest import create_test_auth_headers_for_user
+
+
+@pytest.fixture
+def stateless_tokens(monkeypatch):
+    monkeypatch.setattr(settings, "STATELESS_TOKENS", True)
+
+
+def _user_data(email: str, roles: list) -> dict:
+    return {
+        "user_id": uuid4(),
+        "name": "Nikolai",
+        "surname": "Sviridov",
+        "email": email,
+        "is_active": True,
+        "hashed_password": Hasher.get_password_hash("SamplePass1!"),
+        "roles": roles,
+    }
+
+
+def _login(client, email: str) -> dict:
+    resp = client.post(
+        "/login/token", data={"username": email, "password": "SamplePass1!"}
+    )
+    assert resp.status_code == 200
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+async def test_login_issues_token_with_user_claims(
+    client, create_user_in_database, stateless_tokens
+):
+    user_data = _user_data("lol@kek.com", [PortalRole.ROLE_PORTAL_USER])
+    await create_user_in_database(**user_data)
+    headers = _login(client, user_data["email"])
+    payload = jwt.decode(
+        headers["Authorization"].split()[1],
+        settings.SECRET_KEY,
+        algorithms=[settings.ALGORITHM],
+    )
+    assert payload["uid"] == str(user_data["user_id"])
+    assert payload["roles"] == [PortalRole.ROLE_PORTAL_USER]
+    assert payload["active"] is True
+    assert payload["ver"] == 0
+    resp = client.get(f"/user/?user_id={user_data['user_id']}", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["email"] == user_data["email"]
+
+
+async def test_role_change_invalidates_stateless_token(
+    client, create_user_in_database, stateless_tokens
+):
+    user_data = _user_data("lol@kek.com", [PortalRole.ROLE_PORTAL_USER])
+    superadmin_data = _user_data(
+        "admin@kek.com",
+        [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+    )
+    for data in (user_data, superadmin_data):
+        await create_user_in_database(**data)
+    headers = _login(client, user_data["email"])
+    resp = client.patch(
+        f"/user/admin_privilege?user_id={user_data['user_id']}",
+        headers=_login(client, superadmin_data["email"]),
+    )
+    assert resp.status_code == 200
+    resp = client.get(f"/user/?user_id={user_data['user_id']}", headers=headers)
+    assert resp.status_code == 401
+    resp = client.get(
+        f"/user/?user_id={user_data['user_id']}",
+        headers=_login(client, user_data["email"]),
+    )
+    assert resp.status_code == 200
+
+
+async def test_deleted_user_stateless_token_is_rejected(
+    client, create_user_in_database, stateless_tokens
+):
+    user_data = _user_data("lol@kek.com", [PortalRole.ROLE_PORTAL_USER])
+    await create_user_in_database(**user_data)
+    headers = _login(client, user_data["email"])
+    resp = client.delete(f"/user/?user_id={user_data['user_id']}", headers=headers)
+    assert resp.status_code == 200
+    resp = client.get(f"/user/?user_id={user_data['user_id']}", headers=headers)
+    assert resp.status_code == 401
+
+
+async def test_token_without_claims_falls_back_to_database(
+    client, create_user_in_database, stateless_tokens
+):
+    user_data = _user_data("lol@kek.com", [PortalRole.ROLE_PORTAL_USER])
+    await create_user_in_database(**user_data)
+    resp = client.get(
+        f"/user/?user_id={user_data['user_id']}",
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+    assert resp.status_code == 200
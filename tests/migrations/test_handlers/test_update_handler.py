@@ -1,11 +1,16 @@
+import asyncio
 import json
 from uuid import uuid4
 
 import pytest
 
+from db.dals import UpdateStatus
+from db.dals import UserDAL
 from db.models import PortalRole
+from db.models import User
 from tests.conftest import create_test_auth_headers_for_user
 from tests.conftest import create_user_in_database
+from tests.conftest import wait_for_lock_waiter
 
 
 async def test_update_user(client, create_user_in_database, get_user_from_database):
@@ -358,3 +363,148 @@ async def test_update_user_no_token(client, create_user_in_database):
     assert resp.status_code == 401
     data_from_resp = resp.json()
     assert data_from_resp == {"detail": "Not authenticated"}
+
+
+@pytest.mark.parametrize(
+    "current_user_roles, target_user_roles, expected_status_code",
+    [
+        ([PortalRole.ROLE_PORTAL_USER], [PortalRole.ROLE_PORTAL_USER], 403),
+        (
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+            [PortalRole.ROLE_PORTAL_USER],
+            200,
+        ),
+        (
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+            403,
+        ),
+        (
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+            403,
+        ),
+        (
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_ADMIN],
+            200,
+        ),
+        (
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+            [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+            403,
+        ),
+    ],
+)
+async def test_update_other_user_permissions(
+    client,
+    create_user_in_database,
+    get_user_from_database,
+    current_user_roles,
+    target_user_roles,
+    expected_status_code,
+):
+    current_user_data = {
+        "user_id": uuid4(),
+        "name": "Admin",
+        "surname": "Adminov",
+        "email": "admin@kek.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": current_user_roles,
+    }
+    target_user_data = {
+        "user_id": uuid4(),
+        "name": "Petr",
+        "surname": "Suka",
+        "email": "petr@suka.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": target_user_roles,
+    }
+    for user_data in [current_user_data, target_user_data]:
+        await create_user_in_database(**user_data)
+    resp = client.patch(
+        f"/user/?user_id={target_user_data['user_id']}",
+        data=json.dumps({"name": "Ivan"}),
+        headers=create_test_auth_headers_for_user(current_user_data["email"]),
+    )
+    assert resp.status_code == expected_status_code
+    users_from_db = await get_user_from_database(target_user_data["user_id"])
+    expected_name = "Ivan" if expected_status_code == 200 else "Petr"
+    assert dict(users_from_db[0])["name"] == expected_name
+
+
+async def test_update_deleted_user_not_found(client, create_user_in_database):
+    user_data = {
+        "user_id": uuid4(),
+        "name": "Petr",
+        "surname": "Suka",
+        "email": "petr@suka.com",
+        "is_active": False,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER],
+    }
+    admin_data = {
+        "user_id": uuid4(),
+        "name": "Admin",
+        "surname": "Adminov",
+        "email": "admin@kek.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+    }
+    for data in [user_data, admin_data]:
+        await create_user_in_database(**data)
+    resp = client.patch(
+        f"/user/?user_id={user_data['user_id']}",
+        data=json.dumps({"name": "Ivan"}),
+        headers=create_test_auth_headers_for_user(admin_data["email"]),
+    )
+    assert resp.status_code == 404
+    assert resp.json() == {"detail": f"User with id {user_data['user_id']} not found"}
+
+
+async def test_update_user_deleted_concurrently_not_found(
+    async_session_test, asyncpg_pool, create_user_in_database, get_user_from_database
+):
+    user_data = {
+        "user_id": uuid4(),
+        "name": "Petr",
+        "surname": "Suka",
+        "email": "petr@suka.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER],
+    }
+    admin_data = {
+        "user_id": uuid4(),
+        "name": "Admin",
+        "surname": "Adminov",
+        "email": "admin@kek.com",
+        "is_active": True,
+        "hashed_password": "string",
+        "roles": [PortalRole.ROLE_PORTAL_USER, PortalRole.ROLE_PORTAL_SUPERADMIN],
+    }
+    for data in [user_data, admin_data]:
+        await create_user_in_database(**data)
+    async with asyncpg_pool.acquire() as connection:
+        deletion = connection.transaction()
+        await deletion.start()
+        await connection.execute(
+            "UPDATE users SET is_active = false WHERE user_id = $1",
+            user_data["user_id"],
+        )
+        async with async_session_test() as session:
+            admin = await session.get(User, admin_data["user_id"])
+            update = asyncio.create_task(
+                UserDAL(session).update_user_if_permitted(
+                    user_data["user_id"], admin, name="Ivan"
+                )
+            )
+            await wait_for_lock_waiter(asyncpg_pool)
+            await deletion.commit()
+            assert await update == UpdateStatus.NOT_FOUND
+            await session.commit()
+    users_from_db = await get_user_from_database(user_data["user_id"])
+    assert dict(users_from_db[0])["name"] == "Petr"
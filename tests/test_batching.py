@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from batching import BatchLoader
+
+
+def _loader(name, calls, window=0.0, max_batch_size=100, fail=False):
+    async def load_many(keys, session):
+        calls.append((list(keys), session))
+        await asyncio.sleep(0)
+        if fail:
+            raise RuntimeError("boom")
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    return BatchLoader(name, load_many, window=window, max_batch_size=max_batch_size)
+
+
+async def test_keys_of_one_tick_are_loaded_with_one_call():
+    calls = []
+    loader = _loader("test_tick", calls)
+    results = await asyncio.gather(
+        loader.load("a", "s1"),
+        loader.load("b", "s2"),
+        loader.load("a", "s3"),
+        loader.load("missing", "s4"),
+    )
+    assert results == ["A", "B", "A", None]
+    # One query on the leader's session.
+    assert calls == [(["a", "b", "missing"], "s1")]
+
+
+async def test_window_gathers_keys_from_later_ticks():
+    calls = []
+    loader = _loader("test_window", calls, window=0.05)
+
+    async def load_later(key):
+        await asyncio.sleep(0.01)
+        return await loader.load(key, "s2")
+
+    assert await asyncio.gather(loader.load("a", "s1"), load_later("b")) == [
+        "A",
+        "B",
+    ]
+    assert calls == [(["a", "b"], "s1")]
+    assert await loader.load("c", "s3") == "C"
+    assert len(calls) == 2
+
+
+async def test_full_batch_starts_a_new_one():
+    calls = []
+    loader = _loader("test_full", calls, max_batch_size=2)
+    results = await asyncio.gather(*(loader.load(key, "s") for key in "abcde"))
+    assert results == list("ABCDE")
+    assert [keys for keys, _ in calls] == [["a", "b"], ["c", "d"], ["e"]]
+
+
+async def test_errors_reach_every_caller():
+    calls = []
+    loader = _loader("test_error", calls, fail=True)
+    results = await asyncio.gather(
+        loader.load("a", "s1"), loader.load("b", "s2"), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(calls) == 1
+
+
+async def test_cancelled_leader_lets_the_others_load_themselves():
+    calls = []
+    loader = _loader("test_cancel", calls, window=0.05)
+    leader = asyncio.create_task(loader.load("a", "s1"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(loader.load("b", "s2"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await follower == "B"
+    assert calls == [(["b"], "s2")]
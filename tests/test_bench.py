@@ -0,0 +1,48 @@
+from bench.harness import Measurement
+from bench.load import compare
+from bench.load import ServerMetrics
+
+
+METRICS = """\
+# TYPE db_query_duration_seconds histogram
+db_query_duration_seconds_count{{engine="primary"}} {queries}
+db_query_duration_seconds_count{{engine="replica0"}} 5.0
+# TYPE event_loop_lag_seconds histogram
+event_loop_lag_seconds_bucket{{le="0.001"}} {fast}
+event_loop_lag_seconds_bucket{{le="0.01"}} {lags}
+event_loop_lag_seconds_bucket{{le="+Inf"}} {lags}
+event_loop_lag_seconds_count {lags}
+event_loop_lag_seconds_sum 0.05
+"""
+
+
+def test_server_metrics_difference():
+    before = ServerMetrics.parse(METRICS.format(queries=10, fast=0, lags=0))
+    after = ServerMetrics.parse(METRICS.format(queries=40, fast=90, lags=100))
+    delta = after - before
+    assert delta.queries == 30
+    assert delta.loop_lag_count == 100
+    assert delta.loop_lag_p99() == 0.01
+
+
+def _result(rps, p99_ms, queries=1.0):
+    return {"rps": rps, "p99_ms": p99_ms, "db_queries_per_request": queries}
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"get_mix": _result(1000, 10.0), "login_storm": _result(100, 50.0)}
+    results = {
+        "get_mix": _result(950, 10.5),
+        "login_storm": _result(80, 70.0, queries=2.0),
+    }
+    regressions = compare(results, baseline, tolerance=0.1)
+    assert len(regressions) == 3
+    assert all(regression.startswith("login_storm") for regression in regressions)
+
+
+def test_measurement_confidence_interval():
+    measurement = Measurement(name="test", per_call_seconds=[1.0, 2.0, 3.0])
+    assert measurement.mean == 2.0
+    # t(0.975, df=2) * stdev / sqrt(n)
+    assert round(measurement.ci95, 3) == round(4.30 * 1.0 / 3**0.5, 3)
+    assert Measurement(name="single", per_call_seconds=[1.0]).ci95 == 0.0
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from api.actions import auth
+from cache import TTLCache
+from security import create_access_token
+
+
+def test_cache_get_set():
+    cache = TTLCache(name="test_get_set", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(name="test_lru", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(name="test_ttl", maxsize=2, ttl=10)
+    cache.set("a", 1)
+    now[0] += 9
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_invalidate_indexed():
+    user_id = uuid4()
+    cache = TTLCache(
+        name="test_index", maxsize=10, ttl=60, index_by=lambda user: user.user_id
+    )
+    cache.set("old@kek.com", SimpleNamespace(user_id=user_id))
+    cache.set("new@kek.com", SimpleNamespace(user_id=user_id))
+    cache.set("other@kek.com", SimpleNamespace(user_id=uuid4()))
+    cache.invalidate_indexed(user_id)
+    assert cache.get("old@kek.com") is None
+    assert cache.get("new@kek.com") is None
+    assert cache.get("other@kek.com") is not None
+
+
+def test_cache_set_skips_values_loaded_before_an_invalidation():
+    user_id = uuid4()
+    cache = TTLCache(
+        name="test_generation",
+        maxsize=10,
+        ttl=60,
+        index_by=lambda user: user.user_id,
+    )
+    generation = cache.generation
+    # Invalidated while the lookup was running, before anything was cached.
+    cache.invalidate_indexed(user_id)
+    cache.set("lol@kek.com", SimpleNamespace(user_id=user_id), generation=generation)
+    assert cache.get("lol@kek.com") is None
+    cache.set(
+        "lol@kek.com", SimpleNamespace(user_id=user_id), generation=cache.generation
+    )
+    assert cache.get("lol@kek.com") is not None
+
+
+def test_cache_disabled():
+    cache = TTLCache(name="test_disabled", maxsize=0, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+async def test_user_invalidated_during_lookup_is_not_cached(monkeypatch):
+    user = SimpleNamespace(user_id=uuid4(), email="lol@kek.com")
+
+    async def lookup_racing_a_write(email, session):
+        # The row was read, then a write to it committed and invalidated.
+        auth.invalidate_cached_user(user.user_id)
+        return user
+
+    monkeypatch.setattr(auth, "_get_user_by_email_for_auth", lookup_racing_a_write)
+    token = create_access_token(data={"sub": user.email})
+    auth.current_user_cache.clear()
+    assert await auth.get_current_user_from_token(token, db=None) is user
+    assert auth.current_user_cache.get(user.email) is None
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from db import dals
+
+
+@pytest.mark.parametrize(
+    "statement, column_keys",
+    [
+        (dals._GET_USER_BY_ID, ["user_id"]),
+        (dals._GET_USER_BY_EMAIL, ["email"]),
+        (dals._GET_TOKEN_VERSION, ["user_id"]),
+        (dals._DELETE_USER, ["target_user_id"]),
+        (
+            dals._update_user_statement(("email", "name")),
+            ["target_user_id", "new_email", "new_name"],
+        ),
+        (
+            dals._update_user_if_permitted_statement("admin", ("name",)),
+            ["target_user_id", "current_user_id", "new_name"],
+        ),
+    ],
+)
+def test_prebuilt_statements_compile_with_the_dal_parameters(statement, column_keys):
+    # Compiled the way Connection.execute does, with the parameter names the
+    # DAL passes; update() reserves column names for its SET clause.
+    compiled = statement.compile(dialect=asyncpg_dialect(), column_keys=column_keys)
+    assert set(column_keys) <= set(compiled.binds)
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+import pytest
+
+from hashing import Hasher
+from hashing import HashingPool
+from hashing import HashingPoolSaturatedError
+
+
+async def test_hash_and_verify_async():
+    hashed_password = await Hasher.get_password_hash_async("password")
+    assert await Hasher.verify_password_async("password", hashed_password)
+    assert not await Hasher.verify_password_async("wrong", hashed_password)
+
+
+async def test_hashing_pool_rejects_when_saturated():
+    pool = HashingPool(kind="thread", workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = [
+            asyncio.create_task(pool.run("hash", release.wait)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        with pytest.raises(HashingPoolSaturatedError):
+            await pool.run("hash", release.wait)
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        assert await pool.run("hash", release.wait) is True
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+async def test_hashing_pool_counts_cancelled_jobs_until_they_finish():
+    pool = HashingPool(kind="thread", workers=1, max_queue=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def hash_until_released():
+        started.set()
+        return release.wait()
+
+    try:
+        running = asyncio.create_task(pool.run("hash", hash_until_released))
+        await asyncio.to_thread(started.wait)
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        # The worker is still busy with the cancelled caller's job.
+        with pytest.raises(HashingPoolSaturatedError):
+            await pool.run("hash", release.wait)
+        release.set()
+        while pool._pending:
+            await asyncio.sleep(0.01)
+        assert await pool.run("hash", release.wait) is True
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_hashing_pool_unknown_kind():
+    with pytest.raises(ValueError):
+        HashingPool(kind="fiber", workers=1, max_queue=1)
+
+
+async def test_get_password_hashes_async_keeps_order():
+    passwords = [f"password{i}" for i in range(5)]
+    hashed_passwords = await Hasher.get_password_hashes_async(passwords)
+    assert len(hashed_passwords) == len(passwords)
+    for password, hashed_password in zip(passwords, hashed_passwords):
+        assert Hasher.verify_password(password, hashed_password)
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+from db.migrate import BASELINE_REVISION
+from db.migrate import LEGACY_REVISIONS
+from db.migrate import read_config
+from db.migrate import read_revisions
+
+
+def test_read_revisions_agrees_with_alembic():
+    config = read_config("alembic.ini")
+    revisions, heads = read_revisions(Path(config["script_location"]) / "versions")
+    script = ScriptDirectory.from_config(Config("alembic.ini"))
+    assert heads == set(script.get_heads())
+    assert revisions == {revision.revision for revision in script.walk_revisions()}
+    assert BASELINE_REVISION in revisions
+    assert set(script.get_bases()) == {BASELINE_REVISION}
+    assert not revisions & LEGACY_REVISIONS
+
+
+def test_read_revisions_handles_merges(tmp_path):
+    for revision, down_revision in [
+        ("aaa", "None"),
+        ("bbb", "'aaa'"),
+        ("ccc", "'aaa'"),
+        ("ddd", "('bbb', 'ccc')"),
+        ("eee", "'aaa'"),
+    ]:
+        (tmp_path / f"{revision}.py").write_text(
+            f"revision: str = '{revision}'\n"
+            f"down_revision: Union[str, None] = {down_revision}\n"
+        )
+    assert read_revisions(tmp_path) == (
+        {"aaa", "bbb", "ccc", "ddd", "eee"},
+        {"ddd", "eee"},
+    )
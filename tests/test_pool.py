@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+import settings
+from db.pool import instrument_engine
+from db.pool import InstrumentedAsyncPool
+from db.pool import pool_limits
+
+
+def _sample(name: str, pool: str) -> float:
+    return REGISTRY.get_sample_value(name, {"pool": pool}) or 0.0
+
+
+@pytest.fixture(params=[False, True], ids=["single_process", "multiprocess"])
+def instrumented_pool(request, monkeypatch, tmp_path):
+    # The gauges are read at scrape time in a single process and written on
+    # every checkout and checkin in multiprocess mode.
+    if request.param:
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    else:
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    pool = InstrumentedAsyncPool(mock.Mock, pool_size=1, max_overflow=1, timeout=0.01)
+    name = f"test_{request.param_index}_{request.node.name}"
+    instrument_engine(SimpleNamespace(pool=pool), name)
+    return pool, name
+
+
+async def test_pool_metrics_follow_checkouts(instrumented_pool):
+    pool, name = instrumented_pool
+    connections = [await greenlet_spawn(pool.connect) for _ in range(2)]
+    assert _sample("db_pool_size", name) == 1
+    assert _sample("db_pool_checked_out", name) == 2
+    assert _sample("db_pool_checked_in", name) == 0
+    assert _sample("db_pool_overflow", name) == 1
+    assert _sample("db_pool_acquire_wait_seconds_count", name) == 2
+
+    for connection in connections:
+        connection.close()
+    assert _sample("db_pool_checked_out", name) == 0
+    assert _sample("db_pool_checked_in", name) == 1
+    assert _sample("db_pool_overflow", name) == 0
+
+
+async def test_pool_timeout_is_counted(instrumented_pool):
+    pool, name = instrumented_pool
+    connections = [await greenlet_spawn(pool.connect) for _ in range(2)]
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    assert _sample("db_pool_timeouts_total", name) == 1
+    assert _sample("db_pool_acquire_wait_seconds_count", name) == 3
+    assert _sample("db_pool_acquire_wait_seconds_sum", name) >= 0.01
+    assert _sample("db_pool_checked_out", name) == 2
+    for connection in connections:
+        connection.close()
+
+
+def test_recreated_pool_keeps_metrics_name():
+    pool = InstrumentedAsyncPool(mock.Mock, pool_size=1)
+    pool.metrics_name = "test_recreate"
+    assert pool.recreate().metrics_name == "test_recreate"
+
+
+@pytest.mark.parametrize(
+    "workers, expected",
+    [
+        (0, (10, 20)),
+        (1, (10, 20)),
+        (3, (10, 20)),
+        (4, (10, 12)),
+        (16, (5, 0)),
+        (200, (1, 0)),
+    ],
+)
+def test_pool_limits_share_max_connections(monkeypatch, workers, expected):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 10)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 20)
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS", 90)
+    assert pool_limits(workers) == expected
@@ -0,0 +1,37 @@
+import json
+import uuid
+
+from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+
+from api.models import ShowUser
+from api.responses import default_response_class
+from api.responses import model_response
+from api.responses import PydanticJSONResponse
+
+
+def _user():
+    return ShowUser(
+        user_id=uuid.uuid4(),
+        name="Mikhail",
+        surname="Ivanov",
+        email="mikhail@example.com",
+        is_active=True,
+    )
+
+
+def test_model_response_returns_model_by_default(monkeypatch):
+    monkeypatch.setattr("settings.FAST_JSON_RESPONSES", False)
+    user = _user()
+    assert model_response(user) is user
+    assert default_response_class() is JSONResponse
+
+
+def test_model_response_serializes_model_in_fast_mode(monkeypatch):
+    monkeypatch.setattr("settings.FAST_JSON_RESPONSES", True)
+    user = _user()
+    response = model_response(user)
+    assert isinstance(response, PydanticJSONResponse)
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == user.model_dump(mode="json")
+    assert default_response_class() is ORJSONResponse
@@ -0,0 +1,35 @@
+from uuid import uuid4
+
+from revocation import BloomFilter
+from revocation import RevocationList
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    keys = [uuid4().hex for _ in range(1_000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    for _ in range(1_000):
+        bloom.add(uuid4().hex)
+    false_positives = sum(uuid4().hex in bloom for _ in range(10_000))
+    assert false_positives < 300
+
+
+async def test_unknown_token_is_checked_without_database():
+    revocation_list = RevocationList(capacity=100, error_rate=0.001)
+    # No session is needed when the filter says the token was never revoked.
+    assert await revocation_list.is_revoked(uuid4().hex, session=None) is False
+
+
+async def test_locally_revoked_token_is_confirmed_without_database():
+    revocation_list = RevocationList(capacity=100, error_rate=0.001)
+    jti = uuid4().hex
+    revocation_list.add(jti)
+    assert await revocation_list.is_revoked(jti, session=None) is True
+    revocation_list.clear()
+    assert await revocation_list.is_revoked(jti, session=None) is False
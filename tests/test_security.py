@@ -0,0 +1,19 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from jose import jwt
+
+import settings
+from security import create_access_token
+
+
+def test_create_access_token_default_expiry():
+    token = create_access_token({"sub": "mikhail@example.com"})
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    expires_at = datetime.fromtimestamp(payload["exp"], timezone.utc)
+    expected = datetime.now(timezone.utc) + timedelta(
+        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+    )
+    assert abs(expires_at - expected) < timedelta(seconds=5)
+    assert payload["sub"] == "mikhail@example.com"
@@ -0,0 +1,41 @@
+import os
+
+from server import prepare_metrics_dir
+from server import runtime_options
+from server import worker_count
+
+
+def test_worker_count_defaults_to_cpu_count(monkeypatch):
+    monkeypatch.setattr("server.os.cpu_count", lambda: 32)
+    assert worker_count(0) == 32
+    assert worker_count(4) == 4
+
+
+def test_prepare_metrics_dir_removes_previous_run(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    (metrics_dir / "counter_1.db").write_bytes(b"stale")
+
+    prepare_metrics_dir(str(metrics_dir))
+
+    assert list(metrics_dir.iterdir()) == []
+    assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == str(metrics_dir)
+
+
+def test_default_profile_keeps_uvicorn_defaults():
+    assert runtime_options("default") == {}
+
+
+def test_tuned_profile_falls_back_without_uvloop_and_httptools(monkeypatch):
+    monkeypatch.setattr("server._installed", lambda module: False)
+    options = runtime_options("tuned")
+    assert options["loop"] == "asyncio"
+    assert options["http"] == "h11"
+
+
+def test_tuned_profile_uses_uvloop_and_httptools_when_installed(monkeypatch):
+    monkeypatch.setattr("server._installed", lambda module: True)
+    options = runtime_options("tuned")
+    assert options["loop"] == "uvloop"
+    assert options["http"] == "httptools"
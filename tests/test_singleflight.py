@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_call():
+    flight = SingleFlight("test_share")
+    calls = 0
+    release = asyncio.Event()
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    waiting = [asyncio.create_task(flight.do("key", call)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiting) == [1] * 5
+    assert calls == 1
+
+
+async def test_distinct_keys_and_later_calls_are_not_shared():
+    flight = SingleFlight("test_keys")
+    calls = []
+
+    async def call(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        return key
+
+    assert await asyncio.gather(
+        flight.do("a", lambda: call("a")), flight.do("b", lambda: call("b"))
+    ) == ["a", "b"]
+    assert await flight.do("a", lambda: call("a")) == "a"
+    assert calls == ["a", "b", "a"]
+
+
+async def test_error_is_shared_with_waiting_callers():
+    flight = SingleFlight("test_error")
+
+    async def call():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", call), flight.do("key", call), return_exceptions=True
+    )
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+
+async def test_waiting_caller_retries_when_leader_is_cancelled():
+    flight = SingleFlight("test_cancel")
+    started = asyncio.Event()
+
+    async def slow_call():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def fast_call():
+        return "own result"
+
+    leader = asyncio.create_task(flight.do("key", slow_call))
+    await started.wait()
+    follower = asyncio.create_task(flight.do("key", fast_call))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "own result"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_forget_starts_a_new_call():
+    flight = SingleFlight("test_forget")
+    release = asyncio.Event()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    first = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+    flight.forget("key")
+    second = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+    release.set()
+    assert await first == 2
+    assert await second == 2
+    assert calls == 2
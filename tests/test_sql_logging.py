@@ -0,0 +1,31 @@
+from db import sql_logging
+
+
+def test_explain_rate_limit(monkeypatch):
+    monkeypatch.setattr(sql_logging.settings, "SLOW_QUERY_EXPLAINS_PER_MINUTE", 2)
+    monkeypatch.setattr(sql_logging, "_explain_times", sql_logging.deque())
+    assert sql_logging._explain_allowed(100.0)
+    assert sql_logging._explain_allowed(110.0)
+    assert not sql_logging._explain_allowed(120.0)
+    assert sql_logging._explain_allowed(161.0)
+
+
+def test_slow_queries_endpoint_disabled(client):
+    resp = client.get("/service/slow_queries")
+    assert resp.status_code == 404
+
+
+def test_slow_queries_endpoint(client, monkeypatch):
+    monkeypatch.setattr(sql_logging.settings, "DEBUG_ENDPOINTS_ENABLED", True)
+    entry = {
+        "engine": "primary",
+        "statement": "SELECT 1",
+        "duration_ms": 500.0,
+        "at": "2026-10-18T00:00:00+00:00",
+        "plan": "Result  (cost=0.00..0.01 rows=1 width=4)",
+    }
+    monkeypatch.setattr(sql_logging, "slow_queries", sql_logging.deque([entry]))
+    monkeypatch.setattr("api.service.slow_queries", sql_logging.slow_queries)
+    resp = client.get("/service/slow_queries")
+    assert resp.status_code == 200
+    assert resp.json() == {"slow_queries": [entry]}
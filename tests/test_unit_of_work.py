@@ -0,0 +1,45 @@
+import pytest
+
+from db.session import after_commit
+from db.session import unit_of_work
+
+
+class RecordingSession:
+    def __init__(self, fail_commit=False):
+        self.info = {}
+        self.calls = []
+        self.fail_commit = fail_commit
+
+    async def commit(self):
+        self.calls.append("commit")
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+    async def close(self):
+        self.calls.append("close")
+
+
+async def test_commits_once_then_runs_after_commit_callbacks():
+    session = RecordingSession()
+    async with unit_of_work(session):
+        after_commit(session, lambda: session.calls.append("callback"))
+    assert session.calls == ["commit", "close", "callback"]
+    assert "after_commit" not in session.info
+
+
+@pytest.mark.parametrize("fail_commit", [False, True])
+async def test_rolls_back_and_skips_callbacks_on_error(fail_commit):
+    session = RecordingSession(fail_commit=fail_commit)
+    with pytest.raises(RuntimeError):
+        async with unit_of_work(session):
+            after_commit(session, lambda: session.calls.append("callback"))
+            if not fail_commit:
+                raise RuntimeError("handler failed")
+    expected = ["rollback", "close"]
+    if fail_commit:
+        expected.insert(0, "commit")
+    assert session.calls == expected
+    assert "after_commit" not in session.info